@@ -0,0 +1,165 @@
+"""
+Benchmark of the JSON codecs used for GAME API traffic.
+
+Compares, for an agent step of a given size, encoding the request body and decoding
+the action response into an ``ActionResponse``:
+
+- in-process, the previous path (``requests``' ``json=`` encoding and ``response.json()``)
+  against each available codec,
+- end to end, ``GAMEClientV2.get_agent_action`` calls against the stub server with each
+  codec, checking that the server received exactly the payload that was sent.
+
+Usage:
+    python benchmarks/bench_codec.py --log-size 500 --state-size 500
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import requests
+from requests.models import complexjson
+
+from stub_server import GameStubServer, make_agent_state
+
+from game_sdk.game.api_v2 import GAMEClientV2
+from game_sdk.game.codec import JSONCodec, OrjsonCodec, StdlibCodec
+from game_sdk.game.custom_types import ActionResponse
+from game_sdk.game.transport import HTTPTransport
+
+API_KEY = "apt-benchmark"
+
+
+def make_data(state_size: int, log_size: int) -> Dict[str, Any]:
+    """
+    Builds the ``data`` of a get_agent_action request (environment, functions and agent_state)
+    """
+    return {
+        "location": "worker",
+        "map_id": "map-1",
+        "environment": {f"item_{i}": {"value": i, "label": f"item number {i}"} for i in range(state_size)},
+        "functions": [
+            {"fn_name": f"function_{i}", "fn_description": f"Does thing {i}", "args": []}
+            for i in range(30)
+        ],
+        "events": {},
+        "agent_state": make_agent_state(log_size),
+        "current_action": None,
+        "version": "v2",
+    }
+
+
+def make_response(log_size: int) -> bytes:
+    """
+    Builds the body of a get_agent_action response as received on the wire
+    """
+    return complexjson.dumps({
+        "data": {
+            "action_type": "call_function",
+            "agent_state": make_agent_state(log_size),
+            "action_args": {"fn_id": "fn-1", "fn_name": "function_0", "args": {}},
+        }
+    }).encode()
+
+
+def per_call(fn: Callable[[], Any], iterations: int) -> float:
+    """
+    Median seconds per call over 5 rounds of ``iterations`` calls
+    """
+    rounds = []
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            fn()
+        rounds.append((time.perf_counter() - start) / iterations)
+    return statistics.median(rounds)
+
+
+def bench_in_process(codecs: Dict[str, JSONCodec], data: Dict[str, Any], raw: bytes, iterations: int):
+    payload = {"data": data}
+    response = requests.Response()
+    response._content = raw
+    response.status_code = 200
+
+    paths = {
+        # what requests does for json= and response.json()
+        "requests": (
+            lambda: complexjson.dumps(payload, allow_nan=False).encode("utf-8"),
+            lambda: ActionResponse.from_response(response.json()["data"]),
+        ),
+    }
+    for name, codec in codecs.items():
+        paths[name] = (
+            lambda codec=codec: codec.dumps(payload),
+            lambda codec=codec: ActionResponse.from_response(codec.loads(response.content)["data"]),
+        )
+
+    print(f"in-process ({len(paths['requests'][0]()) / 1024:.1f} KiB request, {len(raw) / 1024:.1f} KiB response)")
+    baseline = None
+    for name, (encode, decode) in paths.items():
+        encode_time, decode_time = per_call(encode, iterations), per_call(decode, iterations)
+        total = encode_time + decode_time
+        baseline = baseline or total
+        print(
+            f"  {name:<9} encode {encode_time * 1e6:>8.1f} us   "
+            f"decode {decode_time * 1e6:>8.1f} us   "
+            f"speedup x{baseline / total:.2f}"
+        )
+
+
+def bench_end_to_end(codecs: Dict[str, JSONCodec], data: Dict[str, Any], args) -> bool:
+    print(f"end to end ({args.calls} get_agent_action calls)")
+    with GameStubServer(log_size=args.log_size) as server:
+        transports = {name: HTTPTransport(codec=codec) for name, codec in codecs.items()}
+        clients = {
+            name: GAMEClientV2(API_KEY, transport=transport, base_url=server.base_url)
+            for name, transport in transports.items()
+        }
+        latencies: Dict[str, List[float]] = {name: [] for name in clients}
+        round_trip = {name: True for name in clients}
+        # interleaved, so server and machine noise affect every codec alike
+        for call in range(10 + args.calls):
+            for name, client in clients.items():
+                start = time.perf_counter()
+                ActionResponse.from_response(client.get_agent_action("agent-1", data, "model"))
+                elapsed = time.perf_counter() - start
+                if call >= 10:  # the first calls warm up the connections
+                    latencies[name].append(elapsed)
+                round_trip[name] &= server.last_requests["get_agent_action"] == data
+        for transport in transports.values():
+            transport.close()
+
+    for name in clients:
+        print(
+            f"  {name:<9} p50 {statistics.median(latencies[name]) * 1000:>7.2f} ms   "
+            f"round-trip {'ok' if round_trip[name] else 'MISMATCH'}"
+        )
+    return all(round_trip.values())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JSON codec benchmark")
+    parser.add_argument("--state-size", type=int, default=200, help="Items in the request environment")
+    parser.add_argument("--log-size", type=int, default=200, help="HLP log entries in the agent_state")
+    parser.add_argument("--iterations", type=int, default=200, help="In-process calls per round")
+    parser.add_argument("--calls", type=int, default=100, help="End-to-end calls per codec")
+    args = parser.parse_args()
+
+    codecs: Dict[str, JSONCodec] = {"json": StdlibCodec()}
+    try:
+        codecs["orjson"] = OrjsonCodec()
+    except ImportError:
+        print("orjson is not installed, only the stdlib codec is measured")
+
+    data = make_data(args.state_size, args.log_size)
+    bench_in_process(codecs, data, make_response(args.log_size), args.iterations)
+    if not bench_end_to_end(codecs, data, args):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
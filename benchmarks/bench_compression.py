@@ -0,0 +1,129 @@
+"""
+Round-trip check and benchmark of request body compression.
+
+Sends ``get_agent_action`` calls with a large environment (shaped like an ACP job
+list) through the sync and async clients with each compression setting, verifies the
+stub server decoded exactly the payload that was sent (while answering with compressed
+responses), and reports request bytes on the wire and per-call latency.
+
+Usage:
+    python benchmarks/bench_compression.py --jobs 2000 --calls 50
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from stub_server import GameStubServer
+
+from game_sdk.game import compression
+from game_sdk.game.api_v2 import GAMEClientV2
+from game_sdk.game.transport import HTTPTransport
+
+API_KEY = "apt-benchmark"
+
+
+def make_environment(n_jobs: int) -> Dict[str, Any]:
+    return {
+        "jobs": [
+            {
+                "jobId": i,
+                "phase": "NEGOTIATION" if i % 3 else "TRANSACTION",
+                "providerName": f"provider-{i % 17}",
+                "desc": f"Generate a meme about topic number {i} in the requested style",
+                "price": 0.01 * (i % 100),
+                "memo": [{"id": i * 10 + k, "content": f"memo {k} for job {i}"} for k in range(3)],
+            }
+            for i in range(n_jobs)
+        ],
+    }
+
+
+def make_data(environment: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "location": "worker",
+        "map_id": "map-1",
+        "environment": environment,
+        "functions": [],
+        "events": {},
+        "agent_state": {},
+        "current_action": None,
+        "version": "v2",
+    }
+
+
+def run_sync(server: GameStubServer, encoding: Optional[str], data: Dict[str, Any], calls: int) -> List[float]:
+    transport = HTTPTransport(compression=encoding)
+    client = GAMEClientV2(API_KEY, transport=transport, base_url=server.base_url)
+    latencies = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        client.get_agent_action("agent-1", data, "model")
+        latencies.append(time.perf_counter() - start)
+    transport.close()
+    return latencies
+
+
+def run_async(server: GameStubServer, encoding: Optional[str], data: Dict[str, Any], calls: int) -> List[float]:
+    from game_sdk.game.api_v2_async import AsyncGAMEClientV2
+
+    async def main():
+        latencies = []
+        async with AsyncGAMEClientV2(API_KEY, base_url=server.base_url, compression=encoding) as client:
+            for _ in range(calls):
+                start = time.perf_counter()
+                await client.get_agent_action("agent-1", data, "model")
+                latencies.append(time.perf_counter() - start)
+        return latencies
+
+    return asyncio.run(main())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Request compression round-trip check and benchmark")
+    parser.add_argument("--jobs", type=int, default=2000, help="Jobs in the environment")
+    parser.add_argument("--calls", type=int, default=30, help="Calls per configuration")
+    args = parser.parse_args()
+
+    data = make_data(make_environment(args.jobs))
+    encodings = [None, "gzip"]
+    try:
+        compression.check_encoding("zstd")
+        encodings.append("zstd")
+    except ImportError:
+        pass
+    runners = {"sync": run_sync}
+    try:
+        import httpx  # noqa: F401
+        runners["async"] = run_async
+    except ImportError:
+        pass
+
+    failed = False
+    for client_name, runner in runners.items():
+        for encoding in encodings:
+            with GameStubServer(response_compression_threshold=1024) as server:
+                latencies = runner(server, encoding, data, args.calls)
+                received = server.last_requests["get_agent_action"]
+                wire_bytes = server.received_bytes["get_agent_action"] / args.calls
+
+            ok = received == data
+            failed |= not ok
+            print(
+                f"{client_name:<5} {encoding or 'none':<5} "
+                f"{wire_bytes / 1024:>9.1f} KiB/request   "
+                f"p50 {statistics.median(latencies) * 1000:>7.2f} ms   "
+                f"round-trip {'ok' if ok else 'MISMATCH'}"
+            )
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Import-time benchmark and budget check.
+
+Imports each entry point of the SDK in fresh interpreters, reports the median import
+time, and exits with status 1 if an import takes longer than its budget or loads a
+module it should only load lazily (rich, httpx, asyncio, hosted_game, ...). Meant to
+run in CI next to the step benchmarks.
+
+Usage:
+    python benchmarks/bench_import.py --runs 7
+    python benchmarks/bench_import.py --budget-scale 2  # on a slow machine
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Sequence, Tuple
+
+# module -> (budget in ms, modules it must not load)
+IMPORT_BUDGETS: Dict[str, Tuple[float, Sequence[str]]] = {
+    "game_sdk": (5, ("game_sdk.game", "game_sdk.hosted_game", "requests", "pydantic")),
+    "game_sdk.game": (5, ("game_sdk.game.agent", "requests", "pydantic")),
+    "game_sdk.game.agent": (400, (
+        "rich",
+        "httpx",
+        "asyncio",
+        "http.server",
+        "orjson",
+        "game_sdk.hosted_game",
+        "game_sdk.game.api_v2_async",
+        "game_sdk.game.chat_agent",
+        "game_sdk.game.runtime",
+    )),
+    "game_sdk.game.chat_agent": (400, ("rich", "httpx", "asyncio", "game_sdk.hosted_game")),
+}
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "loaded": [m for m in {forbidden!r} if m in sys.modules]}}))
+"""
+
+
+def measure(module: str, forbidden: Sequence[str], runs: int) -> Tuple[float, List[str]]:
+    """
+    Returns the median import time of ``module`` in seconds and the forbidden modules it loaded
+    """
+    timings = []
+    loaded: List[str] = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(module=module, forbidden=tuple(forbidden))],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        timings.append(result["seconds"])
+        loaded = result["loaded"]
+    return statistics.median(timings), loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time benchmark of the GAME SDK")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per module")
+    parser.add_argument("--budget-scale", type=float, default=1.0, help="Multiplier applied to every budget")
+    parser.add_argument("--only", choices=sorted(IMPORT_BUDGETS), action="append", help="Check only these modules")
+    args = parser.parse_args()
+
+    failures = []
+    for module in args.only or IMPORT_BUDGETS:
+        budget_ms, forbidden = IMPORT_BUDGETS[module]
+        budget_ms *= args.budget_scale
+        seconds, loaded = measure(module, forbidden, args.runs)
+        over_budget = seconds * 1000 > budget_ms
+        print(
+            f"{module:<26} {seconds * 1000:>8.1f} ms   budget {budget_ms:>6.0f} ms"
+            f"{'   OVER BUDGET' if over_budget else ''}"
+            f"{'   loaded ' + ', '.join(loaded) if loaded else ''}"
+        )
+        if over_budget:
+            failures.append(f"{module} took {seconds * 1000:.1f} ms (budget {budget_ms:.0f} ms)")
+        if loaded:
+            failures.append(f"{module} eagerly imported {', '.join(loaded)}")
+
+    if failures:
+        print("\n".join(["", "Import budget exceeded:"] + failures))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
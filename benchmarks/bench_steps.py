@@ -0,0 +1,213 @@
+"""
+Offline step-throughput benchmarks for the GAME SDK.
+
+Drives ``Agent.step``, ``Worker.step`` and ``Chat.next`` against the local stub server
+(see ``stub_server.py``) and reports steps/sec and p50/p99 per-step latency. Since the
+stub answers instantly over loopback, the latency is dominated by SDK overhead:
+payload building, serialization, response validation and console output.
+
+Usage:
+    python benchmarks/bench_steps.py --steps 500 --functions 30
+    python benchmarks/bench_steps.py --json results.json
+    python benchmarks/bench_steps.py --compare results.json --tolerance 0.2
+    python benchmarks/bench_steps.py --only agent_step --phases
+    python benchmarks/bench_steps.py --headless
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from stub_server import GameStubServer
+
+from game_sdk.game.agent import Agent, WorkerConfig
+from game_sdk.game.api_v2 import GAMEClientV2
+from game_sdk.game.chat_agent import ChatAgent
+from game_sdk.game.custom_types import Argument, Function, FunctionResultStatus
+from game_sdk.game.events import EventBus, set_default_event_bus
+from game_sdk.game.tracing import HistogramExporter, get_default_tracer
+from game_sdk.game.transport import HTTPTransport
+from game_sdk.game.worker import Worker
+
+API_KEY = "apt-benchmark"
+
+
+def make_action_space(n_functions: int) -> List[Function]:
+    return [
+        Function(
+            fn_name=f"function_{i}",
+            fn_description=f"Benchmark function number {i} that echoes its arguments back",
+            args=[
+                Argument(name="query", type="string", description="What to look up"),
+                Argument(name="limit", type="integer", description="Maximum number of results", optional=True),
+            ],
+            executable=lambda query, limit=None: (FunctionResultStatus.DONE, f"echo {query}", {"query": query}),
+        )
+        for i in range(n_functions)
+    ]
+
+
+def make_state_fn(state_size: int) -> Callable:
+    state = {
+        "observations": "The environment is stable.",
+        "items": [{"id": i, "name": f"item {i}", "tags": ["a", "b", "c"]} for i in range(state_size)],
+    }
+    return lambda function_result, current_state: state
+
+
+def measure(step: Callable, steps: int, warmup: int) -> Dict[str, float]:
+    """
+    Times ``step`` calls with console output discarded
+    """
+    latencies = []
+    with contextlib.redirect_stdout(io.StringIO()) as sink:
+        for _ in range(warmup):
+            step()
+        for _ in range(steps):
+            start = time.perf_counter()
+            step()
+            latencies.append(time.perf_counter() - start)
+            # keep the discarded output from growing without bound
+            sink.seek(0)
+            sink.truncate()
+
+    latencies.sort()
+    total = sum(latencies)
+    return {
+        "steps_per_sec": steps / total,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000,
+        "mean_ms": total / steps * 1000,
+    }
+
+
+def bench_agent(server: GameStubServer, args) -> Dict[str, float]:
+    client = GAMEClientV2(API_KEY, transport=HTTPTransport(), base_url=server.base_url)
+    worker = WorkerConfig(
+        id="worker",
+        worker_description="Benchmark worker",
+        get_state_fn=make_state_fn(args.state_size),
+        action_space=make_action_space(args.functions),
+    )
+    agent = Agent(
+        api_key=API_KEY,
+        name="Benchmark Agent",
+        agent_goal="Measure SDK overhead",
+        agent_description="An agent used for benchmarking",
+        get_agent_state_fn=make_state_fn(args.state_size),
+        workers=[worker],
+        client=client,
+    )
+    agent.compile()
+    return measure(agent.step, args.steps, args.warmup)
+
+
+def bench_worker(server: GameStubServer, args) -> Dict[str, float]:
+    client = GAMEClientV2(API_KEY, transport=HTTPTransport(), base_url=server.base_url)
+    worker = Worker(
+        api_key=API_KEY,
+        description="Benchmark worker",
+        get_state_fn=make_state_fn(args.state_size),
+        action_space=make_action_space(args.functions),
+        client=client,
+    )
+    worker.set_task("Measure SDK overhead")
+    return measure(worker.step, args.steps, args.warmup)
+
+
+def bench_chat(server: GameStubServer, args) -> Dict[str, float]:
+    client = GAMEClientV2(API_KEY, transport=HTTPTransport(), base_url=server.base_url)
+    chat_agent = ChatAgent(api_key=API_KEY, prompt="You are a benchmark", client=client)
+    state_fn = make_state_fn(args.state_size)
+    chat = chat_agent.create_chat(
+        partner_id="benchmark",
+        partner_name="Benchmark",
+        action_space=make_action_space(args.functions),
+        get_state_fn=lambda: state_fn(None, None),
+    )
+    return measure(lambda: chat.next("hello"), args.steps, args.warmup)
+
+
+BENCHMARKS = {
+    "agent_step": bench_agent,
+    "worker_step": bench_worker,
+    "chat_next": bench_chat,
+}
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline_path: str, tolerance: float) -> List[str]:
+    """
+    Returns the benchmarks whose p50 latency regressed by more than ``tolerance`` against the baseline
+    """
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        before, after = baseline[name]["p50_ms"], result["p50_ms"]
+        if after > before * (1 + tolerance):
+            regressions.append(f"{name}: p50 {before:.3f}ms -> {after:.3f}ms")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline GAME SDK step-throughput benchmarks")
+    parser.add_argument("--steps", type=int, default=300, help="Timed steps per benchmark")
+    parser.add_argument("--warmup", type=int, default=20, help="Untimed warm-up steps per benchmark")
+    parser.add_argument("--functions", type=int, default=30, help="Functions in the action space")
+    parser.add_argument("--state-size", type=int, default=50, help="Items in the scripted environment state")
+    parser.add_argument("--log-size", type=int, default=10, help="HLP log entries in each ActionResponse")
+    parser.add_argument("--only", choices=sorted(BENCHMARKS), action="append", help="Run only these benchmarks")
+    parser.add_argument("--json", dest="json_path", help="Write results to this JSON file")
+    parser.add_argument("--compare", dest="baseline_path", help="Baseline JSON file to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed p50 slowdown vs baseline (0.2 = 20%%)")
+    parser.add_argument("--phases", action="store_true", help="Also report the p50 of each step phase")
+    parser.add_argument("--headless", action="store_true", help="Run without console event output")
+    args = parser.parse_args()
+
+    if args.headless:
+        set_default_event_bus(EventBus())
+
+    histogram = None
+    if args.phases:
+        histogram = HistogramExporter()
+        get_default_tracer().add_exporter(histogram)
+
+    results = {}
+    with GameStubServer(log_size=args.log_size) as server:
+        for name in args.only or BENCHMARKS:
+            results[name] = BENCHMARKS[name](server, args)
+            r = results[name]
+            print(
+                f"{name:<12} {r['steps_per_sec']:>9.1f} steps/s   "
+                f"p50 {r['p50_ms']:>7.3f} ms   p99 {r['p99_ms']:>7.3f} ms"
+            )
+            if histogram is not None:
+                for phase, summary in histogram.summary().items():
+                    print(f"  {phase:<18} p50 {summary['p50'] * 1000:>7.3f} ms   x{summary['count']}")
+                histogram.reset()
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline_path:
+        regressions = compare(results, args.baseline_path, args.tolerance)
+        if regressions:
+            print("Regressions against baseline:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
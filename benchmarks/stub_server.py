@@ -0,0 +1,380 @@
+"""
+Local stand-in for the GAME v2 API.
+
+Implements the agent, map, task, action and conversation routes used by
+``GAMEClientV2``/``AsyncGAMEClientV2`` and answers them with scripted payloads, so SDK
+overhead (serialization, validation, logging) can be measured offline. Request bodies
+sent with ``Content-Encoding: gzip``/``zstd`` are decoded, and responses can be compressed
+with whichever of the two the client accepts, so compression can be verified end to end. Conversation
+turns requested with ``Accept: text/event-stream`` are streamed as server-sent events
+(message deltas, the function call, then the complete response), paced by ``stream_delay``
+to stand in for model generation. Error statuses can be injected per route with ``fail``,
+to exercise retries and circuit breaking.
+
+Usage:
+    ```python
+    with GameStubServer() as server:
+        client = GAMEClientV2("apt-stub", base_url=server.base_url)
+        agent = Agent(api_key="apt-stub", ..., client=client)
+    ```
+
+Run ``python benchmarks/stub_server.py --port 8000`` to serve it standalone.
+"""
+import argparse
+import itertools
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from game_sdk.game.compression import check_encoding, compress, decompress
+from game_sdk.game.sse import EVENT_STREAM, encode_event
+
+
+def make_agent_state(log_size: int = 10, reasoning_size: int = 3) -> Dict[str, Any]:
+    """
+    Builds an agent_state tree shaped like the real API's (HLP with a log, current task, recent reasoning)
+    """
+    return {
+        "hlp": {
+            "plan_id": "plan-1",
+            "observation_reflection": "Nothing unusual observed in the environment.",
+            "plan": ["Inspect the environment", "Use the most relevant function"],
+            "plan_reasoning": "The goal requires acting on the environment.",
+            "current_state_of_execution": "Executing step 2",
+            "change_indicator": None,
+            "log": [
+                {"role": "assistant", "content": f"log entry {i}: executed a function"}
+                for i in range(log_size)
+            ],
+        },
+        "current_task": {
+            "task_id": "task-1",
+            "task": "Use the available functions to progress towards the goal",
+            "task_reasoning": "This is the next step of the plan.",
+            "task_result": None,
+            "location_id": "worker",
+            "llp": {
+                "plan_id": "llp-1",
+                "plan_reasoning": "Call the function that fits the task.",
+                "situation_analysis": "All functions are available.",
+                "plan": ["Call the function"],
+                "change_indicator": None,
+                "reflection": None,
+            },
+        },
+        "recent_reasoning": [
+            {
+                "id": f"reasoning-{i}",
+                "plan_reflection": "The plan is on track.",
+                "plan_reasoning": "Keep executing.",
+                "next_task_reasoning": "Continue with the current task.",
+                "task": "Use the available functions",
+                "worker_id": "worker",
+                "actions": [
+                    {
+                        "id": f"action-{i}",
+                        "task_reflection": "Done.",
+                        "task_reasoning": "Needed.",
+                        "next_step_reasoning": "Continue.",
+                        "fn_name": "noop",
+                    }
+                ],
+            }
+            for i in range(reasoning_size)
+        ],
+    }
+
+
+def call_first_function(request_data: Dict[str, Any], step: int, agent_state: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Default action script: call the first function offered in the request, filling every argument
+    """
+    functions = request_data.get("functions") or []
+    if not functions:
+        return {"action_type": "wait", "agent_state": agent_state}
+
+    fn = functions[0]
+    return {
+        "action_type": "call_function",
+        "agent_state": agent_state,
+        "action_args": {
+            "fn_id": f"fn-{step}",
+            "fn_name": fn["fn_name"],
+            "args": {arg["name"]: {"value": f"value-{step}"} for arg in fn.get("args", [])},
+        },
+    }
+
+
+class StubFailure(Exception):
+    """
+    Error status injected with ``GameStubServer.fail``
+    """
+    def __init__(self, status: int):
+        super().__init__(status)
+        self.status = status
+
+
+ActionScript = Callable[[Dict[str, Any], int, Dict[str, Any]], Dict[str, Any]]
+
+
+class GameStubServer:
+    """
+    Threaded HTTP server answering GAME v2 routes with scripted responses.
+
+    Args:
+        host (str): Interface to bind.
+        port (int): Port to bind (0 picks a free one).
+        action_script (ActionScript): Builds the ActionResponse payload for agent and worker
+            steps from the request data, the step counter and the scripted agent_state.
+        chat_script (Optional[Callable[[Dict[str, Any], int], Dict[str, Any]]]): Builds the
+            GameChatResponse payload for a conversation turn (defaults to a plain reply).
+        log_size (int): Number of HLP log entries in the scripted agent_state.
+        reasoning_size (int): Number of recent_reasoning entries in the scripted agent_state.
+        response_compression_threshold (Optional[int]): Minimum response size in bytes that is
+            compressed for clients sending ``Accept-Encoding: zstd`` (when zstandard is installed)
+            or ``gzip`` (None never compresses).
+        stream_chunk_chars (int): Characters of the message per ``message_delta`` event of a streamed turn.
+        stream_delay (float): Seconds the server waits before each event of a streamed turn.
+
+    Attributes:
+        requests (Dict[str, int]): Number of requests served per route.
+        last_requests (Dict[str, Dict[str, Any]]): Decoded ``data`` of the last request per route.
+        received_bytes (Dict[str, int]): Request body bytes received on the wire per route.
+        request_encodings (Dict[str, int]): Number of requests per ``Content-Encoding``.
+        connections (int): Number of TCP connections accepted.
+        failures (Dict[str, List[int]]): Error statuses answered, in order, to the next requests
+            of a route instead of handling them (see ``fail``).
+    """
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        action_script: ActionScript = call_first_function,
+        chat_script: Optional[Callable[[Dict[str, Any], int], Dict[str, Any]]] = None,
+        log_size: int = 10,
+        reasoning_size: int = 3,
+        response_compression_threshold: Optional[int] = None,
+        stream_chunk_chars: int = 8,
+        stream_delay: float = 0.0,
+    ):
+        self.action_script = action_script
+        self.chat_script = chat_script or (
+            lambda data, turn: {"message": f"reply {turn} to: {data.get('message')}", "is_finished": False}
+        )
+        self.agent_state = make_agent_state(log_size, reasoning_size)
+        self.response_compression_threshold = response_compression_threshold
+        self.stream_chunk_chars = stream_chunk_chars
+        self.stream_delay = stream_delay
+        self.requests: Dict[str, int] = {}
+        self.last_requests: Dict[str, Dict[str, Any]] = {}
+        self.received_bytes: Dict[str, int] = {}
+        self.request_encodings: Dict[str, int] = {}
+        self.connections = 0
+        self.failures: Dict[str, List[int]] = {}
+
+        self._ids = itertools.count(1)
+        self._steps = itertools.count()
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v2"
+
+    def start(self) -> "GameStubServer":
+        # a short poll interval keeps stop() from waiting up to half a second
+        self._thread = threading.Thread(target=self._httpd.serve_forever, args=(0.05,), daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "GameStubServer":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def fail(self, route: str, *statuses: int):
+        """
+        Answers the next requests of ``route`` with ``statuses`` (one each) before handling it again
+        """
+        with self._lock:
+            self.failures.setdefault(route, []).extend(statuses)
+
+    def _next_id(self, prefix: str) -> str:
+        return f"{prefix}-{next(self._ids)}"
+
+    ROUTES = (
+        ("create_agent", r"/v2/agents"),
+        ("create_workers", r"/v2/maps"),
+        ("set_worker_task", r"/v2/agents/([^/]+)/tasks"),
+        ("get_worker_action", r"/v2/agents/([^/]+)/tasks/([^/]+)/next"),
+        ("get_agent_action", r"/v2/agents/([^/]+)/actions"),
+        ("create_chat", r"/v2/conversation"),
+        ("update_chat", r"/v2/conversation/([^/]+)/next"),
+        ("report_function", r"/v2/conversation/([^/]+)/function/result"),
+        ("end_chat", r"/v2/conversation/([^/]+)/end"),
+    )
+
+    def handle(
+        self,
+        path: str,
+        data: Dict[str, Any],
+        wire_bytes: int = 0,
+        encoding: str = "identity",
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Returns the response ``data`` for a route, or None if the route is unknown.
+        Raises ``StubFailure`` for a request answered with an injected error status.
+        """
+        for route, pattern in self.ROUTES:
+            match = re.fullmatch(pattern, path)
+            if match:
+                with self._lock:
+                    self.requests[route] = self.requests.get(route, 0) + 1
+                    self.last_requests[route] = data
+                    self.received_bytes[route] = self.received_bytes.get(route, 0) + wire_bytes
+                    self.request_encodings[encoding] = self.request_encodings.get(encoding, 0) + 1
+                    if self.failures.get(route):
+                        raise StubFailure(self.failures[route].pop(0))
+                return getattr(self, f"_handle_{route}")(data, *match.groups())
+        return None
+
+    def stream_events(self, data: Dict[str, Any]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Splits the response ``data`` of a conversation turn into the events of a streamed turn
+        """
+        message = data.get("message") or ""
+        for start in range(0, len(message), self.stream_chunk_chars):
+            yield "message_delta", {"delta": message[start:start + self.stream_chunk_chars]}
+        if data.get("function_call"):
+            yield "function_call", data["function_call"]
+        yield "done", data
+
+    def _handle_create_agent(self, data):
+        return {"id": self._next_id("agent")}
+
+    def _handle_create_workers(self, data):
+        return {"id": self._next_id("map")}
+
+    def _handle_set_worker_task(self, data, agent_id):
+        return {"submission_id": self._next_id("submission")}
+
+    def _handle_get_worker_action(self, data, agent_id, submission_id):
+        return self.action_script(data, next(self._steps), self.agent_state)
+
+    def _handle_get_agent_action(self, data, agent_id):
+        return self.action_script(data, next(self._steps), self.agent_state)
+
+    def _handle_create_chat(self, data):
+        return {"conversation_id": self._next_id("conversation")}
+
+    def _handle_update_chat(self, data, conversation_id):
+        return self.chat_script(data, next(self._steps))
+
+    def _handle_report_function(self, data, conversation_id):
+        return {"message": f"Function {data.get('fn_id')} reported: {data.get('result')}"}
+
+    def _handle_end_chat(self, data, conversation_id):
+        return {}
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # headers and body go out in separate writes - without this, Nagle's algorithm
+            # plus delayed ACKs add ~40ms to every keep-alive round trip
+            disable_nagle_algorithm = True
+
+            def log_message(self, format, *args):
+                pass
+
+            def setup(self):
+                super().setup()
+                with server._lock:
+                    server.connections += 1
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                encoding = self.headers.get("Content-Encoding", "identity")
+                try:
+                    raw = decompress(body, encoding) if encoding != "identity" else body
+                    payload = json.loads(raw or b"{}")
+                except ValueError:
+                    return self._send(400, {"error": f"invalid {encoding} JSON body"})
+
+                try:
+                    data = server.handle(self.path, payload.get("data") or {}, len(body), encoding)
+                except StubFailure as e:
+                    return self._send(e.status, {"error": f"injected {e.status}"})
+                if data is None:
+                    return self._send(404, {"error": f"unknown route {self.path}"})
+                if EVENT_STREAM in self.headers.get("Accept", ""):
+                    return self._send_events(data)
+                self._send(200, {"data": data})
+
+            def _send_events(self, data: Dict[str, Any]):
+                self.send_response(200)
+                self.send_header("Content-Type", EVENT_STREAM)
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                # one HTTP chunk per event, flushed right away, like a server relaying model output
+                for event, event_data in server.stream_events(data):
+                    time.sleep(server.stream_delay)
+                    encoded = encode_event(event, json.dumps(event_data).encode())
+                    self.wfile.write(b"%x\r\n%s\r\n" % (len(encoded), encoded))
+                    self.wfile.flush()
+                self.wfile.write(b"0\r\n\r\n")
+
+            def _send(self, status: int, body: Dict[str, Any]):
+                encoded = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                threshold = server.response_compression_threshold
+                encoding = self._response_encoding()
+                if threshold is not None and len(encoded) >= threshold and encoding is not None:
+                    encoded = compress(encoded, encoding)
+                    self.send_header("Content-Encoding", encoding)
+                self.send_header("Content-Length", str(len(encoded)))
+                self.end_headers()
+                self.wfile.write(encoded)
+
+            def _response_encoding(self) -> Optional[str]:
+                accepted = self.headers.get("Accept-Encoding", "")
+                for encoding in ("zstd", "gzip"):
+                    if encoding not in accepted:
+                        continue
+                    try:
+                        check_encoding(encoding)
+                    except ImportError:
+                        continue
+                    return encoding
+                return None
+
+        return Handler
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local stand-in for the GAME v2 API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--log-size", type=int, default=10)
+    parser.add_argument("--stream-delay", type=float, default=0.0, help="Seconds between streamed chat events")
+    args = parser.parse_args()
+
+    server = GameStubServer(args.host, args.port, log_size=args.log_size, stream_delay=args.stream_delay)
+    print(f"GAME stub server listening on {server.base_url}")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
@@ -0,0 +1,16 @@
+import importlib
+from typing import Any, List
+
+# subpackages are imported on first access, so `import game_sdk` stays cheap and
+# hosted_game is only loaded by programs that use it
+_SUBMODULES = ("game", "hosted_game")
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + list(_SUBMODULES))
@@ -0,0 +1,43 @@
+import importlib
+from typing import Any, Dict, List
+
+# public name -> module defining it; modules are imported on first attribute access
+# (e.g. `from game_sdk.game import Agent` loads the agent, but not the chat or runtime modules)
+_LAZY_ATTRIBUTES: Dict[str, str] = {
+    "Agent": "agent",
+    "WorkerConfig": "agent",
+    "Worker": "worker",
+    "WorkerTaskQueue": "task_queue",
+    "ChatAgent": "chat_agent",
+    "Chat": "chat_agent",
+    "ChatMultiplexer": "chat_multiplexer",
+    "Argument": "custom_types",
+    "Function": "custom_types",
+    "FunctionResult": "custom_types",
+    "FunctionResultStatus": "custom_types",
+    "ActionResponse": "custom_types",
+    "ActionType": "custom_types",
+    "AgentRuntime": "runtime",
+    "HTTPTransport": "transport",
+    "ResiliencePolicy": "resilience",
+    "EventBus": "events",
+    "Tracer": "tracing",
+    "Checkpointer": "checkpoint",
+    "StateProvider": "state",
+    "ResultCache": "result_cache",
+}
+
+__all__ = sorted(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + __all__)
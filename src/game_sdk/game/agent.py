@@ -1,12 +1,24 @@
-from typing import List, Optional, Callable, Dict
+from typing import TYPE_CHECKING, Any, ContextManager, Hashable, List, Optional, Callable, Dict, Union
+from concurrent.futures import ThreadPoolExecutor
+import contextlib
+import threading
+from collections import OrderedDict
 import uuid
 from game_sdk.game.worker import Worker
 from game_sdk.game.custom_types import Function, FunctionResult, FunctionResultStatus, ActionResponse, ActionType
 from game_sdk.game.api import GAMEClient
 from game_sdk.game.api_v2 import GAMEClientV2
-
-from rich import print, box
-from rich.panel import Panel
+from game_sdk.game.async_clients import AsyncClientProvider
+from game_sdk.game.checkpoint import Checkpointer, dump_function_result, load_function_result
+from game_sdk.game.events import EventBus, get_default_event_bus
+from game_sdk.game.payload import ActionSpace, FunctionCatalog
+from game_sdk.game.registry import RegistrationCache
+from game_sdk.game.scheduler import StepScheduler
+from game_sdk.game.state import with_instructions
+from game_sdk.game.tracing import Tracer, get_default_tracer
+
+if TYPE_CHECKING:
+    from game_sdk.game.api_v2_async import AsyncGAMEClientV2
 
 class Session:
     """
@@ -43,7 +55,8 @@ class WorkerConfig:
     Args:
         id (str): Unique identifier for the worker.
         worker_description (str): Description of the worker's capabilities for task generation.
-        get_state_fn (Callable): Function to retrieve the worker's current state.
+        get_state_fn (Callable): Function to retrieve the worker's current state (wrap it in a
+            ``StateProvider`` to only recompute it when relevant functions ran).
         action_space (List[Function]): List of functions the worker can execute.
         instruction (Optional[str]): Additional instructions for the worker.
 
@@ -69,15 +82,11 @@ class WorkerConfig:
         self.get_state_fn = get_state_fn
 
         # setup get state function with the instructions
-        self.get_state_fn = lambda function_result, current_state: {
-            "instructions": self.instruction,  # instructions are set up in the state
-            # places the rest of the output of the get_state_fn in the state
-            **get_state_fn(function_result, current_state),
-        }
+        self.get_state_fn = with_instructions(get_state_fn, lambda: self.instruction)
 
-        self.action_space: Dict[str, Function] = {
-            f.get_function_def()["fn_name"]: f for f in action_space
-        }
+        self.action_space: Dict[str, Function] = ActionSpace(
+            (f.get_function_def()["fn_name"], f) for f in action_space
+        )
 
     def __str__(self) -> str:
         output = (
@@ -102,7 +111,25 @@ class Agent:
         name (str): Name of the agent.
         agent_goal (str): High-level goal or purpose of the agent.
         agent_description (str): Detailed description of the agent's capabilities.
-        get_agent_state_fn (Callable): Function to retrieve agent's current state.
+        get_agent_state_fn (Callable): Function to retrieve agent's current state (may be a
+            ``StateProvider`` to skip recomputing unchanged state).
+        workers (Optional[List[WorkerConfig]]): Workers available to the agent.
+        model_name (str): Name of the model used by GAME to select actions.
+        client (Optional[Union[GAMEClient, GAMEClientV2]]): Preconfigured API client to use
+            instead of one created from the API key (e.g. with a custom transport or base URL).
+        registry (Optional[RegistrationCache]): On-disk registry used to reuse the remote
+            agent and map ids of unchanged agents across restarts.
+        tracer (Optional[Tracer]): Records the duration of each step phase (defaults to the
+            process-wide tracer, which records nothing until an exporter is attached).
+        events (Optional[EventBus]): Receives the step events (defaults to the process-wide
+            bus, which prints them to the console). Pass ``EventBus()`` to run headless.
+        checkpointer (Optional[Checkpointer]): Saves the session, states and remote ids every
+            few steps, and resumes from them when an agent with the same definition is created
+            (and compiled) again.
+        worker_pool_size (int): Number of standalone workers ``get_worker`` keeps and hands out
+            again (0, the default, creates a new worker on every call).
+        async_client (Optional[AsyncGAMEClientV2]): Client used by ``astep``/``arun`` (defaults to
+            one per event loop, with the settings of ``client``).
 
     The Agent class serves as the primary interface for:
     - Managing worker configurations
@@ -118,9 +145,18 @@ class Agent:
                  get_agent_state_fn: Callable,
                  workers: Optional[List[WorkerConfig]] = None,
                  model_name: str = "Llama-3.3-70B-Instruct",
+                 client: Optional[Union[GAMEClient, GAMEClientV2]] = None,
+                 registry: Optional[RegistrationCache] = None,
+                 tracer: Optional[Tracer] = None,
+                 events: Optional[EventBus] = None,
+                 checkpointer: Optional[Checkpointer] = None,
+                 worker_pool_size: int = 0,
+                 async_client: Optional["AsyncGAMEClientV2"] = None,
                  ):
 
-        if api_key.startswith("apt-"):
+        if client is not None:
+            self.client = client
+        elif api_key.startswith("apt-"):
             self.client = GAMEClientV2(api_key)
         else:
             self.client = GAMEClient(api_key)
@@ -156,11 +192,54 @@ class Agent:
         # initialize observation
         self.observation = None
 
-        # create agent
-        self.agent_id = self.client.create_agent(
-            self.name, self.agent_description, self.agent_goal
+        # async clients (one per event loop) are created on first use of astep/arun
+        self._async_clients = (
+            AsyncClientProvider(self.client, async_client) if isinstance(self.client, GAMEClientV2) else None
         )
 
+        # serialized function definitions per worker, reused across steps
+        self._function_catalog = FunctionCatalog()
+
+        # standalone workers handed out by get_worker (least recently used first), and the
+        # remote agent ids they registered, which outlive evicted workers
+        self.worker_pool_size = worker_pool_size
+        self._worker_pool: "OrderedDict[Hashable, Worker]" = OrderedDict()
+        self._worker_agent_ids: Dict[str, str] = {}
+        self._worker_pool_lock = threading.Lock()
+
+        # slots held around API calls and function execution in step() - an AgentRuntime
+        # replaces them with semaphores shared by all of its agents
+        self._api_slot: ContextManager = contextlib.nullcontext()
+        self._function_slot: ContextManager = contextlib.nullcontext()
+
+        self._tracer = tracer or get_default_tracer()
+        self._events = events or get_default_event_bus()
+
+        # resume from a checkpoint of this same agent definition (restored in compile)
+        self._checkpointer = checkpointer
+        self._checkpoint: Optional[Dict] = None
+        self._resumed = False
+        if self._checkpointer is not None:
+            self._agent_key = RegistrationCache.agent_key(
+                self.client, self.name, self.agent_description, self.agent_goal
+            )
+            checkpoint = self._checkpointer.load()
+            if checkpoint is not None and checkpoint.get("agent_key") == self._agent_key:
+                self._checkpoint = checkpoint
+
+        # create agent (or reuse its registration from a previous run)
+        self._registry = registry
+        if self._checkpoint is not None:
+            self.agent_id = self._checkpoint["agent_id"]
+        elif self._registry is not None:
+            self.agent_id = self._registry.get_or_create_agent(
+                self.client, self.name, self.agent_description, self.agent_goal
+            )
+        else:
+            self.agent_id = self.client.create_agent(
+                self.name, self.agent_description, self.agent_goal
+            )
+
     def compile(self):
         """ Compile the workers for the agent - i.e. set up task generator"""
         if not self.workers:
@@ -168,7 +247,18 @@ class Agent:
 
         workers_list = list(self.workers.values())
 
-        self._map_id = self.client.create_workers(workers_list)
+        checkpoint, self._checkpoint = self._checkpoint, None
+        if self._checkpointer is not None:
+            self._map_key = RegistrationCache.map_key(self.client, workers_list)
+            if checkpoint is not None and checkpoint.get("map_key") != self._map_key:
+                checkpoint = None
+
+        if checkpoint is not None:
+            self._map_id = checkpoint["map_id"]
+        elif self._registry is not None:
+            self._map_id = self._registry.get_or_create_map(self.client, workers_list)
+        else:
+            self._map_id = self.client.create_workers(workers_list)
         self.current_worker_id = next(iter(self.workers.values())).id
 
         # initialize and set up worker states
@@ -185,8 +275,39 @@ class Agent:
 
         self.worker_states = worker_states
 
+        if checkpoint is not None:
+            self._restore_checkpoint(checkpoint)
+
         return self._map_id
 
+    def _get_checkpoint_state(self) -> Dict:
+        return {
+            "agent_key": self._agent_key,
+            "agent_id": self.agent_id,
+            "map_key": self._map_key,
+            "map_id": self._map_id,
+            "session_id": self._session.id,
+            "function_result": dump_function_result(self._session.function_result),
+            "worker_states": self.worker_states,
+            "agent_state": self.agent_state,
+            "current_worker_id": self.current_worker_id,
+            "observation": self.observation,
+        }
+
+    def _restore_checkpoint(self, checkpoint: Dict):
+        self._session.id = checkpoint["session_id"]
+        self._session.function_result = load_function_result(checkpoint["function_result"])
+        # workers added since the checkpoint keep their fresh state
+        self.worker_states.update(
+            {k: v for k, v in checkpoint["worker_states"].items() if k in self.workers}
+        )
+        self.agent_state = checkpoint["agent_state"]
+        if checkpoint["current_worker_id"] in self.workers:
+            self.current_worker_id = checkpoint["current_worker_id"]
+        self.observation = checkpoint["observation"]
+        # run() keeps the restored session instead of starting a new one
+        self._resumed = True
+
     def reset(self):
         """ Reset the agent session"""
         self._session.reset()
@@ -200,22 +321,66 @@ class Agent:
         """Get worker config from worker dict"""
         return self.workers[worker_id]
 
-    def get_worker(self, worker_id: str):
-        """Initialize a working interactable standalone worker"""
+    def get_worker(self, worker_id: str, reuse: bool = True) -> Worker:
+        """
+        Returns an interactable standalone worker for ``worker_id``.
+
+        Every call returns a new worker, reusing the remote registration of the previous ones.
+        With a ``worker_pool_size`` above 0, workers are kept in a pool (least recently used
+        evicted first) and the same instance is returned while its config is unchanged, so
+        repeated calls do not re-evaluate its ``get_state_fn`` either. A pooled worker is
+        shared by every caller: use ``reuse=False`` for a private one, or a ``WorkerTaskQueue``
+        to run several tasks at once.
+        """
         worker_config = self.get_worker_config(worker_id)
-        return Worker(
+        # a replaced config, new instructions or a new description need a new worker; the key
+        # holds the config itself, so its identity cannot be reused by another config object
+        key = (worker_id, worker_config, worker_config.instruction, self.agent_description)
+        if reuse and self.worker_pool_size > 0:
+            with self._worker_pool_lock:
+                worker = self._worker_pool.get(key)
+                if worker is not None:
+                    self._worker_pool.move_to_end(key)
+                    return worker
+
+        worker = Worker(
             api_key=self._api_key,
             # THIS DESCRIPTION IS THE AGENT DESCRIPTION/CHARACTER CARD - WORKER DESCRIPTION IS ONLY USED FOR THE TASK GENERATOR
             description=self.agent_description,
             instruction=worker_config.instruction,
             get_state_fn=worker_config.get_state_fn,
             action_space=worker_config.action_space,
+            client=self.client,
+            registry=self._registry,
+            tracer=self._tracer,
+            events=self._events,
+            agent_id=self._worker_agent_ids.get(self.agent_description),
         )
 
-    def _get_action(
+        with self._worker_pool_lock:
+            self._worker_agent_ids[self.agent_description] = worker._agent_id
+            if reuse and self.worker_pool_size > 0:
+                # another thread may have created the same worker meanwhile - keep the first one
+                worker = self._worker_pool.setdefault(key, worker)
+                self._worker_pool.move_to_end(key)
+                while len(self._worker_pool) > self.worker_pool_size:
+                    self._worker_pool.popitem(last=False)
+        return worker
+
+    def evict_worker(self, worker_id: Optional[str] = None):
+        """
+        Drops the pooled workers of ``worker_id`` (or all of them), so the next ``get_worker``
+        creates a new one; their remote registration is still reused
+        """
+        with self._worker_pool_lock:
+            for key in list(self._worker_pool):
+                if worker_id is None or key[0] == worker_id:
+                    del self._worker_pool[key]
+
+    def _build_action_payload(
         self,
         function_result: Optional[FunctionResult] = None
-    ) -> ActionResponse:
+    ) -> Dict:
 
         # dummy function result if None is provided - for get_state_fn to take the same input all the time
         if function_result is None:
@@ -231,10 +396,10 @@ class Agent:
             "location": self.current_worker_id,
             "map_id": self._map_id,
             "environment": self.worker_states[self.current_worker_id],
-            "functions": [
-                f.get_function_def()
-                for f in self.workers[self.current_worker_id].action_space.values()
-            ],
+            "functions": self._function_catalog.get(
+                self.current_worker_id,
+                self.workers[self.current_worker_id].action_space,
+            ),
             "events": {},
             "agent_state": self.agent_state,
             "current_action": (
@@ -245,63 +410,116 @@ class Agent:
             "version": "v2",
         }
 
+        return data
+
+    def _get_action(
+        self,
+        function_result: Optional[FunctionResult] = None
+    ) -> ActionResponse:
+
+        with self._tracer.span("build_payload", agent_id=self.agent_id, worker_id=self.current_worker_id):
+            data = self._build_action_payload(function_result)
+
         # make API call
-        response = self.client.get_agent_action(
-            agent_id=self.agent_id,
-            data=data,
-            model_name=self._model_name
-        )
-        
-        # print(f"123 Response: {response}")
+        with self._tracer.span("get_action", agent_id=self.agent_id, worker_id=self.current_worker_id):
+            with self._api_slot:
+                response = self.client.get_agent_action(
+                    agent_id=self.agent_id,
+                    data=data,
+                    model_name=self._model_name
+                )
 
-        return ActionResponse.model_validate(response)
+        return self._validate_action(response)
 
-    def step(self):
-        # get next task/action from GAME API
-        action_response = self._get_action(self._session.function_result)
+    async def _aget_action(
+        self,
+        function_result: Optional[FunctionResult] = None
+    ) -> ActionResponse:
+
+        # v1 keys have no async client - run the blocking call in the default executor
+        if not isinstance(self.client, GAMEClientV2):
+            import asyncio
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self._get_action, function_result)
+
+        with self._tracer.span("build_payload", agent_id=self.agent_id, worker_id=self.current_worker_id):
+            data = self._build_action_payload(function_result)
+
+        with self._tracer.span("get_action", agent_id=self.agent_id, worker_id=self.current_worker_id):
+            response = await self._async_clients.get().get_agent_action(
+                agent_id=self.agent_id,
+                data=data,
+                model_name=self._model_name
+            )
+
+        return self._validate_action(response)
+
+    def _validate_action(self, response: Dict) -> ActionResponse:
+        with self._tracer.span("validate_response", agent_id=self.agent_id):
+            # agent_state is only validated if something reads it (e.g. an event sink)
+            return ActionResponse.from_response(response)
+
+    def _start_step(self, action_response: ActionResponse) -> Optional[Function]:
+        """
+        Reports the action received from GAME and returns the function to execute (if any)
+        """
         action_type = action_response.action_type
-        print(Panel(f"{action_response}", title="👟 Agent Step", box=box.ROUNDED, title_align="left"))
+        with self._tracer.span("render", agent_id=self.agent_id):
+            self._events.emit("agent_step", self.agent_id, action_response=action_response)
 
-        # if new task is updated/generated
-        if (
-            action_response.agent_state.hlp
-            and action_response.agent_state.hlp.change_indicator
-        ):
-            print(Panel(f"{action_response.agent_state.current_task}", title="New Task Generated", box=box.ROUNDED, title_align="left"))
+            # if new task is updated/generated
+            if (
+                self._events.enabled
+                and action_response.agent_state.hlp
+                and action_response.agent_state.hlp.change_indicator
+            ):
+                self._events.emit("task_generated", self.agent_id, current_task=action_response.agent_state.current_task)
 
-        # execute action
-        out = ""
         if action_type in [
             ActionType.CALL_FUNCTION,
             ActionType.CONTINUE_FUNCTION,
         ]:
-            
-
             if not action_response.action_args:
                 raise ValueError("No function information provided by GAME")
-            
+
             # Get the worker and function
             worker = self.workers[self.current_worker_id]
-            function_name = action_response.action_args["fn_name"]
-            function = worker.action_space[function_name]
-            out += (f"👷 Worker: {worker.id}\n")
-            out += (f"🔧 Function Name: {function_name}\n")
-            out += (f"📋 Function Description: {function.fn_description}\n")
-            out += (f"🔠 Function Arguments: {action_response.action_args.get('args', {})}\n")
+            return worker.action_space[action_response.action_args["fn_name"]]
+
+        return None
+
+    def _finish_step(
+        self,
+        action_response: ActionResponse,
+        function_result: Optional[FunctionResult] = None,
+    ):
+        """
+        Applies the outcome of an action to the worker/agent states and observations
+        """
+        action_type = action_response.action_type
+
+        # the event is only rendered if a sink is attached
+        event_data = {"action_response": action_response}
+        if action_type in [
+            ActionType.CALL_FUNCTION,
+            ActionType.CONTINUE_FUNCTION,
+        ]:
+            worker = self.workers[self.current_worker_id]
+            event_data["worker_id"] = worker.id
+            event_data["function"] = worker.action_space[action_response.action_args["fn_name"]]
+            event_data["function_result"] = function_result
 
-            self._session.function_result = function.execute(**action_response.action_args)
-            out += (f"🏭 Function Results:\n{self._session.function_result}\n")
+            self._session.function_result = function_result
 
             # update worker states
-            updated_worker_state = self.workers[self.current_worker_id].get_state_fn(
-                self._session.function_result, self.worker_states[self.current_worker_id])
+            with self._tracer.span("worker_state", agent_id=self.agent_id, worker_id=self.current_worker_id):
+                updated_worker_state = self.workers[self.current_worker_id].get_state_fn(
+                    self._session.function_result, self.worker_states[self.current_worker_id])
             self.worker_states[self.current_worker_id] = updated_worker_state
 
             update_observation = "worker"
 
         elif action_response.action_type == ActionType.WAIT:
-            out += ("🔄 Waiting...")
-            out += ("Task ended completed or ended (not possible with current actions)")
             update_observation = "task"
 
         elif action_response.action_type == ActionType.GO_TO:
@@ -309,21 +527,20 @@ class Agent:
                 raise ValueError("No location information provided by GAME")
 
             next_worker = action_response.action_args["location_id"]
-            out += (f"🚶 Going to... {next_worker}")
-            # print_output += (f"Next worker selected: {next_worker}")
             self.current_worker_id = next_worker
             
             update_observation = "worker"
         else:
-            out += (f"🚫 Unknown action type: {action_response.action_type}")
             raise ValueError(
                 f"Unknown action type: {action_response.action_type}")
         
-        print(Panel(f"{out}", title=f"Action Type: {action_type.value}", box=box.ROUNDED, title_align="left"))
+        with self._tracer.span("render", agent_id=self.agent_id):
+            self._events.emit("agent_action", self.agent_id, **event_data)
         
 
         # update agent state
-        self.agent_state = self.get_agent_state_fn(self._session.function_result, self.agent_state)
+        with self._tracer.span("agent_state", agent_id=self.agent_id):
+            self.agent_state = self.get_agent_state_fn(self._session.function_result, self.agent_state)
         
         # update observation (saved state) - no interruptions (is_global should always be False)
         if update_observation == "task":
@@ -350,7 +567,120 @@ class Agent:
 
         return action_response, self._session.function_result
 
-    def run(self):
-        self._session = Session()
+    def step(self):
+        # events.emit() calls (e.g. in Function.execute) go to this agent's bus
+        with self._events.activate(), self._tracer.span("step", agent_id=self.agent_id) as span:
+            # get next task/action from GAME API
+            action_response = self._get_action(self._session.function_result)
+            span.set_attribute("action_type", action_response.action_type.value)
+
+            # execute action
+            function = self._start_step(action_response)
+            function_result = None
+            if function is not None:
+                with self._tracer.span(
+                    "execute_function",
+                    agent_id=self.agent_id,
+                    worker_id=self.current_worker_id,
+                    fn_name=function.fn_name,
+                ):
+                    with self._function_slot:
+                        function_result = function.execute(**action_response.action_args)
+
+            result = self._finish_step(action_response, function_result)
+            if self._checkpointer is not None:
+                self._checkpointer.step_completed(self)
+            return result
+
+    async def astep(self):
+        """
+        asyncio counterpart of ``step`` - the function runs via ``Function.aexecute``
+        """
+        with self._events.activate(), self._tracer.span("step", agent_id=self.agent_id) as span:
+            # get next task/action from GAME API
+            action_response = await self._aget_action(self._session.function_result)
+            span.set_attribute("action_type", action_response.action_type.value)
+
+            # execute action
+            function = self._start_step(action_response)
+            function_result = None
+            if function is not None:
+                with self._tracer.span(
+                    "execute_function",
+                    agent_id=self.agent_id,
+                    worker_id=self.current_worker_id,
+                    fn_name=function.fn_name,
+                ):
+                    function_result = await function.aexecute(**action_response.action_args)
+
+            result = self._finish_step(action_response, function_result)
+            if self._checkpointer is not None:
+                self._checkpointer.step_completed(self)
+            return result
+
+    def run(self, scheduler: Optional[StepScheduler] = None):
+        """
+        Runs the agent forever.
+
+        Args:
+            scheduler (Optional[StepScheduler]): Paces the steps (e.g. a heartbeat, or backing
+                off while the agent keeps returning WAIT). Without one, steps run back to back.
+        """
+        # keep a session restored from a checkpoint, start a fresh one otherwise
+        if not self._resumed:
+            self._session = Session()
+        self._resumed = False
         while True:
-            self.step()
+            action_response, _ = self.step()
+            if scheduler is not None:
+                scheduler.wait(action_response)
+
+    async def arun(self, scheduler: Optional[StepScheduler] = None):
+        """
+        asyncio counterpart of ``run``
+        """
+        if not self._resumed:
+            self._session = Session()
+        self._resumed = False
+        while True:
+            action_response, _ = await self.astep()
+            if scheduler is not None:
+                await scheduler.async_wait(action_response)
+
+    async def aclose(self):
+        """
+        Closes the async client ``astep`` created for the running event loop
+        """
+        if self._async_clients is not None:
+            await self._async_clients.aclose()
+
+
+def create_agents(
+    agent_kwargs: List[Dict[str, Any]],
+    compile: bool = True,
+    max_workers: int = 16,
+) -> List[Agent]:
+    """
+    Creates (and optionally compiles) many agents in parallel.
+
+    Registration calls are I/O bound, so cold-starting a fleet this way takes roughly
+    as long as its slowest agent instead of the sum of all of them. Combine with a
+    shared ``registry`` in the kwargs to skip the calls for unchanged agents entirely.
+
+    Args:
+        agent_kwargs (List[Dict[str, Any]]): Keyword arguments for each ``Agent``.
+        compile (bool): Whether to also compile each agent's workers.
+        max_workers (int): Maximum number of agents registered concurrently.
+
+    Returns:
+        List[Agent]: The agents, in the order of ``agent_kwargs``.
+    """
+    def build(kwargs: Dict[str, Any]) -> Agent:
+        agent = Agent(**kwargs)
+        if compile:
+            agent.compile()
+        return agent
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(build, agent_kwargs))
+
@@ -1,18 +1,127 @@
-import requests
-from typing import List, Dict, Optional
+import base64
+import json
+import threading
+import time
+from typing import Callable, List, Dict, Optional
+from game_sdk.game.transport import HTTPTransport, get_default_transport
+
+
+class AccessTokenManager:
+    """
+    Caches the v1 bearer token and refreshes it before it lapses.
+
+    The expiry is read from the token's JWT ``exp`` claim when present, otherwise
+    ``default_ttl`` is assumed. Once a token enters its refresh window it keeps being
+    served while a single background refresh fetches the next one; a token that has
+    already expired is refreshed synchronously, with concurrent callers waiting on
+    the same fetch instead of issuing their own.
+
+    Args:
+        fetch_token (Callable[[], str]): Function that requests a fresh access token.
+        default_ttl (float): Lifetime in seconds assumed for tokens without an ``exp`` claim.
+        refresh_margin (float): Seconds before expiry at which a background refresh starts.
+    """
+    def __init__(
+        self,
+        fetch_token: Callable[[], str],
+        default_ttl: float = 300.0,
+        refresh_margin: float = 60.0,
+    ):
+        self._fetch_token = fetch_token
+        self.default_ttl = default_ttl
+        self.refresh_margin = refresh_margin
+
+        self._token: Optional[str] = None
+        self._expires_at: float = 0.0
+        self._state_lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._background_refresh: Optional[threading.Thread] = None
+
+    def get_token(self) -> str:
+        """
+        Returns a valid access token, fetching or refreshing it as needed.
+        """
+        with self._state_lock:
+            token, expires_at = self._token, self._expires_at
+            now = time.monotonic()
+            if token and now < expires_at:
+                if now >= expires_at - self.refresh_margin and self._background_refresh is None:
+                    self._background_refresh = threading.Thread(
+                        target=self._refresh_in_background, daemon=True
+                    )
+                    self._background_refresh.start()
+                return token
+
+        return self._refresh(stale_token=token)
+
+    def invalidate(self, token: Optional[str] = None):
+        """
+        Drops the cached token (only if it is still ``token``, when one is given),
+        e.g. after the API rejected it with a 401.
+        """
+        with self._state_lock:
+            if token is None or token == self._token:
+                self._token = None
+                self._expires_at = 0.0
+
+    def _refresh(self, stale_token: Optional[str]) -> str:
+        with self._refresh_lock:
+            # another caller may have refreshed while we waited for the lock
+            with self._state_lock:
+                if self._token and self._token != stale_token and time.monotonic() < self._expires_at:
+                    return self._token
+
+            token = self._fetch_token()
+            expires_at = time.monotonic() + self._get_ttl(token)
+
+            with self._state_lock:
+                self._token = token
+                self._expires_at = expires_at
+            return token
+
+    def _refresh_in_background(self):
+        try:
+            with self._state_lock:
+                stale_token = self._token
+            self._refresh(stale_token)
+        except Exception:
+            # the next get_token call retries synchronously once the token lapses
+            pass
+        finally:
+            with self._state_lock:
+                self._background_refresh = None
+
+    def _get_ttl(self, token: str) -> float:
+        try:
+            payload = token.split(".")[1]
+            payload += "=" * (-len(payload) % 4)
+            exp = json.loads(base64.urlsafe_b64decode(payload))["exp"]
+            return max(float(exp) - time.time(), 0.0)
+        except Exception:
+            return self.default_ttl
 
 
 class GAMEClient:
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, transport: Optional[HTTPTransport] = None):
         self.api_key = api_key
         self.base_url = "https://game.virtuals.io"
-        
+        self._transport = transport or get_default_transport()
+        self._token_manager = AccessTokenManager(self._fetch_access_token)
+
     def _get_access_token(self) -> str:
         """
-        Internal method to get access token
+        Internal method to get access token (cached until shortly before it expires)
+        """
+        return self._token_manager.get_token()
+
+    def _fetch_access_token(self) -> str:
+        """
+        Internal method to request a new access token
         """
-        response = requests.post(
+        response = self._transport.post(
             "https://api.virtuals.io/api/accesses/tokens",
+            operation="get_access_token",
+            idempotent=True,
             json={"data": {}},
             headers={"x-api-key": self.api_key},
         )
@@ -20,43 +129,58 @@ class GAMEClient:
         if response.status_code != 200:
             raise ValueError(f"Failed to get token (status {response.status_code}). Response: {response.text}")
 
-        response_json = response.json()
+        response_json = self._transport.decode_json(response)
         return response_json["data"]["accessToken"]
 
     def _post(
-        self, endpoint: str, data: dict, extra_headers: Optional[Dict[str, str]] = None
+        self,
+        endpoint: str,
+        data: dict,
+        extra_headers: Optional[Dict[str, str]] = None,
+        operation: Optional[str] = None,
+        idempotent: bool = False,
     ) -> dict:
         """
         Internal method to post data
         """
-        access_token = self._get_access_token()
-
-        # Default headers with Authorization
-        headers = {"Authorization": f"Bearer {access_token}"}
-
-        # Merge additional headers if provided
-        if extra_headers:
-            headers.update(extra_headers)
-
-        response = requests.post(
-            f"{self.base_url}/prompts",
-            json={
-                "data": {
-                    "method": "post",
-                    "headers": {
-                        "Content-Type": "application/json",
-                    },
-                    "route": endpoint,
-                    "data": data,
+        payload = {
+            "data": {
+                "method": "post",
+                "headers": {
+                    "Content-Type": "application/json",
                 },
+                "route": endpoint,
+                "data": data,
             },
-            headers=headers,
-        )
+        }
+
+        # retry once with a fresh token if the cached one was rejected
+        for attempt in range(2):
+            access_token = self._get_access_token()
+
+            # Default headers with Authorization
+            headers = {"Authorization": f"Bearer {access_token}"}
+
+            # Merge additional headers if provided
+            if extra_headers:
+                headers.update(extra_headers)
+
+            response = self._transport.post(
+                f"{self.base_url}/prompts",
+                operation=operation,
+                idempotent=idempotent,
+                json=payload,
+                headers=headers,
+            )
+
+            if response.status_code != 401 or attempt == 1:
+                break
+            self._token_manager.invalidate(access_token)
 
         if response.status_code != 200:
             raise ValueError(f"Failed to post data (status {response.status_code}). Response: {response.text}")
 
-        response_json = response.json()
+        response_json = self._transport.decode_json(response)
         return response_json["data"]
 
     def create_agent(self, name: str, description: str, goal: str) -> str:
@@ -69,7 +193,8 @@ class GAMEClient:
                 "name": name,
                 "description": description,
                 "goal": goal,
-            }
+            },
+            operation="create_agent",
         )
 
         return create_agent_response["id"]
@@ -86,6 +211,7 @@ class GAMEClient:
                     for w in workers
                 ]
             },
+            operation="create_workers",
         )
 
         return res["id"]
@@ -97,6 +223,7 @@ class GAMEClient:
         return self._post(
             endpoint=f"/v2/agents/{agent_id}/tasks",
             data={"task": task},
+            operation="set_worker_task",
         )
 
     def get_worker_action(
@@ -113,6 +240,7 @@ class GAMEClient:
             endpoint=f"/v2/agents/{agent_id}/tasks/{submission_id}/next",
             data=data,
             extra_headers={"model_name": model_name},
+            operation="get_worker_action",
         )
 
     def get_agent_action(self, agent_id: str, data: dict, model_name: str) -> Dict:
@@ -123,4 +251,5 @@ class GAMEClient:
             endpoint=f"/v2/agents/{agent_id}/actions",
             data=data,
             extra_headers={"model_name": model_name},
+            operation="get_agent_action",
         )
\ No newline at end of file
@@ -1,10 +1,19 @@
 import requests
-from typing import List, Dict
+from typing import Any, Iterator, List, Dict, Optional, Tuple
+from game_sdk.game.codec import get_default_codec
+from game_sdk.game.sse import EVENT_STREAM, SSEDecoder
+from game_sdk.game.transport import HTTPTransport, get_default_transport
 
 class GAMEClientV2:
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        transport: Optional[HTTPTransport] = None,
+        base_url: Optional[str] = None,
+    ):
         self.api_key = api_key
-        self.base_url = "https://sdk.game.virtuals.io/v2"
+        self._transport = transport or get_default_transport()
+        self.base_url = base_url or "https://sdk.game.virtuals.io/v2"
         self.headers = {
             "Content-Type": "application/json",
             "x-api-key": self.api_key
@@ -22,8 +31,9 @@ class GAMEClientV2:
             }
         }
 
-        response = requests.post(
+        response = self._transport.post(
             f"{self.base_url}/agents",
+            operation="create_agent",
             headers=self.headers,
             json=payload
         )
@@ -43,8 +53,9 @@ class GAMEClientV2:
             }
         }
 
-        response = requests.post(
+        response = self._transport.post(
             f"{self.base_url}/maps",
+            operation="create_workers",
             headers=self.headers,
             json=payload
         )
@@ -61,8 +72,9 @@ class GAMEClientV2:
             }
         }
 
-        response = requests.post(
+        response = self._transport.post(
             f"{self.base_url}/agents/{agent_id}/tasks",
+            operation="set_worker_task",
             headers=self.headers,
             json=payload
         )
@@ -73,8 +85,9 @@ class GAMEClientV2:
         """
         API call to get worker actions (for standalone worker)
         """
-        response = requests.post(
+        response = self._transport.post(
             f"{self.base_url}/agents/{agent_id}/tasks/{submission_id}/next",
+            operation="get_worker_action",
             headers=self.headers | {"model_name": model_name},
             json={
                 "data": data
@@ -84,7 +97,7 @@ class GAMEClientV2:
         if response.status_code != 200:
             raise ValueError(f"Failed to get worker action (status {response.status_code}). Response: {response.text}")
 
-        response_json = response.json()
+        response_json = self._transport.decode_json(response)
 
         return response_json["data"]
 
@@ -92,8 +105,9 @@ class GAMEClientV2:
         """
         API call to get agent actions/next step (for agent)
         """
-        response = requests.post(
+        response = self._transport.post(
             f"{self.base_url}/agents/{agent_id}/actions",
+            operation="get_agent_action",
             headers=self.headers | {"model_name": model_name},
             json={
                 "data": data
@@ -103,13 +117,14 @@ class GAMEClientV2:
         if response.status_code != 200:
             raise ValueError(f"Failed to get agent action (status {response.status_code}). Response: {response.text}")
 
-        response_json = response.json()
+        response_json = self._transport.decode_json(response)
 
         return response_json["data"]
     
     def create_chat(self, data: dict) -> str:
-        response = requests.post(
+        response = self._transport.post(
             f"{self.base_url}/conversation",
+            operation="create_chat",
             headers=self.headers,
             json={
                 "data": data
@@ -122,8 +137,9 @@ class GAMEClientV2:
         return chat_id
     
     def update_chat(self, conversation_id: str, data: dict) -> dict:
-        response = requests.post(
+        response = self._transport.post(
             f"{self.base_url}/conversation/{conversation_id}/next",
+            operation="update_chat",
             headers=self.headers,
             json={
                 "data": data
@@ -133,13 +149,14 @@ class GAMEClientV2:
         if response.status_code != 200:
             raise ValueError(f"Failed to update conversation (status {response.status_code}). Response: {response.text}")
 
-        response_json = response.json()
+        response_json = self._transport.decode_json(response)
 
         return response_json["data"]
     
     def report_function(self, conversation_id: str, data: dict) -> dict:
-        response = requests.post(
+        response = self._transport.post(
             f"{self.base_url}/conversation/{conversation_id}/function/result",
+            operation="report_function",
             headers=self.headers,
             json={
                 "data": data
@@ -148,9 +165,25 @@ class GAMEClientV2:
 
         return self._get_response_body(response)
     
+    def stream_update_chat(self, conversation_id: str, data: dict) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Streamed ``update_chat``: yields the ``(event, data)`` pairs of the turn as they arrive
+        (``message_delta``, ``function_call``, then ``done`` with the complete response)
+        """
+        return self._stream_events(f"{self.base_url}/conversation/{conversation_id}/next", "update_chat", data)
+
+    def stream_report_function(self, conversation_id: str, data: dict) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Streamed ``report_function``: yields ``message_delta`` events, then ``done`` with the complete response
+        """
+        return self._stream_events(
+            f"{self.base_url}/conversation/{conversation_id}/function/result", "report_function", data
+        )
+
     def end_chat(self, conversation_id: str, data: dict) -> dict:
-        response = requests.post(
+        response = self._transport.post(
             f"{self.base_url}/conversation/{conversation_id}/end",
+            operation="end_chat",
             headers=self.headers,
             json={
                 "data": data
@@ -163,6 +196,31 @@ class GAMEClientV2:
         if response.status_code != 200:
             raise ValueError(f"Failed to get response body (status {response.status_code}). Response: {response.text}")
 
-        response_json = response.json()
+        response_json = self._transport.decode_json(response)
+
+        return response_json["data"]
 
-        return response_json["data"]
\ No newline at end of file
+    def _stream_events(self, url: str, operation: str, data: dict) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        response = self._transport.post(
+            url,
+            operation=operation,
+            headers={**self.headers, "Accept": EVENT_STREAM},
+            json={
+                "data": data
+            },
+            stream=True,
+        )
+        with response:
+            if response.status_code != 200 or not response.headers.get("Content-Type", "").startswith(EVENT_STREAM):
+                # errors, or a server answering in one piece (the same as a stream of only "done")
+                yield "done", self._get_response_body(response)
+                return
+
+            codec = self._transport.codec or get_default_codec()
+            decoder = SSEDecoder()
+            # chunk_size=None hands over each chunk as soon as it is received
+            for chunk in response.iter_content(chunk_size=None):
+                for event, event_data in decoder.feed(chunk):
+                    yield event, codec.loads(event_data)
+            for event, event_data in decoder.flush():
+                yield event, codec.loads(event_data)
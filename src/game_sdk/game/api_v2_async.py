@@ -0,0 +1,361 @@
+import asyncio
+from typing import TYPE_CHECKING, Any, AsyncIterator, List, Dict, Optional, Tuple
+
+from game_sdk.game.codec import JSONCodec, get_default_codec
+from game_sdk.game.compression import check_encoding, encode_json_body
+from game_sdk.game.resilience import ResiliencePolicy
+from game_sdk.game.sse import EVENT_STREAM, SSEDecoder
+from game_sdk.game.tracing import current_span
+from game_sdk.game.transport import get_default_transport
+
+if TYPE_CHECKING:
+    from game_sdk.game.api_v2 import GAMEClientV2
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+class AsyncGAMEClientV2:
+    """
+    asyncio counterpart of ``GAMEClientV2``.
+
+    Exposes the same endpoints as coroutines over a pooled ``httpx.AsyncClient``, so
+    many agents can share one event loop instead of holding an OS thread each.
+    Requires the optional ``httpx`` dependency (``pip install game_sdk[async]``).
+
+    Args:
+        api_key (str): V2 API key (``apt-...``).
+        max_connections (int): Maximum number of concurrent connections.
+        max_keepalive_connections (int): Maximum number of idle keep-alive connections.
+        timeout (Optional[float]): Request timeout in seconds (``None`` disables it).
+        resilience (Optional[ResiliencePolicy]): Retry/backoff/circuit breaker policy (defaults
+            to the one of the shared sync transport, so both clients see the same breakers).
+        base_url (Optional[str]): API base URL (defaults to the hosted GAME API).
+        compression (Optional[str]): Opt-in request body compression, ``"gzip"`` or ``"zstd"``.
+        compression_threshold (int): Minimum JSON body size in bytes that gets compressed.
+        codec (Optional[JSONCodec]): Codec for request and response bodies (defaults to
+            ``get_default_codec()``).
+    """
+    def __init__(
+        self,
+        api_key: str,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        timeout: Optional[float] = None,
+        resilience: Optional[ResiliencePolicy] = None,
+        base_url: Optional[str] = None,
+        compression: Optional[str] = None,
+        compression_threshold: int = 1024,
+        codec: Optional[JSONCodec] = None,
+    ):
+        if httpx is None:
+            raise ImportError(
+                "AsyncGAMEClientV2 requires httpx. Install it with `pip install game_sdk[async]`"
+            )
+        check_encoding(compression)
+
+        self.compression = compression
+        self.compression_threshold = compression_threshold
+        self.codec = codec
+
+        self.api_key = api_key
+        self.resilience = resilience or get_default_transport().resilience
+        self.base_url = base_url or "https://sdk.game.virtuals.io/v2"
+        self.headers = {
+            "Content-Type": "application/json",
+            "x-api-key": self.api_key
+        }
+        self._client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            timeout=timeout,
+        )
+
+    @classmethod
+    def from_client(cls, client: "GAMEClientV2", **kwargs: Any) -> "AsyncGAMEClientV2":
+        """
+        Creates an async client with the API key, base URL and transport settings (timeout,
+        resilience policy, compression and codec) of a sync ``GAMEClientV2``
+        """
+        transport = client._transport
+        settings = dict(
+            timeout=transport.timeout,
+            resilience=transport.resilience,
+            base_url=client.base_url,
+            compression=transport.compression,
+            compression_threshold=transport.compression_threshold,
+            codec=transport.codec,
+        )
+        settings.update(kwargs)
+        return cls(client.api_key, **settings)
+
+    async def __aenter__(self) -> "AsyncGAMEClientV2":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        """
+        Closes the underlying connection pool
+        """
+        await self._client.aclose()
+
+    async def _post(
+        self,
+        url: str,
+        operation: str,
+        idempotent: bool = False,
+        stream: bool = False,
+        **kwargs: Any,
+    ) -> "httpx.Response":
+        """
+        Posts over the pooled client, retrying according to the resilience policy. With
+        ``stream`` the body is not read, and the caller must close the response.
+        """
+        if kwargs.get("json") is not None:
+            body, body_headers = encode_json_body(
+                kwargs.pop("json"), self.compression, self.compression_threshold, self.codec
+            )
+            kwargs["content"] = body
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), **body_headers}
+
+        policy = self.resilience
+        breaker = policy.breaker_key(url, operation)
+        attempt = 0
+        while True:
+            policy.before_attempt(breaker)
+            try:
+                if stream:
+                    request = self._client.build_request("POST", url, **kwargs)
+                    response = await self._client.send(request, stream=True)
+                else:
+                    response = await self._client.post(url, **kwargs)
+            except httpx.TransportError as e:
+                policy.record_error(breaker)
+                request_sent = not isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout))
+                if not policy.should_retry_error(attempt, request_sent, idempotent):
+                    raise
+                await asyncio.sleep(policy.get_delay(attempt))
+                attempt += 1
+                continue
+
+            policy.record_status(breaker, response.status_code)
+            if not policy.should_retry_status(attempt, response.status_code, idempotent):
+                span = current_span()
+                if span.recording:
+                    span.set_attribute("request_bytes", len(response.request.content))
+                    if not stream:
+                        span.set_attribute("response_bytes", len(response.content))
+                    span.set_attribute("attempts", attempt + 1)
+                return response
+            if stream:
+                await response.aclose()
+            await asyncio.sleep(policy.get_delay(attempt, response.headers.get("Retry-After")))
+            attempt += 1
+
+    async def create_agent(self, name: str, description: str, goal: str) -> str:
+        """
+        API call to create an agent instance (worker or agent with task generator)
+        """
+        payload = {
+            "data": {
+                "name": name,
+                "goal": goal,
+                "description": description
+            }
+        }
+
+        response = await self._post(
+            f"{self.base_url}/agents",
+            operation="create_agent",
+            headers=self.headers,
+            json=payload
+        )
+
+        return self._get_response_body(response)["id"]
+
+    async def create_workers(self, workers: List) -> str:
+        """
+        API call to create workers and worker description for the task generator (agent)
+        """
+        payload = {
+            "data": {
+                "locations": [
+                    {"id": w.id, "name": w.id, "description": w.worker_description}
+                    for w in workers
+                ]
+            }
+        }
+
+        response = await self._post(
+            f"{self.base_url}/maps",
+            operation="create_workers",
+            headers=self.headers,
+            json=payload
+        )
+
+        return self._get_response_body(response)["id"]
+
+    async def set_worker_task(self, agent_id: str, task: str) -> Dict:
+        """
+        API call to set worker task (for standalone worker)
+        """
+        payload = {
+            "data": {
+                "task": task
+            }
+        }
+
+        response = await self._post(
+            f"{self.base_url}/agents/{agent_id}/tasks",
+            operation="set_worker_task",
+            headers=self.headers,
+            json=payload
+        )
+
+        return self._get_response_body(response)
+
+    async def get_worker_action(self, agent_id: str, submission_id: str, data: dict, model_name: str) -> Dict:
+        """
+        API call to get worker actions (for standalone worker)
+        """
+        response = await self._post(
+            f"{self.base_url}/agents/{agent_id}/tasks/{submission_id}/next",
+            operation="get_worker_action",
+            headers=self.headers | {"model_name": model_name},
+            json={
+                "data": data
+            }
+        )
+
+        if response.status_code != 200:
+            raise ValueError(f"Failed to get worker action (status {response.status_code}). Response: {response.text}")
+
+        return self._decode_json(response)["data"]
+
+    async def get_agent_action(self, agent_id: str, data: dict, model_name: str) -> Dict:
+        """
+        API call to get agent actions/next step (for agent)
+        """
+        response = await self._post(
+            f"{self.base_url}/agents/{agent_id}/actions",
+            operation="get_agent_action",
+            headers=self.headers | {"model_name": model_name},
+            json={
+                "data": data
+            }
+        )
+
+        if response.status_code != 200:
+            raise ValueError(f"Failed to get agent action (status {response.status_code}). Response: {response.text}")
+
+        return self._decode_json(response)["data"]
+
+    async def create_chat(self, data: dict) -> str:
+        response = await self._post(
+            f"{self.base_url}/conversation",
+            operation="create_chat",
+            headers=self.headers,
+            json={
+                "data": data
+            }
+        )
+
+        chat_id = self._get_response_body(response).get("conversation_id")
+        if not chat_id:
+            raise Exception("Agent did not return a conversation_id for the chat.")
+        return chat_id
+
+    async def update_chat(self, conversation_id: str, data: dict) -> dict:
+        response = await self._post(
+            f"{self.base_url}/conversation/{conversation_id}/next",
+            operation="update_chat",
+            headers=self.headers,
+            json={
+                "data": data
+            }
+        )
+
+        if response.status_code != 200:
+            raise ValueError(f"Failed to update conversation (status {response.status_code}). Response: {response.text}")
+
+        return self._decode_json(response)["data"]
+
+    async def report_function(self, conversation_id: str, data: dict) -> dict:
+        response = await self._post(
+            f"{self.base_url}/conversation/{conversation_id}/function/result",
+            operation="report_function",
+            headers=self.headers,
+            json={
+                "data": data
+            }
+        )
+
+        return self._get_response_body(response)
+
+    def stream_update_chat(self, conversation_id: str, data: dict) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Streamed ``update_chat``: yields the ``(event, data)`` pairs of the turn as they arrive
+        """
+        return self._stream_events(f"{self.base_url}/conversation/{conversation_id}/next", "update_chat", data)
+
+    def stream_report_function(self, conversation_id: str, data: dict) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Streamed ``report_function``: yields ``message_delta`` events, then ``done``
+        """
+        return self._stream_events(
+            f"{self.base_url}/conversation/{conversation_id}/function/result", "report_function", data
+        )
+
+    async def end_chat(self, conversation_id: str, data: dict) -> dict:
+        response = await self._post(
+            f"{self.base_url}/conversation/{conversation_id}/end",
+            operation="end_chat",
+            headers=self.headers,
+            json={
+                "data": data
+            }
+        )
+
+        return self._get_response_body(response)
+
+    def _decode_json(self, response: "httpx.Response") -> Any:
+        return (self.codec or get_default_codec()).loads(response.content)
+
+    def _get_response_body(self, response: "httpx.Response") -> dict:
+        if response.status_code != 200:
+            raise ValueError(f"Failed to get response body (status {response.status_code}). Response: {response.text}")
+
+        return self._decode_json(response)["data"]
+
+    async def _stream_events(self, url: str, operation: str, data: dict) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        response = await self._post(
+            url,
+            operation=operation,
+            stream=True,
+            headers={**self.headers, "Accept": EVENT_STREAM},
+            json={
+                "data": data
+            },
+        )
+        try:
+            if response.status_code != 200 or not response.headers.get("Content-Type", "").startswith(EVENT_STREAM):
+                # errors, or a server answering in one piece (the same as a stream of only "done")
+                await response.aread()
+                yield "done", self._get_response_body(response)
+                return
+
+            codec = self.codec or get_default_codec()
+            decoder = SSEDecoder()
+            async for chunk in response.aiter_bytes():
+                for event, event_data in decoder.feed(chunk):
+                    yield event, codec.loads(event_data)
+            for event, event_data in decoder.flush():
+                yield event, codec.loads(event_data)
+        finally:
+            await response.aclose()
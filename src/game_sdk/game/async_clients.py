@@ -0,0 +1,61 @@
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from game_sdk.game.api_v2 import GAMEClientV2
+
+if TYPE_CHECKING:
+    from game_sdk.game.api_v2_async import AsyncGAMEClientV2
+
+
+class AsyncClientProvider:
+    """
+    Hands out the ``AsyncGAMEClientV2`` to use on the running event loop.
+
+    An httpx connection pool is bound to the event loop it was first used on, so a client
+    created under one ``asyncio.run`` cannot serve the next one. Unless a client is injected,
+    one is created per event loop, mirroring the sync client's settings (base URL, timeout,
+    resilience policy, compression and codec), and dropped once its loop is closed.
+
+    Args:
+        client (GAMEClientV2): Sync client whose settings the async clients mirror.
+        async_client (Optional[AsyncGAMEClientV2]): Client to use instead, on whichever loop
+            it was created for. It is left open by ``aclose``, as its owner closes it.
+    """
+    def __init__(self, client: GAMEClientV2, async_client: Optional["AsyncGAMEClientV2"] = None):
+        self.client = client
+        self.async_client = async_client
+        self._lock = threading.Lock()
+        self._clients: Dict[Any, "AsyncGAMEClientV2"] = {}
+
+    def get(self) -> "AsyncGAMEClientV2":
+        """
+        Returns the client for the running event loop, creating it on first use
+        """
+        if self.async_client is not None:
+            return self.async_client
+
+        # imported on first use, so synchronous programs never load asyncio or httpx
+        import asyncio
+        from game_sdk.game.api_v2_async import AsyncGAMEClientV2
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._clients.get(loop)
+            if client is None:
+                # the connections of a closed loop's client are gone with the loop
+                for closed in [other for other in self._clients if other.is_closed()]:
+                    del self._clients[closed]
+                client = self._clients[loop] = AsyncGAMEClientV2.from_client(self.client)
+            return client
+
+    async def aclose(self):
+        """
+        Closes the client created for the running event loop
+        """
+        import asyncio
+
+        with self._lock:
+            client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
@@ -1,6 +1,10 @@
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
 from game_sdk.game.custom_types import (
+    ChatActionRequest,
     ChatResponse,
+    ChatStreamEvent,
+    ChatStreamEventType,
     FunctionCallResponse,
     FunctionResult,
     GameChatResponse,
@@ -8,6 +12,13 @@ from game_sdk.game.custom_types import (
     AgentMessage,
 )
 from game_sdk.game.api_v2 import GAMEClientV2
+from game_sdk.game.async_clients import AsyncClientProvider
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from game_sdk.game.api_v2_async import AsyncGAMEClientV2
+    from game_sdk.game.conversation_pool import ConversationPool
 
 
 class Chat:
@@ -17,6 +28,7 @@ class Chat:
         client: GAMEClientV2,
         action_space: Optional[List[Function]] = None,
         get_state_fn: Optional[Callable[[], Dict[str, Any]]] = None,
+        async_client: Optional["AsyncGAMEClientV2"] = None,
     ):
         self.chat_id = conversation_id
         self.client = client
@@ -24,24 +36,17 @@ class Chat:
             {f.fn_name: f for f in action_space} if action_space else None
         )
         self.get_state_fn = get_state_fn
+        # used by anext/aend (one per event loop, created on first use if not given)
+        self._async_clients = AsyncClientProvider(client, async_client)
+        self._owns_async_clients = True
 
     def next(self, message: str) -> ChatResponse:
 
         convo_response = self._update_conversation(message)
 
         # execute functions/actions if present
-        if convo_response.function_call:
-            if not self.action_space:
-                raise Exception("No functions provided")
-
-            fn_name = convo_response.function_call.fn_name
-
-            fn_to_call = self.action_space.get(fn_name)
-            if not fn_to_call:
-                raise Exception(
-                    f"Function {fn_name}, returned by the agent, not found in action space"
-                )
-
+        fn_to_call = self._get_function(convo_response)
+        if fn_to_call:
             result = fn_to_call.execute(
                 **{
                     "fn_id": convo_response.function_call.id,
@@ -49,19 +54,162 @@ class Chat:
                 }
             )
             response_message = self._report_function_result(result)
-            function_call_response = FunctionCallResponse(
-                fn_name=fn_name,
-                fn_args=convo_response.function_call.args,
-                result=result,
+        else:
+            result = None
+            response_message = convo_response.message or ""
+
+        return self._chat_response(convo_response, response_message, result)
+
+    async def anext(self, message: str) -> ChatResponse:
+        """
+        asyncio counterpart of ``next`` - the function runs via ``Function.aexecute``
+        """
+        client = self._get_async_client()
+        result = await client.update_chat(self.chat_id, self._build_update_data(message))
+        convo_response = GameChatResponse.model_validate(result)
+
+        fn_to_call = self._get_function(convo_response)
+        if fn_to_call:
+            result = await fn_to_call.aexecute(
+                fn_id=convo_response.function_call.id,
+                args=convo_response.function_call.args,
             )
+            response = await client.report_function(self.chat_id, self._build_report_data(result))
+            response_message = self._get_report_message(response)
         else:
+            result = None
             response_message = convo_response.message or ""
-            function_call_response = None
 
-        return ChatResponse(
-            message=response_message,
-            is_finished=convo_response.is_finished,
-            function_call=function_call_response,
+        return self._chat_response(convo_response, response_message, result)
+
+    def stream(self, message: str) -> Iterator[ChatStreamEvent]:
+        """
+        Streaming counterpart of ``next``.
+
+        Yields the agent's message in pieces as it is generated. A function the agent calls
+        starts running as soon as the call is complete, while the rest of the turn streams
+        in; once it returns, its result is reported and the agent's reply to it is streamed
+        as well. The last event is ``DONE``, carrying the ``ChatResponse`` ``next`` returns.
+
+        Example:
+            ```python
+            for event in chat.stream("What is the price of ETH?"):
+                if event.type == ChatStreamEventType.MESSAGE_DELTA:
+                    print(event.delta, end="", flush=True)
+            ```
+        """
+        streamed: List[str] = []
+        function_call: Optional[ChatActionRequest] = None
+        running = None
+        done: Optional[Dict[str, Any]] = None
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="game_sdk_chat_function")
+        try:
+            for event, data in self.client.stream_update_chat(self.chat_id, self._build_update_data(message)):
+                if event == "function_call":
+                    function_call = ChatActionRequest.model_validate(data)
+                    fn_to_call = self._get_function(GameChatResponse(function_call=function_call))
+                    running = executor.submit(fn_to_call.execute, fn_id=function_call.id, args=function_call.args)
+                    yield self._function_call_event(function_call)
+                elif event == "done":
+                    done = data
+                else:
+                    delta = self._stream_delta(event, data, streamed)
+                    if delta is not None:
+                        yield delta
+
+            convo_response = self._streamed_chat_response(done, function_call)
+            if running is None and convo_response.function_call:
+                # the server sent the call only with the complete response
+                function_call = convo_response.function_call
+                fn_to_call = self._get_function(convo_response)
+                running = executor.submit(fn_to_call.execute, fn_id=function_call.id, args=function_call.args)
+                yield self._function_call_event(function_call)
+
+            if running is None:
+                result = None
+                response_message = convo_response.message or ""
+            else:
+                result = running.result()
+                yield ChatStreamEvent(type=ChatStreamEventType.FUNCTION_RESULT, result=result)
+                streamed, report = [], None
+                for event, data in self.client.stream_report_function(self.chat_id, self._build_report_data(result)):
+                    if event == "done":
+                        report = data
+                    else:
+                        delta = self._stream_delta(event, data, streamed)
+                        if delta is not None:
+                            yield delta
+                response_message = self._get_report_message(report or {})
+        finally:
+            executor.shutdown(wait=False)
+
+        remaining = self._remaining_delta(response_message, streamed)
+        if remaining is not None:
+            yield remaining
+        yield ChatStreamEvent(
+            type=ChatStreamEventType.DONE,
+            response=self._chat_response(convo_response, response_message, result),
+        )
+
+    async def astream(self, message: str) -> AsyncIterator[ChatStreamEvent]:
+        """
+        asyncio counterpart of ``stream`` - the function runs via ``Function.aexecute`` in a task of its own
+        """
+        import asyncio
+
+        client = self._get_async_client()
+        streamed: List[str] = []
+        function_call: Optional[ChatActionRequest] = None
+        running = None
+        done: Optional[Dict[str, Any]] = None
+        try:
+            async for event, data in client.stream_update_chat(self.chat_id, self._build_update_data(message)):
+                if event == "function_call":
+                    function_call = ChatActionRequest.model_validate(data)
+                    fn_to_call = self._get_function(GameChatResponse(function_call=function_call))
+                    running = asyncio.ensure_future(
+                        fn_to_call.aexecute(fn_id=function_call.id, args=function_call.args)
+                    )
+                    yield self._function_call_event(function_call)
+                elif event == "done":
+                    done = data
+                else:
+                    delta = self._stream_delta(event, data, streamed)
+                    if delta is not None:
+                        yield delta
+
+            convo_response = self._streamed_chat_response(done, function_call)
+            if running is None and convo_response.function_call:
+                function_call = convo_response.function_call
+                fn_to_call = self._get_function(convo_response)
+                running = asyncio.ensure_future(fn_to_call.aexecute(fn_id=function_call.id, args=function_call.args))
+                yield self._function_call_event(function_call)
+
+            if running is None:
+                result = None
+                response_message = convo_response.message or ""
+            else:
+                result = await running
+                yield ChatStreamEvent(type=ChatStreamEventType.FUNCTION_RESULT, result=result)
+                streamed, report = [], None
+                async for event, data in client.stream_report_function(self.chat_id, self._build_report_data(result)):
+                    if event == "done":
+                        report = data
+                    else:
+                        delta = self._stream_delta(event, data, streamed)
+                        if delta is not None:
+                            yield delta
+                response_message = self._get_report_message(report or {})
+        finally:
+            if running is not None and not running.done():
+                running.cancel()  # the stream failed or was abandoned
+
+        remaining = self._remaining_delta(response_message, streamed)
+        if remaining is not None:
+            yield remaining
+        yield ChatStreamEvent(
+            type=ChatStreamEventType.DONE,
+            response=self._chat_response(convo_response, response_message, result),
         )
 
     def end(self, message: Optional[str] = None):
@@ -72,8 +220,22 @@ class Chat:
             },
         )
 
-    def _update_conversation(self, message: str) -> GameChatResponse:
-        data = {
+    async def aend(self, message: Optional[str] = None):
+        await self._get_async_client().end_chat(self.chat_id, {"message": message})
+
+    async def aclose(self):
+        """
+        Closes the async client the chat created for the running event loop (chats from
+        ``ChatAgent.acreate_chat`` share the agent's, which ``ChatAgent.aclose`` closes)
+        """
+        if self._owns_async_clients:
+            await self._async_clients.aclose()
+
+    def _get_async_client(self) -> "AsyncGAMEClientV2":
+        return self._async_clients.get()
+
+    def _build_update_data(self, message: str) -> Dict[str, Any]:
+        return {
             "message": message,
             "state": self.get_state_fn() if self.get_state_fn else None,
             "functions": (
@@ -82,11 +244,93 @@ class Chat:
                 else None
             ),
         }
-        result = self.client.update_chat(self.chat_id, data)
+
+    def _update_conversation(self, message: str) -> GameChatResponse:
+        result = self.client.update_chat(self.chat_id, self._build_update_data(message))
         return GameChatResponse.model_validate(result)
 
-    def _report_function_result(self, result: FunctionResult) -> str:
-        data = {
+    def _get_function(self, convo_response: GameChatResponse) -> Optional[Function]:
+        """
+        Returns the function the agent asked to call (if any)
+        """
+        if not convo_response.function_call:
+            return None
+        if not self.action_space:
+            raise Exception("No functions provided")
+
+        fn_name = convo_response.function_call.fn_name
+
+        fn_to_call = self.action_space.get(fn_name)
+        if not fn_to_call:
+            raise Exception(
+                f"Function {fn_name}, returned by the agent, not found in action space"
+            )
+        return fn_to_call
+
+    def _chat_response(
+        self,
+        convo_response: GameChatResponse,
+        response_message: str,
+        result: Optional[FunctionResult],
+    ) -> ChatResponse:
+        function_call_response = None
+        if result is not None:
+            function_call_response = FunctionCallResponse(
+                fn_name=convo_response.function_call.fn_name,
+                fn_args=convo_response.function_call.args,
+                result=result,
+            )
+
+        return ChatResponse(
+            message=response_message,
+            is_finished=convo_response.is_finished,
+            function_call=function_call_response,
+        )
+
+    @staticmethod
+    def _function_call_event(function_call: ChatActionRequest) -> ChatStreamEvent:
+        return ChatStreamEvent(
+            type=ChatStreamEventType.FUNCTION_CALL,
+            fn_name=function_call.fn_name,
+            fn_args=function_call.args,
+        )
+
+    @staticmethod
+    def _stream_delta(event: str, data: Dict[str, Any], streamed: List[str]) -> Optional[ChatStreamEvent]:
+        """
+        Turns a streamed message delta into an event (other events are ignored) and raises streamed errors
+        """
+        if event == "error":
+            raise Exception(f"Agent failed to answer: {data.get('message')}")
+        if event != "message_delta" or not data.get("delta"):
+            return None
+        streamed.append(data["delta"])
+        return ChatStreamEvent(type=ChatStreamEventType.MESSAGE_DELTA, delta=data["delta"])
+
+    @staticmethod
+    def _remaining_delta(message: str, streamed: List[str]) -> Optional[ChatStreamEvent]:
+        """
+        Returns the part of the complete message that was not streamed (all of it, if the server did not stream)
+        """
+        sent = "".join(streamed)
+        if len(message) <= len(sent) or not message.startswith(sent):
+            return None
+        return ChatStreamEvent(type=ChatStreamEventType.MESSAGE_DELTA, delta=message[len(sent):])
+
+    @staticmethod
+    def _streamed_chat_response(
+        done: Optional[Dict[str, Any]],
+        function_call: Optional[ChatActionRequest],
+    ) -> GameChatResponse:
+        if done is None:
+            raise Exception("Agent response stream ended before the turn was complete.")
+        convo_response = GameChatResponse.model_validate(done)
+        if convo_response.function_call is None and function_call is not None:
+            convo_response.function_call = function_call
+        return convo_response
+
+    def _build_report_data(self, result: FunctionResult) -> Dict[str, Any]:
+        return {
             "fn_id": result.action_id,
             "result": (
                 f"{result.action_status.value}: {result.feedback_message}"
@@ -94,8 +338,13 @@ class Chat:
                 else result.action_status.value
             ),
         }
-        response = self.client.report_function(self.chat_id, data)
 
+    def _report_function_result(self, result: FunctionResult) -> str:
+        response = self.client.report_function(self.chat_id, self._build_report_data(result))
+        return self._get_report_message(response)
+
+    @staticmethod
+    def _get_report_message(response: Dict[str, Any]) -> str:
         message = response.get("message")
         if not message:
             raise Exception("Agent did not return a message for the function report.")
@@ -107,15 +356,42 @@ class ChatAgent:
         self,
         api_key: str,
         prompt: str,
+        client: Optional[GAMEClientV2] = None,
+        async_client: Optional["AsyncGAMEClientV2"] = None,
+        conversation_pool_size: int = 0,
+        conversation_ttl: float = 600.0,
     ):
         self._api_key = api_key
         self.prompt = prompt
 
-        if api_key.startswith("apt-"):
+        if client is not None:
+            self.client = client
+        elif api_key.startswith("apt-"):
             self.client = GAMEClientV2(api_key)
         else:
             raise Exception("Please use V2 API key to use ChatAgent")
 
+        # async clients (one per event loop) are created on first use of acreate_chat and shared by its chats
+        self._async_clients = AsyncClientProvider(self.client, async_client)
+
+        # conversations pre-warmed with prewarm_chat, handed over by create_chat/acreate_chat
+        # (conversation_pool_size=0 disables it; conversation_ttl is in seconds)
+        self.conversation_pool: Optional["ConversationPool"] = None
+        if conversation_pool_size > 0:
+            from game_sdk.game.conversation_pool import ConversationPool
+            self.conversation_pool = ConversationPool(
+                self.client.create_chat, max_size=conversation_pool_size, ttl=conversation_ttl
+            )
+
+    def prewarm_chat(self, partner_id: str, partner_name: str) -> bool:
+        """
+        Creates the partner's conversation in the background, so that ``create_chat`` for them
+        does not wait for it. Returns False if pre-warming is disabled or the pool is full.
+        """
+        if self.conversation_pool is None:
+            return False
+        return self.conversation_pool.prewarm(partner_id, self._build_chat_data(partner_id, partner_name))
+
     def create_chat(
         self,
         partner_id: str,
@@ -124,12 +400,60 @@ class ChatAgent:
         get_state_fn: Optional[Callable[[], Dict[str, Any]]] = None,
     ) -> Chat:
 
-        chat_id = self.client.create_chat(
-            {
-                "prompt": self.prompt,
-                "partner_id": partner_id,
-                "partner_name": partner_name,
-            },
-        )
+        chat_data = self._build_chat_data(partner_id, partner_name)
+        chat_id = None
+        pooled = self._acquire_conversation(partner_id, chat_data)
+        if pooled is not None:
+            try:
+                chat_id = pooled.result()
+            except Exception:
+                pass  # the conversation is created on demand below
+        if chat_id is None:
+            chat_id = self.client.create_chat(chat_data)
 
         return Chat(chat_id, self.client, action_space, get_state_fn)
+
+    async def acreate_chat(
+        self,
+        partner_id: str,
+        partner_name: str,
+        action_space: Optional[List[Function]] = None,
+        get_state_fn: Optional[Callable[[], Dict[str, Any]]] = None,
+    ) -> Chat:
+        """
+        asyncio counterpart of ``create_chat``; the chat's ``anext`` uses the same async client
+        """
+        chat_data = self._build_chat_data(partner_id, partner_name)
+        chat_id = None
+        pooled = self._acquire_conversation(partner_id, chat_data)
+        if pooled is not None:
+            import asyncio
+            try:
+                chat_id = await asyncio.wrap_future(pooled)
+            except Exception:
+                pass  # the conversation is created on demand below
+        if chat_id is None:
+            chat_id = await self._async_clients.get().create_chat(chat_data)
+
+        chat = Chat(chat_id, self.client, action_space, get_state_fn)
+        chat._async_clients = self._async_clients
+        chat._owns_async_clients = False
+        return chat
+
+    async def aclose(self):
+        """
+        Closes the async client created for the running event loop, shared by the chats of ``acreate_chat``
+        """
+        await self._async_clients.aclose()
+
+    def _acquire_conversation(self, partner_id: str, chat_data: Dict[str, Any]) -> Optional["Future[str]"]:
+        if self.conversation_pool is None:
+            return None
+        return self.conversation_pool.acquire(partner_id, chat_data)
+
+    def _build_chat_data(self, partner_id: str, partner_name: str) -> Dict[str, Any]:
+        return {
+            "prompt": self.prompt,
+            "partner_id": partner_id,
+            "partner_name": partner_name,
+        }
@@ -0,0 +1,236 @@
+import asyncio
+import collections
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from game_sdk.game.chat_agent import Chat, ChatAgent
+from game_sdk.game.custom_types import ChatResponse, Function
+
+
+@dataclass(frozen=True)
+class MultiplexerMetrics:
+    """
+    Snapshot of a ``ChatMultiplexer``.
+
+    Attributes:
+        conversations (int): Open conversations.
+        in_flight (int): Turns currently being answered.
+        queued (int): Messages waiting for their turn, across conversations.
+        max_queue_depth (int): Messages waiting in the most backed-up conversation.
+        turns (int): Turns answered so far.
+        errors (int): Turns that raised.
+        latency_p50 (float): Median seconds from a message being sent to its reply, over recent turns.
+        latency_p99 (float): 99th percentile of the same.
+        wait_p50 (float): Median seconds a message waited (in its conversation queue or for a
+            free slot) before its turn started.
+    """
+    conversations: int
+    in_flight: int
+    queued: int
+    max_queue_depth: int
+    turns: int
+    errors: int
+    latency_p50: float
+    latency_p99: float
+    wait_p50: float
+
+
+class _Conversation:
+    def __init__(self, partner_id: str, partner_name: str):
+        self.partner_id = partner_id
+        self.partner_name = partner_name
+        self.chat: Optional[Chat] = None
+        # (message, future, time sent)
+        self.queue: Deque[Tuple[str, asyncio.Future, float]] = collections.deque()
+        self.task: Optional[asyncio.Task] = None
+
+
+class ChatMultiplexer:
+    """
+    Serves many ``ChatAgent`` conversations concurrently from one event loop.
+
+    Each conversation (by default one per partner) is created on its first message and
+    answered with ``Chat.anext`` over a shared async client, so thousands of open chats
+    need no thread each. Messages of a conversation are answered one at a time in the
+    order they were sent; turns of different conversations run concurrently, bounded
+    per partner and globally.
+
+    Args:
+        chat_agent (ChatAgent): Agent whose prompt the conversations use.
+        action_space (Optional[List[Function]]): Functions offered in every conversation.
+        get_state_fn (Optional[Callable[[str], Dict[str, Any]]]): Returns the state sent with
+            each turn, given the partner id.
+        max_concurrent_turns (int): Maximum number of turns in flight across all conversations.
+        max_turns_per_partner (int): Maximum number of turns in flight for one partner (across
+            that partner's conversations).
+        latency_window (int): Number of recent turns the latency metrics are computed over.
+
+    Example:
+        ```python
+        mux = ChatMultiplexer(chat_agent, action_space=[get_price], max_concurrent_turns=200)
+
+        async def on_telegram_message(update):
+            response = await mux.send(str(update.user_id), update.text, partner_name=update.username)
+            await reply(update, response.message)
+
+        print(mux.metrics())
+        ```
+    """
+    def __init__(
+        self,
+        chat_agent: ChatAgent,
+        action_space: Optional[List[Function]] = None,
+        get_state_fn: Optional[Callable[[str], Dict[str, Any]]] = None,
+        max_concurrent_turns: int = 100,
+        max_turns_per_partner: int = 1,
+        latency_window: int = 1000,
+    ):
+        if max_concurrent_turns <= 0 or max_turns_per_partner <= 0:
+            raise ValueError("Concurrency limits must be positive")
+
+        self.chat_agent = chat_agent
+        self.action_space = action_space
+        self.get_state_fn = get_state_fn
+        self.max_concurrent_turns = max_concurrent_turns
+        self.max_turns_per_partner = max_turns_per_partner
+
+        self._conversations: Dict[str, _Conversation] = {}
+        # semaphores are created lazily, as they bind to the running loop on older Pythons
+        self._global_slots: Optional[asyncio.Semaphore] = None
+        self._partner_slots: Dict[str, asyncio.Semaphore] = {}
+        self._partner_conversations: Dict[str, int] = collections.Counter()
+        self._in_flight = 0
+        self._turns = 0
+        self._errors = 0
+        self._latencies: Deque[float] = collections.deque(maxlen=latency_window)
+        self._waits: Deque[float] = collections.deque(maxlen=latency_window)
+
+    async def send(
+        self,
+        partner_id: str,
+        message: str,
+        partner_name: Optional[str] = None,
+        conversation_key: Optional[str] = None,
+    ) -> ChatResponse:
+        """
+        Queues ``message`` in the partner's conversation and returns the agent's reply.
+
+        Args:
+            partner_id (str): Id of the user the agent is talking to.
+            message (str): The user's message.
+            partner_name (Optional[str]): Display name used when the conversation is created
+                (defaults to ``partner_id``).
+            conversation_key (Optional[str]): Separates several conversations with the same
+                partner, e.g. one per group chat (defaults to ``partner_id``).
+        """
+        key = conversation_key or partner_id
+        conversation = self._conversations.get(key)
+        if conversation is None:
+            conversation = _Conversation(partner_id, partner_name or partner_id)
+            self._conversations[key] = conversation
+            self._partner_conversations[partner_id] += 1
+
+        future = asyncio.get_running_loop().create_future()
+        conversation.queue.append((message, future, time.monotonic()))
+        # one task per conversation with pending messages, which keeps them in order
+        if conversation.task is None:
+            conversation.task = asyncio.ensure_future(self._drain(conversation))
+        return await future
+
+    async def end(self, partner_id: str, message: Optional[str] = None, conversation_key: Optional[str] = None):
+        """
+        Ends a conversation once its queued messages are answered; the next message starts a new one
+        """
+        key = conversation_key or partner_id
+        conversation = self._conversations.pop(key, None)
+        if conversation is None:
+            return
+        if conversation.task is not None:
+            await asyncio.shield(conversation.task)
+
+        self._partner_conversations[partner_id] -= 1
+        if self._partner_conversations[partner_id] <= 0:
+            del self._partner_conversations[partner_id]
+            self._partner_slots.pop(partner_id, None)
+
+        if conversation.chat is not None:
+            await conversation.chat.aend(message)
+
+    def metrics(self) -> MultiplexerMetrics:
+        depths = [len(c.queue) for c in self._conversations.values()]
+        latencies = sorted(self._latencies)
+        waits = sorted(self._waits)
+        return MultiplexerMetrics(
+            conversations=len(self._conversations),
+            in_flight=self._in_flight,
+            queued=sum(depths),
+            max_queue_depth=max(depths, default=0),
+            turns=self._turns,
+            errors=self._errors,
+            latency_p50=_percentile(latencies, 0.5),
+            latency_p99=_percentile(latencies, 0.99),
+            wait_p50=_percentile(waits, 0.5),
+        )
+
+    async def _drain(self, conversation: _Conversation):
+        try:
+            while conversation.queue:
+                message, future, sent_at = conversation.queue.popleft()
+                try:
+                    response = await self._answer(conversation, message, sent_at)
+                except asyncio.CancelledError:
+                    future.cancel()
+                    raise
+                except Exception as e:
+                    self._errors += 1
+                    if not future.done():
+                        future.set_exception(e)
+                else:
+                    if not future.done():
+                        future.set_result(response)
+                self._latencies.append(time.monotonic() - sent_at)
+        except asyncio.CancelledError:
+            # e.g. the loop is shutting down - do not leave the senders waiting forever
+            while conversation.queue:
+                conversation.queue.popleft()[1].cancel()
+            raise
+        finally:
+            conversation.task = None
+
+    async def _answer(self, conversation: _Conversation, message: str, sent_at: float) -> ChatResponse:
+        if self._global_slots is None:
+            self._global_slots = asyncio.Semaphore(self.max_concurrent_turns)
+        partner_slots = self._partner_slots.get(conversation.partner_id)
+        if partner_slots is None:
+            partner_slots = self._partner_slots[conversation.partner_id] = asyncio.Semaphore(
+                self.max_turns_per_partner
+            )
+
+        # the partner slot is taken first, so a busy partner does not hold global slots while waiting
+        async with partner_slots, self._global_slots:
+            self._waits.append(time.monotonic() - sent_at)
+            self._in_flight += 1
+            try:
+                if conversation.chat is None:
+                    get_state_fn = None
+                    if self.get_state_fn is not None:
+                        partner_id = conversation.partner_id
+                        get_state_fn = lambda: self.get_state_fn(partner_id)
+                    conversation.chat = await self.chat_agent.acreate_chat(
+                        conversation.partner_id,
+                        conversation.partner_name,
+                        action_space=self.action_space,
+                        get_state_fn=get_state_fn,
+                    )
+                response = await conversation.chat.anext(message)
+                self._turns += 1
+                return response
+            finally:
+                self._in_flight -= 1
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
@@ -0,0 +1,164 @@
+import json
+import os
+import signal
+import tempfile
+import threading
+from typing import Any, Dict, Iterable, Optional
+
+from game_sdk.game import events
+from game_sdk.game.custom_types import FunctionResult
+
+CHECKPOINT_VERSION = 1
+
+
+def save_checkpoint(path: str, data: Dict[str, Any]):
+    """
+    Writes a checkpoint atomically: readers see either the previous or the new file, never a partial one
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".checkpoint-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump({"version": CHECKPOINT_VERSION, **data}, f, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def load_checkpoint(path: str) -> Optional[Dict[str, Any]]:
+    """
+    Reads a checkpoint, returning None if there is none (or it is unreadable or from another version)
+    """
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != CHECKPOINT_VERSION:
+        return None
+    return data
+
+
+def dump_function_result(function_result: Optional[FunctionResult]) -> Optional[Dict[str, Any]]:
+    if function_result is None:
+        return None
+    return {"fn_name": function_result.fn_name, **function_result.model_dump(mode="json")}
+
+
+def load_function_result(data: Optional[Dict[str, Any]]) -> Optional[FunctionResult]:
+    if data is None:
+        return None
+    data = dict(data)
+    fn_name = data.pop("fn_name", None)
+    function_result = FunctionResult.model_validate(data)
+    function_result._fn_name = fn_name
+    return function_result
+
+
+class Checkpointer:
+    """
+    Periodically saves the runtime state of an ``Agent`` or ``Worker`` so a restarted
+    process resumes where it left off instead of re-registering and re-planning.
+
+    The checkpoint holds the remote agent (and map) ids, the session, the last function
+    result, the worker and agent states, the current worker and (for workers) the active
+    task. It is restored when the agent is created and compiled with the same checkpointer,
+    as long as the agent's definition has not changed since.
+
+    Saves made by steps and signal handlers never raise: a state that cannot be written
+    (e.g. a state function returning values that are not JSON-serializable) is reported as a
+    ``checkpoint_error`` event and the previous checkpoint is kept. ``save()`` raises.
+
+    Args:
+        path (str): Checkpoint file, written atomically.
+        every_n_steps (int): Save after every ``every_n_steps`` completed steps (0 to only save
+            explicitly or on signal).
+
+    Example:
+        ```python
+        checkpointer = Checkpointer("checkpoints/trader.json", every_n_steps=5)
+        agent = Agent(..., checkpointer=checkpointer)
+        agent.compile()  # resumes from the checkpoint if there is a matching one
+        checkpointer.save_on_signal(agent)  # also save on SIGTERM
+        agent.run()
+        ```
+    """
+    def __init__(self, path: str, every_n_steps: int = 10):
+        self.path = os.path.expanduser(path)
+        self.every_n_steps = every_n_steps
+        # reentrant, as a signal handler may run while the main thread is saving
+        self._lock = threading.RLock()
+        self._steps = 0
+        # state as of the last completed step, saved by signal handlers
+        self._latest: Optional[Dict[str, Any]] = None
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        return load_checkpoint(self.path)
+
+    def save(self, owner: Any):
+        """
+        Saves the current state of ``owner`` (an ``Agent`` or ``Worker``)
+        """
+        state = owner._get_checkpoint_state()
+        with self._lock:
+            self._latest = state
+            save_checkpoint(self.path, state)
+
+    def step_completed(self, owner: Any):
+        """
+        Called by ``owner`` after each step; saves every ``every_n_steps`` steps
+        """
+        state = owner._get_checkpoint_state()
+        with self._lock:
+            self._latest = state
+            self._steps += 1
+            if self.every_n_steps and self._steps % self.every_n_steps == 0:
+                self._save_reporting_errors(state)
+
+    def save_on_signal(self, owner: Any, signals: Iterable[int] = (signal.SIGTERM,)):
+        """
+        Saves the state of the last completed step when one of ``signals`` is received, then
+        hands the signal to the previous handler (so SIGTERM still stops the process).
+        Must be called from the main thread.
+        """
+        for signum in signals:
+            previous = signal.getsignal(signum)
+
+            def handler(signum, frame, previous=previous):
+                with self._lock:
+                    state = self._latest
+                if state is None:
+                    state = owner._get_checkpoint_state()
+                self._save_reporting_errors(state)
+
+                if callable(previous):
+                    previous(signum, frame)
+                elif previous == signal.SIG_DFL:
+                    raise SystemExit(128 + signum)
+
+            signal.signal(signum, handler)
+
+    def _save_reporting_errors(self, state: Dict[str, Any]):
+        """
+        Saves ``state``, reporting a failure as an event instead of raising it into the step
+        """
+        try:
+            save_checkpoint(self.path, state)
+        except (TypeError, ValueError, OSError) as e:
+            events.emit("checkpoint_error", path=self.path, error=e)
+
+    def clear(self):
+        """
+        Deletes the checkpoint, e.g. once the agent's work is done
+        """
+        with self._lock:
+            self._latest = None
+            self._steps = 0
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,108 @@
+import functools
+import json
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Optional, Union
+
+
+@functools.lru_cache(maxsize=None)
+def _import_orjson() -> Any:
+    """
+    Imports orjson on first use (None when it is not installed), keeping it out of the SDK import
+    """
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+class JSONCodec(ABC):
+    """
+    Encodes request bodies and decodes response bodies for the GAME API clients.
+
+    Bodies are encoded once, straight to the bytes that go on the wire, and responses
+    are decoded from the raw bytes received (skipping the text decoding of
+    ``response.json()``).
+
+    Attributes:
+        name (str): Name of the JSON library used.
+    """
+    name: str
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Encodes ``obj`` as UTF-8 JSON
+        """
+
+    @abstractmethod
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        Decodes a JSON document
+        """
+
+
+class StdlibCodec(JSONCodec):
+    """
+    Codec based on the standard library ``json`` module.
+    """
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        # like requests' json=, NaN and infinity are rejected as they are not valid JSON
+        return json.dumps(obj, separators=(",", ":"), allow_nan=False).encode()
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    Codec based on ``orjson`` (``pip install game_sdk[orjson]``), several times faster
+    than the standard library on agent payloads.
+
+    Values ``orjson`` cannot encode (e.g. integers wider than 64 bits) are handed to the
+    standard library instead, so both codecs accept the same payloads.
+    """
+    name = "orjson"
+
+    def __init__(self):
+        self._orjson = _import_orjson()
+        if self._orjson is None:
+            raise ImportError("OrjsonCodec requires orjson. Install it with `pip install game_sdk[orjson]`")
+        self._fallback = StdlibCodec()
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return self._orjson.dumps(obj, option=self._orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            return self._fallback.dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._orjson.loads(data)
+
+
+_default_codec: Optional[JSONCodec] = None
+_default_codec_lock = threading.Lock()
+
+
+def get_default_codec() -> JSONCodec:
+    """
+    Returns the process-wide codec used by clients created without one
+    (``OrjsonCodec`` when orjson is installed, ``StdlibCodec`` otherwise)
+    """
+    global _default_codec
+    with _default_codec_lock:
+        if _default_codec is None:
+            _default_codec = OrjsonCodec() if _import_orjson() is not None else StdlibCodec()
+        return _default_codec
+
+
+def set_default_codec(codec: Optional[JSONCodec]):
+    """
+    Replaces the process-wide codec (``None`` resets it to the fastest one available on next use)
+    """
+    global _default_codec
+    with _default_codec_lock:
+        _default_codec = codec
@@ -0,0 +1,74 @@
+import functools
+import gzip
+from typing import Any, Dict, Optional, Tuple
+
+from game_sdk.game.codec import JSONCodec, get_default_codec
+
+SUPPORTED_ENCODINGS = ("gzip", "zstd")
+
+
+@functools.lru_cache(maxsize=None)
+def _import_zstandard() -> Any:
+    """
+    Imports zstandard on first use (None when it is not installed)
+    """
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard
+
+
+def check_encoding(encoding: Optional[str]):
+    """
+    Validates a request compression setting, raising if it cannot be used
+    """
+    if encoding is None:
+        return
+    if encoding not in SUPPORTED_ENCODINGS:
+        raise ValueError(f"Unsupported compression '{encoding}' (expected one of {SUPPORTED_ENCODINGS})")
+    if encoding == "zstd" and _import_zstandard() is None:
+        raise ImportError("zstd compression requires zstandard. Install it with `pip install zstandard`")
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=6)
+    return _import_zstandard().ZstdCompressor().compress(body)
+
+
+def decompress(body: bytes, encoding: str) -> bytes:
+    if encoding == "gzip":
+        return gzip.decompress(body)
+    if encoding == "zstd":
+        zstandard = _import_zstandard()
+        if zstandard is None:
+            raise ImportError("zstd decompression requires zstandard. Install it with `pip install zstandard`")
+        return zstandard.ZstdDecompressor().decompressobj().decompress(body)
+    raise ValueError(f"Unsupported content encoding '{encoding}'")
+
+
+def encode_json_body(
+    payload: Any,
+    encoding: Optional[str],
+    threshold: int,
+    codec: Optional[JSONCodec] = None,
+) -> Tuple[bytes, Dict[str, str]]:
+    """
+    Encodes a JSON request body, compressing it when it is at least ``threshold`` bytes.
+
+    Args:
+        payload (Any): JSON-serializable request body.
+        encoding (Optional[str]): ``"gzip"``, ``"zstd"`` or None to never compress.
+        threshold (int): Minimum encoded size in bytes worth compressing.
+        codec (Optional[JSONCodec]): Codec encoding the body (defaults to ``get_default_codec()``).
+
+    Returns:
+        Tuple[bytes, Dict[str, str]]: The body and the headers describing it.
+    """
+    body = (codec or get_default_codec()).dumps(payload)
+    headers = {"Content-Type": "application/json"}
+    if encoding is not None and len(body) >= threshold:
+        body = compress(body, encoding)
+        headers["Content-Encoding"] = encoding
+    return body, headers
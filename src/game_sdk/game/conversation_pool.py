@@ -0,0 +1,156 @@
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """
+    Counters of a ``ConversationPool``.
+
+    Attributes:
+        hits (int): Chats that got a pre-warmed conversation.
+        misses (int): Chats created on demand (nothing pre-warmed for the partner).
+        expired (int): Pre-warmed conversations dropped because they outlived the TTL.
+        failures (int): Pre-warming requests that failed (those chats fall back to on-demand creation).
+        rejected (int): Pre-warming requests ignored because the pool was full.
+        size (int): Conversations currently pre-warmed or being created.
+    """
+    hits: int
+    misses: int
+    expired: int
+    failures: int
+    rejected: int
+    size: int
+
+
+class _Entry:
+    def __init__(self, chat_data: Dict[str, Any], future: Future):
+        self.chat_data = chat_data
+        self.future = future
+        self.ready_at: Optional[float] = None
+
+
+class ConversationPool:
+    """
+    Creates conversations in the background ahead of the first message of a partner.
+
+    The GAME API binds a conversation to its partner when it is created, so conversations
+    are pre-warmed per partner: announce partners who are likely to write soon (e.g. when they
+    join a group or open the bot) with ``prewarm``, and ``acquire`` hands over their
+    conversation as soon as it is needed, waiting for it if it is still being created.
+    Partners that were not announced, expired entries and failed creations fall back to
+    on-demand creation by the caller.
+
+    Args:
+        create_fn (Callable[[Dict[str, Any]], str]): Creates a conversation from its creation
+            payload (prompt, partner id and name) and returns its id.
+        max_size (int): Maximum number of pre-warmed (or in-progress) conversations.
+        ttl (float): Seconds a pre-warmed conversation stays usable after it was created.
+        max_workers (int): Conversations created in parallel in the background.
+    """
+    def __init__(
+        self,
+        create_fn: Callable[[Dict[str, Any]], str],
+        max_size: int = 100,
+        ttl: float = 600.0,
+        max_workers: int = 4,
+    ):
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+
+        self.create_fn = create_fn
+        self.max_size = max_size
+        self.ttl = ttl
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="game_sdk_conversation")
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._expired = 0
+        self._failures = 0
+        self._rejected = 0
+        self._closed = False
+
+    def prewarm(self, partner_id: str, chat_data: Dict[str, Any]) -> bool:
+        """
+        Starts creating a conversation for the partner in the background; returns False if
+        the pool is full or closed (a partner that already has one is not counted twice)
+        """
+        with self._lock:
+            self._purge_expired()
+            if self._closed:
+                return False
+            if partner_id in self._entries:
+                return True
+            if len(self._entries) >= self.max_size:
+                self._rejected += 1
+                return False
+
+            future = self._executor.submit(self.create_fn, chat_data)
+            entry = _Entry(chat_data, future)
+            self._entries[partner_id] = entry
+        future.add_done_callback(lambda f: self._on_created(partner_id, entry, f))
+        return True
+
+    def acquire(self, partner_id: str, chat_data: Dict[str, Any]) -> Optional["Future[str]"]:
+        """
+        Takes the partner's pre-warmed conversation out of the pool: returns a future of its
+        id (possibly still being created), or None if the caller has to create one
+        """
+        with self._lock:
+            self._purge_expired()
+            entry = self._entries.pop(partner_id, None)
+            # e.g. a conversation created under another partner name or an older prompt
+            if entry is None or entry.chat_data != chat_data:
+                self._misses += 1
+                return None
+            self._hits += 1
+            return entry.future
+
+    def stats(self) -> PoolStats:
+        with self._lock:
+            self._purge_expired()
+            return PoolStats(
+                hits=self._hits,
+                misses=self._misses,
+                expired=self._expired,
+                failures=self._failures,
+                rejected=self._rejected,
+                size=len(self._entries),
+            )
+
+    def close(self):
+        """
+        Stops pre-warming and drops the conversations not handed out yet
+        """
+        with self._lock:
+            self._closed = True
+            entries = list(self._entries.values())
+            self._entries.clear()
+        for entry in entries:
+            entry.future.cancel()
+        self._executor.shutdown(wait=False)
+
+    def _on_created(self, partner_id: str, entry: _Entry, future: Future):
+        with self._lock:
+            if future.cancelled() or future.exception() is not None:
+                self._failures += int(not future.cancelled())
+                if self._entries.get(partner_id) is entry:
+                    del self._entries[partner_id]
+            else:
+                entry.ready_at = time.monotonic()
+
+    def _purge_expired(self):
+        now = time.monotonic()
+        expired = [
+            partner_id for partner_id, entry in self._entries.items()
+            if entry.ready_at is not None and now - entry.ready_at > self.ttl
+        ]
+        for partner_id in expired:
+            del self._entries[partner_id]
+            self._expired += 1
+
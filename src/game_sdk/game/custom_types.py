@@ -1,10 +1,18 @@
+import concurrent.futures
+import functools
+import inspect
+import itertools
 import json
-from typing import Any, Dict, Optional, List, Union, Sequence, Callable, Tuple
-from pydantic import BaseModel, Field
+from typing import Any, Awaitable, Dict, Optional, List, Union, Sequence, Callable, Tuple
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, TypeAdapter
 from enum import Enum
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 
+from game_sdk.game import events
+from game_sdk.game.execution import get_default_executor
+from game_sdk.game.result_cache import ResultCache
+
 
 class Argument(BaseModel):
     """
@@ -47,6 +55,16 @@ class FunctionResult(BaseModel):
     feedback_message: Optional[str] = None
     info: Optional[Dict[str, Any]] = None
 
+    # name of the Function that produced the result (not sent to GAME)
+    _fn_name: Optional[str] = PrivateAttr(default=None)
+
+    @property
+    def fn_name(self) -> Optional[str]:
+        """
+        Name of the function that produced this result, if it came from ``Function.execute``
+        """
+        return self._fn_name
+
     def __str__(self) -> str:
         output = (
             f"➡️  Function Result:\n"
@@ -57,6 +75,28 @@ class FunctionResult(BaseModel):
         )
         return output
 
+# Function fields that only affect local execution, not the definition sent to GAME
+_LOCAL_FIELDS = frozenset({"executable", "timeout", "executor", "cache"})
+
+# bumped whenever a Function's definition changes, so lists of definitions (see
+# payload.FunctionCatalog) can be validated without visiting every function
+_definition_versions = itertools.count(1)
+_definition_version = 0
+
+
+def get_definition_version() -> int:
+    """
+    Returns a number that changes whenever the definition of any ``Function`` is invalidated
+    """
+    return _definition_version
+
+
+class _FunctionTimeout(Exception):
+    """
+    Raised when an executable outlives ``Function.timeout`` (and only then)
+    """
+
+
 class Function(BaseModel):
     """
     Defines a callable function within the GAME SDK.
@@ -69,26 +109,87 @@ class Function(BaseModel):
         fn_description (str): Detailed description of what the function does.
         args (List[Argument]): List of arguments the function accepts.
         hint (Optional[str]): Optional usage hint or example.
-        executable (Callable): The actual function implementation to be called.
+        executable (Callable): The actual function implementation to be called. May be a
+            coroutine function.
+        timeout (Optional[float]): Seconds after which the execution is abandoned and a FAILED
+            result is returned. Coroutine executables are cancelled; a plain executable runs on
+            the executor and keeps running in the background, as threads cannot be interrupted.
+        executor (Optional[Executor]): Thread or process pool the executable runs on when it
+            has a timeout or is run via ``aexecute`` (defaults to ``get_default_executor()``).
+            A process pool requires a picklable, module-level executable.
+        cache (Optional[ResultCache]): Opt-in memoization of successful results by arguments,
+            for side-effect free executables such as searches or price lookups.
+
+    The function definition sent to GAME is computed once and cached; assigning any of
+    the fields above invalidates it. In-place changes to nested values (e.g. editing an
+    ``Argument`` in ``args``) are not detected - call ``invalidate_function_def`` after them.
     """
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     fn_name: str
     fn_description: str
     args: List[Argument]
     hint: Optional[str] = None
     
     # Make executable required but with a default value
-    executable: Callable[..., Tuple[FunctionResultStatus, str, dict]] = Field(
+    executable: Callable[..., Union[
+        Tuple[FunctionResultStatus, str, dict],
+        Awaitable[Tuple[FunctionResultStatus, str, dict]],
+    ]] = Field(
         default_factory=lambda: Function._default_executable
     )
 
-    def get_function_def(self):
+    # how the executable is run locally - not part of the definition sent to GAME
+    timeout: Optional[float] = Field(default=None, exclude=True)
+    executor: Optional[concurrent.futures.Executor] = Field(default=None, exclude=True)
+    cache: Optional[ResultCache] = Field(default=None, exclude=True)
+
+    _function_def: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+    _function_def_json: Optional[bytes] = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        if name in type(self).model_fields and name not in _LOCAL_FIELDS:
+            self.invalidate_function_def()
+
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> "Function":
+        copy = super().model_copy(update=update, deep=deep)
+        if update:
+            copy.invalidate_function_def()
+        return copy
+
+    def get_function_def(self) -> Dict[str, Any]:
         """
         Returns the function definition without the executable component.
 
+        The definition is cached, so the returned dict must be treated as read-only.
+
         Returns:
             dict: Function metadata excluding the executable field.
         """
-        return self.model_dump(exclude={'executable'})
+        if self._function_def is None:
+            self._function_def = self.model_dump(exclude={'executable'})
+        return self._function_def
+
+    def get_function_def_json(self) -> bytes:
+        """
+        Returns the function definition pre-encoded as JSON bytes (cached like ``get_function_def``).
+
+        Returns:
+            bytes: UTF-8 encoded JSON of the function definition.
+        """
+        if self._function_def_json is None:
+            self._function_def_json = json.dumps(self.get_function_def()).encode()
+        return self._function_def_json
+
+    def invalidate_function_def(self):
+        """
+        Clears the cached function definition so it is rebuilt on next use.
+        """
+        global _definition_version
+        self._function_def = None
+        self._function_def_json = None
+        _definition_version = next(_definition_versions)
 
     @staticmethod
     def _default_executable(**kwargs) -> Tuple[FunctionResultStatus, str, dict]:
@@ -117,34 +218,152 @@ class Function(BaseModel):
         """
         fn_id = kwds.get('fn_id')
         args = kwds.get('args', {})
-        print(f"Function Args: {args}")
-        print(f"Function ID: {fn_id}")
+        events.emit("function_call", fn_id=fn_id, args=args)
         try:
-            # Extract values from the nested dictionary structure
-            processed_args = {}
-            for arg_name, arg_value in args.items():
-                if isinstance(arg_value, dict) and 'value' in arg_value:
-                    processed_args[arg_name] = arg_value['value']
-                else:
-                    processed_args[arg_name] = arg_value
-                    
-            # print("Processed args: ", processed_args)
+            processed_args = self._process_args(args)
+
+            cached = self.cache.get(processed_args) if self.cache is not None else None
+            if cached is not None:
+                status, feedback, info = cached
             # execute the function provided
-            status, feedback, info = self.executable(**processed_args)
-
-            return FunctionResult(
-                action_id=fn_id,
-                action_status=status,
-                feedback_message=feedback,
-                info=info,
-            )
+            elif inspect.iscoroutinefunction(self.executable):
+                status, feedback, info = self._run_coroutine(processed_args)
+            elif self.timeout is None and self.executor is None:
+                status, feedback, info = self.executable(**processed_args)
+            else:
+                future = (self.executor or get_default_executor()).submit(self.executable, **processed_args)
+                try:
+                    status, feedback, info = future.result(timeout=self.timeout)
+                except concurrent.futures.TimeoutError:
+                    if future.done():
+                        raise  # raised by the executable itself
+                    future.cancel()
+                    raise _FunctionTimeout() from None
+
+            result = self._result(fn_id, status, feedback, info)
+        except _FunctionTimeout:
+            return self._timeout_result(fn_id)
+        except Exception as e:
+            return self._result(fn_id, FunctionResultStatus.FAILED, f"Error executing function: {str(e)}", {})
+
+        # outside the try, so a caching error cannot turn a successful call into a failure
+        if cached is None:
+            self._cache_result(fn_id, processed_args, status, feedback, info)
+        return result
+
+    async def aexecute(self, **kwds: Any) -> FunctionResult:
+        """
+        asyncio counterpart of ``execute``.
+
+        Coroutine executables are awaited on the running loop (and cancelled on timeout);
+        plain executables run on the function's executor so the loop is never blocked.
+        """
+        # asyncio is only imported by async code paths (it is already loaded when they run)
+        import asyncio
+
+        fn_id = kwds.get('fn_id')
+        args = kwds.get('args', {})
+        events.emit("function_call", fn_id=fn_id, args=args)
+        try:
+            processed_args = self._process_args(args)
+
+            cached = self.cache.get(processed_args) if self.cache is not None else None
+            if cached is not None:
+                status, feedback, info = cached
+            else:
+                if inspect.iscoroutinefunction(self.executable):
+                    awaitable = self.executable(**processed_args)
+                else:
+                    loop = asyncio.get_running_loop()
+                    awaitable = loop.run_in_executor(
+                        self.executor or get_default_executor(),
+                        functools.partial(self.executable, **processed_args),
+                    )
+                status, feedback, info = await self._await_with_timeout(awaitable)
+
+            result = self._result(fn_id, status, feedback, info)
+        except _FunctionTimeout:
+            return self._timeout_result(fn_id)
         except Exception as e:
-            return FunctionResult(
-                action_id=fn_id,
-                action_status=FunctionResultStatus.FAILED,
-                feedback_message=f"Error executing function: {str(e)}",
-                info={},
-            )
+            return self._result(fn_id, FunctionResultStatus.FAILED, f"Error executing function: {str(e)}", {})
+
+        if cached is None:
+            self._cache_result(fn_id, processed_args, status, feedback, info)
+        return result
+
+    @staticmethod
+    def _process_args(args: Dict[str, Any]) -> Dict[str, Any]:
+        # Extract values from the nested dictionary structure
+        processed_args = {}
+        for arg_name, arg_value in args.items():
+            if isinstance(arg_value, dict) and 'value' in arg_value:
+                processed_args[arg_name] = arg_value['value']
+            else:
+                processed_args[arg_name] = arg_value
+        return processed_args
+
+    def _result(self, fn_id: Optional[str], status: Any, feedback: str, info: dict) -> FunctionResult:
+        result = FunctionResult(
+            action_id=fn_id,
+            action_status=status,
+            feedback_message=feedback,
+            info=info,
+        )
+        result._fn_name = self.fn_name
+        return result
+
+    def _cache_result(self, fn_id: Optional[str], processed_args: Dict[str, Any], status: Any, feedback: str, info: dict):
+        # failures are not cached, so a transient error is retried on the next call
+        if self.cache is None or status != FunctionResultStatus.DONE:
+            return
+        try:
+            self.cache.put(processed_args, (status, feedback, info))
+        except Exception as e:
+            # the call itself succeeded - it is just not memoized
+            events.emit("function_cache_error", fn_id=fn_id, fn_name=self.fn_name, error=e)
+
+    async def _await_with_timeout(self, awaitable: Awaitable) -> Any:
+        """
+        Awaits the executable, raising ``_FunctionTimeout`` (and cancelling it) if it outlives
+        the timeout - unlike ``asyncio.wait_for``, a ``TimeoutError`` the executable raises
+        itself is not mistaken for one
+        """
+        import asyncio
+
+        task = asyncio.ensure_future(awaitable)
+        try:
+            done, _ = await asyncio.wait({task}, timeout=self.timeout)
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+        if not done:
+            task.cancel()
+            raise _FunctionTimeout()
+        return task.result()
+
+    def _run_coroutine(self, processed_args: Dict[str, Any]) -> Tuple[FunctionResultStatus, str, dict]:
+        """
+        Runs a coroutine executable to completion from synchronous code
+        """
+        import asyncio
+
+        async def run():
+            return await self._await_with_timeout(self.executable(**processed_args))
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(run())
+        # called synchronously from inside an event loop - run on a fresh loop in another thread
+        return get_default_executor().submit(asyncio.run, run()).result()
+
+    def _timeout_result(self, fn_id: Optional[str]) -> FunctionResult:
+        return self._result(
+            fn_id,
+            FunctionResultStatus.FAILED,
+            f"Error executing function: '{self.fn_name}' timed out after {self.timeout} seconds",
+            {},
+        )
         
     def __str__(self) -> str:
         output = (
@@ -382,11 +601,36 @@ class AgentStateResponse:
         )
         return output
 
+class _ActionResponseControl(BaseModel):
+    """
+    The fields of an ActionResponse a step needs right away; agent_state must be present,
+    but its contents are only validated on first access
+    """
+    action_type: ActionType
+    agent_state: Dict[str, Any]
+    action_args: Optional[Dict[str, Any]] = None
+    reaction_info: Optional[str] = None
+    agents: Optional[List[str]] = None
+
+
+_agent_state_adapter: Optional[TypeAdapter] = None
+
+
+def _validate_agent_state(raw: Any) -> AgentStateResponse:
+    global _agent_state_adapter
+    if _agent_state_adapter is None:
+        _agent_state_adapter = TypeAdapter(AgentStateResponse)
+    return _agent_state_adapter.validate_python(raw)
+
+
 # ActionResponse format returned from GAME API call
 class ActionResponse(BaseModel):
     """
     Represents the response format from the GAME API when selecting an Action.
 
+    ``from_response``/``from_json`` validate the control fields right away and the
+    (potentially large) ``agent_state`` tree only when it is first accessed.
+
     Attributes:
         action_type (ActionType): Type of action.
         agent_state (AgentStateResponse): Agent state response.
@@ -400,6 +644,62 @@ class ActionResponse(BaseModel):
     reaction_info: Optional[str] = None
     agents: Optional[List[str]] = None
 
+    # raw agent_state of a lazily parsed response, validated on first access
+    _raw_agent_state: Any = PrivateAttr(default=None)
+
+    @classmethod
+    def from_response(cls, data: Dict[str, Any]) -> "ActionResponse":
+        """
+        Parses the ``data`` of an action response, deferring the validation of ``agent_state``
+        """
+        return cls._from_control(_ActionResponseControl.model_validate(data))
+
+    @classmethod
+    def from_json(cls, raw: Union[str, bytes]) -> "ActionResponse":
+        """
+        Like ``from_response``, but parses the JSON of the response ``data`` directly
+        """
+        return cls._from_control(_ActionResponseControl.model_validate_json(raw))
+
+    @classmethod
+    def _from_control(cls, control: _ActionResponseControl) -> "ActionResponse":
+        response = cls.model_construct(
+            action_type=control.action_type,
+            action_args=control.action_args,
+            reaction_info=control.reaction_info,
+            agents=control.agents,
+        )
+        response._raw_agent_state = control.agent_state
+        return response
+
+    def __getattr__(self, name: str) -> Any:
+        # only reached while a lazily parsed agent_state is not in __dict__ yet
+        if name == "agent_state":
+            agent_state = _validate_agent_state(self._raw_agent_state)
+            # keep the declared field order (it is the order fields are serialized in)
+            values = {**self.__dict__, "agent_state": agent_state}
+            self.__dict__.clear()
+            self.__dict__.update({name: values[name] for name in type(self).model_fields if name in values})
+            self.__pydantic_fields_set__.add("agent_state")
+            self._raw_agent_state = None
+            return agent_state
+        return super().__getattr__(name)
+
+    def __eq__(self, other: Any) -> bool:
+        # pydantic compares __dict__, which lacks a lazily parsed agent_state until it is read
+        if isinstance(other, ActionResponse):
+            self.agent_state
+            other.agent_state
+        return super().__eq__(other)
+
+    def model_dump(self, **kwargs: Any) -> Dict[str, Any]:
+        self.agent_state  # materialize a lazily parsed agent_state
+        return super().model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs: Any) -> str:
+        self.agent_state
+        return super().model_dump_json(**kwargs)
+
     def __str__(self) -> str:
         output = (
             f"📋 Action Response".center(50, '=') + "\n" + \
@@ -436,3 +736,27 @@ class ChatResponse(BaseModel):
     message: str
     is_finished: bool
     function_call: Optional[FunctionCallResponse] = None
+
+class ChatStreamEventType(Enum):
+    """
+    Types of the events yielded by ``Chat.stream``.
+
+    Values:
+        MESSAGE_DELTA: The next piece of the agent's message
+        FUNCTION_CALL: The agent called a function (it starts running right away)
+        FUNCTION_RESULT: The function returned and its result is being reported
+        DONE: The turn is complete
+    """
+    MESSAGE_DELTA = "message_delta"
+    FUNCTION_CALL = "function_call"
+    FUNCTION_RESULT = "function_result"
+    DONE = "done"
+
+class ChatStreamEvent(BaseModel):
+    type: ChatStreamEventType
+    delta: Optional[str] = None
+    fn_name: Optional[str] = None
+    fn_args: Optional[Dict[str, Any]] = None
+    result: Optional[FunctionResult] = None
+    # the same response Chat.next would have returned, set on DONE
+    response: Optional[ChatResponse] = None
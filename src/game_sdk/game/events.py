@@ -0,0 +1,264 @@
+import contextlib
+import contextvars
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+def _format_agent_step(data: Dict[str, Any]) -> Tuple[Optional[str], str]:
+    return "👟 Agent Step", f"{data['action_response']}"
+
+
+def _format_task_generated(data: Dict[str, Any]) -> Tuple[Optional[str], str]:
+    return "New Task Generated", f"{data['current_task']}"
+
+
+def _format_agent_action(data: Dict[str, Any]) -> Tuple[Optional[str], str]:
+    action_response = data["action_response"]
+    action_type = action_response.action_type.value
+
+    if action_type in ("call_function", "continue_function"):
+        function = data["function"]
+        out = (
+            f"👷 Worker: {data['worker_id']}\n"
+            f"🔧 Function Name: {function.fn_name}\n"
+            f"📋 Function Description: {function.fn_description}\n"
+            f"🔠 Function Arguments: {action_response.action_args.get('args', {})}\n"
+            f"🏭 Function Results:\n{data['function_result']}\n"
+        )
+    elif action_type == "wait":
+        out = "🔄 Waiting...Task ended completed or ended (not possible with current actions)"
+    elif action_type == "go_to":
+        out = f"🚶 Going to... {action_response.action_args['location_id']}"
+    else:
+        out = f"🚫 Unknown action type: {action_type}"
+
+    return f"Action Type: {action_type}", out
+
+
+def _format_function_call(data: Dict[str, Any]) -> Tuple[Optional[str], str]:
+    return None, f"Function Args: {data['args']}\nFunction ID: {data['fn_id']}"
+
+
+def _format_worker_step(data: Dict[str, Any]) -> Tuple[Optional[str], str]:
+    action_response = data["action_response"]
+    return None, f"Action response: {action_response}\nAction type: {action_response.action_type}"
+
+
+def _format_worker_function_result(data: Dict[str, Any]) -> Tuple[Optional[str], str]:
+    return None, f"Function result: {data['function_result']}"
+
+
+def _format_worker_task_ended(data: Dict[str, Any]) -> Tuple[Optional[str], str]:
+    return None, "Task completed or ended (not possible)"
+
+
+def _format_function_cache_error(data: Dict[str, Any]) -> Tuple[Optional[str], str]:
+    return None, f"Could not cache the result of '{data['fn_name']}': {data['error']}"
+
+
+def _format_checkpoint_error(data: Dict[str, Any]) -> Tuple[Optional[str], str]:
+    return None, f"Could not save checkpoint {data['path']}: {data['error']}"
+
+
+# event kind -> formatter returning (panel title or None for plain text, message)
+FORMATTERS: Dict[str, Callable[[Dict[str, Any]], Tuple[Optional[str], str]]] = {
+    "agent_step": _format_agent_step,
+    "task_generated": _format_task_generated,
+    "agent_action": _format_agent_action,
+    "function_call": _format_function_call,
+    "worker_step": _format_worker_step,
+    "worker_function_result": _format_worker_function_result,
+    "worker_task_ended": _format_worker_task_ended,
+    "function_cache_error": _format_function_cache_error,
+    "checkpoint_error": _format_checkpoint_error,
+}
+
+
+class Event:
+    """
+    Something that happened during a step, e.g. an action received from GAME.
+
+    Events hold the raw objects (``ActionResponse``, ``FunctionResult``, ...) in ``data``;
+    they are only turned into text when a sink asks for ``title``/``message``.
+
+    Attributes:
+        kind (str): Event kind, e.g. ``"agent_step"`` or ``"function_call"`` (see ``FORMATTERS``).
+        source_id (Optional[str]): Id of the agent or worker that emitted the event.
+        data (Dict[str, Any]): The objects describing the event.
+        timestamp (float): ``time.time()`` when the event was emitted.
+    """
+    __slots__ = ("kind", "source_id", "data", "timestamp", "_formatted")
+
+    def __init__(self, kind: str, source_id: Optional[str], data: Dict[str, Any]):
+        self.kind = kind
+        self.source_id = source_id
+        self.data = data
+        self.timestamp = time.time()
+        self._formatted: Optional[Tuple[Optional[str], str]] = None
+
+    def _format(self) -> Tuple[Optional[str], str]:
+        if self._formatted is None:
+            formatter = FORMATTERS.get(self.kind)
+            self._formatted = formatter(self.data) if formatter else (None, f"{self.kind}: {self.data}")
+        return self._formatted
+
+    @property
+    def title(self) -> Optional[str]:
+        return self._format()[0]
+
+    @property
+    def message(self) -> str:
+        return self._format()[1]
+
+    def __str__(self) -> str:
+        title, message = self._format()
+        return f"{title}\n{message}" if title else message
+
+
+class EventSink(ABC):
+    """
+    Receives the events of an ``EventBus``.
+    """
+    @abstractmethod
+    def emit(self, event: Event):
+        """
+        Handles an event (called from the thread that ran the step)
+        """
+
+
+class ConsoleSink(EventSink):
+    """
+    Prints events to stdout the way the SDK always has: agent events as rich panels,
+    worker and function events as plain lines.
+    """
+    def __init__(self):
+        self._rich = None
+
+    def emit(self, event: Event):
+        title, message = event.title, event.message
+        if title is None:
+            print(message)
+            return
+
+        if self._rich is None:
+            # rich is only needed once something is actually rendered
+            from rich import box, print as rich_print
+            from rich.panel import Panel
+            self._rich = (rich_print, Panel, box.ROUNDED)
+        rich_print, Panel, rounded = self._rich
+        rich_print(Panel(message, title=title, box=rounded, title_align="left"))
+
+
+class LoggingSink(EventSink):
+    """
+    Forwards events to a ``logging`` logger; they are only formatted if the level is enabled.
+
+    Args:
+        logger (Optional[logging.Logger]): Logger to use (defaults to ``game_sdk.events``).
+        level (int): Level the events are logged at.
+    """
+    def __init__(self, logger: Optional[logging.Logger] = None, level: int = logging.INFO):
+        self.logger = logger or logging.getLogger("game_sdk.events")
+        self.level = level
+
+    def emit(self, event: Event):
+        if self.logger.isEnabledFor(self.level):
+            self.logger.log(self.level, "%s", event, extra={"event_kind": event.kind, "source_id": event.source_id})
+
+
+_current_bus: contextvars.ContextVar[Optional["EventBus"]] = contextvars.ContextVar(
+    "game_sdk_current_event_bus", default=None
+)
+
+
+class EventBus:
+    """
+    Dispatches step events to the attached sinks.
+
+    An event is only created when at least one sink is attached, so a bus without
+    sinks makes the step loop headless: no formatting and no stdout writes.
+
+    Args:
+        sinks (Optional[List[EventSink]]): Sinks receiving the events.
+
+    Example:
+        ```python
+        # headless, e.g. when running many agents in one process
+        agent = Agent(..., events=EventBus())
+
+        # log instead of printing, for every agent without its own bus
+        set_default_event_bus(EventBus([LoggingSink()]))
+        ```
+    """
+    def __init__(self, sinks: Optional[List[EventSink]] = None):
+        self._sinks: Tuple[EventSink, ...] = tuple(sinks or ())
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._sinks)
+
+    def add_sink(self, sink: EventSink):
+        with self._lock:
+            self._sinks = self._sinks + (sink,)
+
+    def remove_sink(self, sink: EventSink):
+        with self._lock:
+            self._sinks = tuple(s for s in self._sinks if s is not sink)
+
+    def emit(self, kind: str, source_id: Optional[str] = None, **data: Any):
+        """
+        Sends an event of ``kind`` to every sink (does nothing without sinks)
+        """
+        sinks = self._sinks
+        if not sinks:
+            return
+        event = Event(kind, source_id, data)
+        for sink in sinks:
+            sink.emit(event)
+
+    @contextlib.contextmanager
+    def activate(self):
+        """
+        Makes this the bus used by ``emit`` (e.g. in ``Function.execute``) within the block
+        """
+        token = _current_bus.set(self)
+        try:
+            yield self
+        finally:
+            _current_bus.reset(token)
+
+
+_default_bus = EventBus([ConsoleSink()])
+
+
+def get_default_event_bus() -> EventBus:
+    """
+    Returns the process-wide bus used by agents and workers created without one
+    """
+    return _default_bus
+
+
+def set_default_event_bus(bus: Optional[EventBus]):
+    """
+    Replaces the process-wide bus (``None`` resets it to printing to the console)
+    """
+    global _default_bus
+    _default_bus = bus if bus is not None else EventBus([ConsoleSink()])
+
+
+def current_event_bus() -> EventBus:
+    """
+    Returns the bus activated in this context, or the process-wide one
+    """
+    return _current_bus.get() or _default_bus
+
+
+def emit(kind: str, source_id: Optional[str] = None, **data: Any):
+    """
+    Emits an event on the current bus
+    """
+    current_event_bus().emit(kind, source_id, **data)
@@ -0,0 +1,29 @@
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Optional
+
+_default_executor: Optional[Executor] = None
+_default_executor_lock = threading.Lock()
+
+
+def get_default_executor() -> Executor:
+    """
+    Returns the process-wide pool that runs function executables with a timeout
+    (or from ``aexecute``) when the ``Function`` has no executor of its own
+    """
+    global _default_executor
+    with _default_executor_lock:
+        if _default_executor is None:
+            _default_executor = ThreadPoolExecutor(thread_name_prefix="game_sdk_function")
+        return _default_executor
+
+
+def set_default_executor(executor: Optional[Executor]):
+    """
+    Replaces the process-wide function pool, e.g. with a larger ``ThreadPoolExecutor`` or a
+    ``ProcessPoolExecutor`` for CPU-bound executables (``None`` resets it to a fresh default
+    on next use). The previous pool is not shut down.
+    """
+    global _default_executor
+    with _default_executor_lock:
+        _default_executor = executor
@@ -0,0 +1,113 @@
+import itertools
+import threading
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from game_sdk.game.custom_types import Function, get_definition_version
+
+_action_space_versions = itertools.count(1)
+
+
+class ActionSpace(dict):
+    """
+    Functions available to a worker, keyed by name.
+
+    A plain dict that takes a new ``version`` whenever a function is added, removed or
+    replaced, so a ``FunctionCatalog`` can tell in O(1) whether it changed.
+    """
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.version = next(_action_space_versions)
+
+    def _changed(self):
+        self.version = next(_action_space_versions)
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._changed()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._changed()
+
+    def __ior__(self, other):
+        result = super().__ior__(other)
+        self._changed()
+        return result
+
+    def pop(self, *args):
+        result = super().pop(*args)
+        self._changed()
+        return result
+
+    def popitem(self):
+        result = super().popitem()
+        self._changed()
+        return result
+
+    def setdefault(self, key, default=None):
+        result = super().setdefault(key, default)
+        self._changed()
+        return result
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._changed()
+
+    def clear(self):
+        super().clear()
+        self._changed()
+
+    def __copy__(self) -> "ActionSpace":
+        return ActionSpace(self)
+
+
+class FunctionCatalog:
+    """
+    Cache of the serialized function definitions sent with every step.
+
+    Each action space (keyed by worker) is collected once and the same list is reused
+    for later steps until the action space changes, i.e. a function is added, removed,
+    replaced or has its (memoized) definition invalidated. For an ``ActionSpace`` this is
+    checked by comparing version numbers; a plain dict is compared function by function.
+
+    Example:
+        ```python
+        catalog = FunctionCatalog()
+        data["functions"] = catalog.get(worker.id, worker.action_space)
+        ```
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[Hashable, Tuple[Dict[str, Function], Tuple, List[Dict]]] = {}
+
+    def get(self, key: Hashable, action_space: Dict[str, Function]) -> List[Dict]:
+        """
+        Returns the function definitions of ``action_space``, serializing them only if it changed
+        """
+        fingerprint = self._fingerprint(action_space)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry[0] is action_space and entry[1] == fingerprint:
+            return entry[2]
+
+        function_defs = [f.get_function_def() for f in action_space.values()]
+        with self._lock:
+            self._entries[key] = (action_space, fingerprint, function_defs)
+        return function_defs
+
+    def invalidate(self, key: Optional[Hashable] = None):
+        """
+        Drops the cached definitions of one action space (or all of them)
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    @staticmethod
+    def _fingerprint(action_space: Dict[str, Function]) -> Tuple:
+        if isinstance(action_space, ActionSpace):
+            return action_space.version, get_definition_version()
+        # definitions are memoized on each Function and rebuilt (as a new dict) when it changes
+        return tuple((name, id(f.get_function_def())) for name, f in action_space.items())
@@ -0,0 +1,172 @@
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from typing import Callable, Dict, Iterator, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class RegistrationCache:
+    """
+    Opt-in on-disk registry of remote agent and map (worker set) ids.
+
+    Registrations are keyed by a content hash of everything the API receives
+    (name/description/goal for agents, worker ids and descriptions for maps) plus a
+    hash of the API key and base URL, so an unchanged agent reuses its ``agent_id`` and
+    ``map_id`` across process restarts while any change in its definition registers a
+    new one. The file is rewritten atomically, and every update re-reads and merges it
+    under a lock file (``<path>.lock``), so a whole fleet of processes can share one
+    registry. Registering a definition holds a lock of its own (in ``.<name>.locks/`` next
+    to the file), so concurrent callers register it once and the others reuse its id.
+
+    Args:
+        path (str): Path of the JSON registry file (created on first write).
+
+    Example:
+        ```python
+        registry = RegistrationCache("~/.game_sdk/registrations.json")
+        agent = Agent(api_key=..., name=..., ..., registry=registry)
+        ```
+    """
+    def __init__(self, path: str):
+        self.path = os.path.expanduser(path)
+        self._lock = threading.Lock()
+        self._entries: Dict[str, str] = self._read()
+
+    @staticmethod
+    def agent_key(client, name: str, description: str, goal: str) -> str:
+        return RegistrationCache._hash(client, {
+            "kind": "agent",
+            "name": name,
+            "description": description,
+            "goal": goal,
+        })
+
+    @staticmethod
+    def map_key(client, workers: List) -> str:
+        return RegistrationCache._hash(client, {
+            "kind": "map",
+            "locations": [[w.id, w.worker_description] for w in workers],
+        })
+
+    def get_or_create_agent(self, client, name: str, description: str, goal: str) -> str:
+        """
+        Returns the cached agent id for this definition, registering the agent if there is none
+        """
+        return self._get_or_create(
+            self.agent_key(client, name, description, goal),
+            lambda: client.create_agent(name, description, goal),
+        )
+
+    def get_or_create_map(self, client, workers: List) -> str:
+        """
+        Returns the cached map id for this set of workers, registering it if there is none
+        """
+        return self._get_or_create(
+            self.map_key(client, workers),
+            lambda: client.create_workers(workers),
+        )
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            return self._entries.get(key)
+
+    def set(self, key: str, remote_id: str):
+        with self._lock:
+            self._update(updates={key: remote_id})
+
+    def invalidate(self, key: str):
+        """
+        Forgets a registration, e.g. after its remote id was rejected by the API
+        """
+        with self._lock:
+            self._update(removals=[key])
+
+    def clear(self):
+        with self._lock, _file_lock(self.path + ".lock"):
+            self._entries = {}
+            self._dump({})
+
+    def _get_or_create(self, key: str, create: Callable[[], str]) -> str:
+        remote_id = self.get(key)
+        if remote_id is not None:
+            return remote_id
+
+        directory, name = os.path.split(self.path)
+        with _file_lock(os.path.join(directory, f".{name}.locks", f"{key[:32]}.lock")):
+            # another thread or process may have registered it while we waited
+            remote_id = self._read().get(key)
+            if remote_id is None:
+                remote_id = create()
+                self.set(key, remote_id)
+            else:
+                with self._lock:
+                    self._entries[key] = remote_id
+        return remote_id
+
+    @staticmethod
+    def _hash(client, content: Dict) -> str:
+        content = {
+            "api_key": hashlib.sha256(client.api_key.encode()).hexdigest(),
+            "base_url": getattr(client, "base_url", None),
+            **content,
+        }
+        return hashlib.sha256(json.dumps(content, sort_keys=True).encode()).hexdigest()
+
+    def _read(self) -> Dict[str, str]:
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _update(self, updates: Optional[Dict[str, str]] = None, removals: List[str] = ()):
+        # merge with entries written by other processes since we last read the file
+        with _file_lock(self.path + ".lock"):
+            entries = self._read()
+            entries.update(updates or {})
+            for key in removals:
+                entries.pop(key, None)
+            self._entries = entries
+            self._dump(entries)
+
+    def _dump(self, entries: Dict[str, str]):
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".registry-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+@contextlib.contextmanager
+def _file_lock(path: str) -> Iterator[None]:
+    """
+    Holds an exclusive lock on ``path`` (created if needed), across threads and processes
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
@@ -0,0 +1,197 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+
+class CircuitOpenError(ValueError):
+    """
+    Raised when a call is rejected locally because its endpoint's circuit breaker is open.
+    """
+
+
+class CircuitBreaker:
+    """
+    Per-endpoint circuit breaker.
+
+    After ``failure_threshold`` consecutive failures the breaker opens and calls are
+    rejected without touching the network. Once ``recovery_timeout`` seconds have
+    passed a single trial call is let through (half-open): success closes the breaker,
+    failure opens it again.
+
+    Args:
+        failure_threshold (int): Consecutive failures that open the breaker.
+        recovery_timeout (float): Seconds to stay open before allowing a trial call.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    def allow_request(self) -> bool:
+        """
+        Returns whether a call may go out now (claims the trial slot when half-open)
+        """
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+                # only one trial call at a time
+                self._state = self.HALF_OPEN
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+
+
+class ResiliencePolicy:
+    """
+    Retry, backoff and circuit breaking policy for GAME API calls.
+
+    Failed attempts are retried with exponential backoff and full jitter, honouring a
+    ``Retry-After`` header on 429/503. Idempotent operations are retried on any
+    retryable status, timeout or connection error; non-idempotent ones (e.g. creating
+    agents, fetching the next action or posting chat messages) only when the request
+    cannot have been processed, i.e. connection failures and 429/503 rejections. Each
+    named operation gets its own circuit breaker per API host (see ``breaker_key``),
+    shared by every client using the policy.
+
+    Args:
+        max_retries (int): Maximum number of retries after the first attempt.
+        backoff_base (float): Backoff in seconds before the first retry; doubles each retry.
+        backoff_max (float): Upper bound in seconds for a single backoff.
+        jitter (bool): Whether to apply full jitter to the backoff.
+        max_retry_after (float): Upper bound in seconds for a server ``Retry-After``.
+        failure_threshold (int): Consecutive failures that open an operation's breaker.
+        recovery_timeout (float): Seconds an open breaker waits before a trial call.
+    """
+    RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+    # statuses that guarantee the request was not processed
+    REJECTED_STATUSES = frozenset({429, 503})
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        jitter: bool = True,
+        max_retry_after: float = 60.0,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+    ):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.max_retry_after = max_retry_after
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._breakers_lock = threading.Lock()
+
+    @staticmethod
+    def breaker_key(url: str, operation: Optional[str]) -> Optional[str]:
+        """
+        Names the circuit breaker of ``operation`` on the host of ``url`` (None for unnamed calls)
+        """
+        if operation is None:
+            return None
+        return f"{urlsplit(url).netloc}/{operation}"
+
+    def get_breaker(self, operation: str) -> CircuitBreaker:
+        """
+        Returns the circuit breaker of an operation, creating it on first use
+        """
+        with self._breakers_lock:
+            breaker = self._breakers.get(operation)
+            if breaker is None:
+                breaker = CircuitBreaker(self.failure_threshold, self.recovery_timeout)
+                self._breakers[operation] = breaker
+            return breaker
+
+    def before_attempt(self, operation: Optional[str]):
+        """
+        Raises CircuitOpenError if the operation's breaker rejects the call
+        """
+        if operation is not None and not self.get_breaker(operation).allow_request():
+            raise CircuitOpenError(
+                f"Circuit breaker open for '{operation}' - GAME API is failing, not sending request"
+            )
+
+    def record_status(self, operation: Optional[str], status_code: int):
+        if operation is None:
+            return
+        if status_code in self.RETRYABLE_STATUSES:
+            self.get_breaker(operation).record_failure()
+        else:
+            self.get_breaker(operation).record_success()
+
+    def record_error(self, operation: Optional[str]):
+        if operation is not None:
+            self.get_breaker(operation).record_failure()
+
+    def should_retry_status(self, attempt: int, status_code: int, idempotent: bool) -> bool:
+        if attempt >= self.max_retries:
+            return False
+        if idempotent:
+            return status_code in self.RETRYABLE_STATUSES
+        return status_code in self.REJECTED_STATUSES
+
+    def should_retry_error(self, attempt: int, request_sent: bool, idempotent: bool) -> bool:
+        if attempt >= self.max_retries:
+            return False
+        return idempotent or not request_sent
+
+    def get_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Seconds to wait before retry number ``attempt + 1``
+        """
+        server_delay = self._parse_retry_after(retry_after)
+        if server_delay is not None:
+            return min(server_delay, self.max_retry_after)
+
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    @staticmethod
+    def _parse_retry_after(retry_after: Optional[str]) -> Optional[float]:
+        if not retry_after:
+            return None
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            pass
+        try:
+            return max(parsedate_to_datetime(retry_after).timestamp() - time.time(), 0.0)
+        except (TypeError, ValueError):
+            return None
@@ -0,0 +1,135 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """
+    Counters of a ``ResultCache``.
+
+    Attributes:
+        hits (int): Lookups answered from the cache.
+        misses (int): Lookups that had to run the executable.
+        evictions (int): Entries dropped to stay within ``max_entries``.
+        expirations (int): Entries dropped because they outlived the TTL.
+        size (int): Entries currently cached.
+    """
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResultCache:
+    """
+    Memoizes the results of a side-effect free ``Function``, keyed by its arguments.
+
+    Only successful (DONE) results are cached. Entries expire ``ttl`` seconds after
+    they were stored, and the least recently used entry is evicted once ``max_entries``
+    is reached. Cached ``info`` dicts are shallow-copied on every hit, so callers may add
+    keys to them but should not mutate nested values.
+
+    Args:
+        ttl (Optional[float]): Seconds a result stays valid (None keeps it until evicted).
+        max_entries (int): Maximum number of cached argument combinations.
+
+    Example:
+        ```python
+        search_fn = Function(
+            fn_name="search_agents",
+            ...,
+            executable=search_agents,
+            cache=ResultCache(ttl=300, max_entries=500),
+        )
+        search_fn.cache.invalidate({"query": "memes"})  # or .invalidate() to drop everything
+        print(search_fn.cache.stats().hit_rate)
+        ```
+    """
+    def __init__(self, ttl: Optional[float] = 300.0, max_entries: int = 256):
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[float, Tuple[Any, str, dict]]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    @staticmethod
+    def make_key(args: Dict[str, Any]) -> Hashable:
+        """
+        Normalizes arguments into a cache key (independent of argument order)
+        """
+        return json.dumps(args, sort_keys=True, default=repr)
+
+    def get(self, args: Dict[str, Any]) -> Optional[Tuple[Any, str, dict]]:
+        """
+        Returns the cached ``(status, feedback, info)`` for ``args``, or None on a miss
+        """
+        key = self.make_key(args)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None and time.monotonic() - entry[0] > self.ttl:
+                del self._entries[key]
+                self._expirations += 1
+                entry = None
+
+            if entry is None:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            status, feedback, info = entry[1]
+        return status, feedback, _copy_info(info)
+
+    def put(self, args: Dict[str, Any], outcome: Tuple[Any, str, dict]):
+        """
+        Stores the ``(status, feedback, info)`` returned for ``args``
+        """
+        key = self.make_key(args)
+        status, feedback, info = outcome
+        with self._lock:
+            self._entries[key] = (time.monotonic(), (status, feedback, _copy_info(info)))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, args: Optional[Dict[str, Any]] = None):
+        """
+        Drops the result cached for ``args`` (or every result)
+        """
+        with self._lock:
+            if args is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(self.make_key(args), None)
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                size=len(self._entries),
+            )
+
+
+def _copy_info(info: Optional[dict]) -> Optional[dict]:
+    # FunctionResult.info is optional; a copy keeps callers from mutating the cached one
+    return dict(info) if info is not None else None
@@ -0,0 +1,276 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Dict, List, Optional
+
+from game_sdk.game.agent import Agent
+from game_sdk.game.scheduler import StepScheduler
+
+
+@dataclass
+class AgentStats:
+    """
+    Step statistics of one agent in an ``AgentRuntime``.
+
+    Attributes:
+        steps (int): Number of completed steps.
+        errors (int): Number of steps that raised.
+        busy_time (float): Total seconds spent inside ``Agent.step``.
+        started_at (float): ``time.monotonic()`` when the agent was added.
+        last_error (Optional[str]): Message of the most recent error.
+    """
+    steps: int = 0
+    errors: int = 0
+    busy_time: float = 0.0
+    started_at: float = 0.0
+    last_error: Optional[str] = None
+
+    @property
+    def steps_per_minute(self) -> float:
+        elapsed = time.monotonic() - self.started_at
+        return self.steps / elapsed * 60 if elapsed > 0 else 0.0
+
+    @property
+    def mean_step_time(self) -> float:
+        attempts = self.steps + self.errors
+        return self.busy_time / attempts if attempts else 0.0
+
+
+class _Entry:
+    def __init__(self, agent: Agent, priority: float, scheduler: Optional[StepScheduler], virtual_time: float):
+        self.agent = agent
+        self.priority = priority
+        self.scheduler = scheduler
+        self.virtual_time = virtual_time
+        self.due_at = 0.0
+        # set once the scheduler's rate limit granted the next step, until it is dispatched
+        self.reserved_at: Optional[float] = None
+        self.running = False
+        self.wake_requested = False
+        # removed while a step was in progress - dropped once that step finishes
+        self.removed = False
+        self.stats = AgentStats(started_at=time.monotonic())
+        # the agent's own concurrency slots, restored when it leaves the runtime
+        self.own_slots = (agent._api_slot, agent._function_slot)
+
+
+class AgentRuntime:
+    """
+    Runs many ``Agent`` instances concurrently in one process.
+
+    Agents are stepped through their regular ``Agent.step()`` on a shared thread pool.
+    Each agent runs at most one step at a time; among the agents that are due, the
+    runtime picks the one with the least weighted service so far, so an agent with
+    ``priority=2`` gets twice the steps of one with ``priority=1`` when the pool is
+    saturated, and no agent starves. In-flight API calls and local function executions
+    can be capped globally, independently of the number of concurrent steps.
+
+    Args:
+        max_concurrent_steps (int): Maximum number of agents stepping at the same time.
+        max_api_calls (Optional[int]): Maximum number of in-flight GAME API calls across agents.
+        max_function_calls (Optional[int]): Maximum number of functions executing across agents.
+        error_backoff (float): Seconds before an agent whose step raised is stepped again.
+
+    Example:
+        ```python
+        runtime = AgentRuntime(max_concurrent_steps=16, max_api_calls=8)
+        for agent in agents:
+            agent.compile()
+            runtime.add_agent(agent, scheduler=AdaptiveBackoffScheduler())
+        runtime.start()
+        ...
+        print(runtime.stats())
+        runtime.stop()
+        ```
+    """
+    def __init__(
+        self,
+        max_concurrent_steps: int = 8,
+        max_api_calls: Optional[int] = None,
+        max_function_calls: Optional[int] = None,
+        error_backoff: float = 5.0,
+    ):
+        self.max_concurrent_steps = max_concurrent_steps
+        self.error_backoff = error_backoff
+        self._api_slot = threading.BoundedSemaphore(max_api_calls) if max_api_calls else None
+        self._function_slot = threading.BoundedSemaphore(max_function_calls) if max_function_calls else None
+
+        # keyed by id(agent) - agents registered from the same definition share an agent_id
+        self._entries: Dict[int, _Entry] = {}
+        self._condition = threading.Condition()
+        self._in_flight = 0
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+
+    def add_agent(
+        self,
+        agent: Agent,
+        priority: float = 1.0,
+        scheduler: Optional[StepScheduler] = None,
+    ):
+        """
+        Adds a compiled agent to the runtime.
+
+        Args:
+            agent (Agent): The agent (``compile()`` must have been called).
+            priority (float): Relative share of steps when agents compete for the pool.
+            scheduler (Optional[StepScheduler]): Paces the agent's steps via ``next_delay``,
+                rate limited by ``reserve`` (steps run back to back without one).
+
+        Adding an agent that is already in the runtime changes its priority and scheduler,
+        keeping its statistics, its place in the schedule and any step in progress.
+        """
+        if priority <= 0:
+            raise ValueError("Priority must be positive")
+
+        with self._condition:
+            entry = self._entries.get(id(agent))
+            if entry is None:
+                # start new agents level with the least served one so they neither starve nor get a burst
+                virtual_time = min((e.virtual_time for e in self._active_entries()), default=0.0)
+                self._entries[id(agent)] = _Entry(agent, priority, scheduler, virtual_time)
+            else:
+                entry.priority = priority
+                entry.scheduler = scheduler
+                entry.removed = False
+
+            if self._api_slot is not None:
+                agent._api_slot = self._api_slot
+            if self._function_slot is not None:
+                agent._function_slot = self._function_slot
+            self._condition.notify_all()
+
+    def remove_agent(self, agent: Agent):
+        """
+        Removes an agent; a step already in progress is allowed to finish
+        """
+        with self._condition:
+            entry = self._entries.get(id(agent))
+            if entry is None or entry.removed:
+                return
+            if entry.running:
+                # kept until the step ends, so re-adding the agent cannot start a second one
+                entry.removed = True
+            else:
+                del self._entries[id(agent)]
+            # a step in progress still releases the runtime's slot it entered
+            agent._api_slot, agent._function_slot = entry.own_slots
+
+    def wake(self, agent: Agent):
+        """
+        Makes an agent due immediately, cutting its scheduled delay short
+        """
+        with self._condition:
+            entry = self._entries.get(id(agent))
+            if entry is not None and not entry.removed:
+                # an early step still has to wait for the rate limit it reserved
+                entry.due_at = entry.reserved_at or 0.0
+                entry.wake_requested = entry.running
+                self._condition.notify_all()
+
+    def stats(self) -> Dict[Agent, AgentStats]:
+        """
+        Returns a snapshot of the step statistics per agent
+        """
+        with self._condition:
+            return {entry.agent: replace(entry.stats) for entry in self._active_entries()}
+
+    def run(self, duration: Optional[float] = None):
+        """
+        Steps the agents until ``stop`` is called (or ``duration`` seconds have passed).
+        """
+        deadline = time.monotonic() + duration if duration is not None else None
+        with self._condition:
+            self._stopping = False
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_steps) as pool:
+            with self._condition:
+                while not self._stopping:
+                    now = time.monotonic()
+                    if deadline is not None and now >= deadline:
+                        break
+
+                    entry = self._next_ready(now) if self._in_flight < self.max_concurrent_steps else None
+                    if entry is None:
+                        self._condition.wait(timeout=self._idle_timeout(now, deadline))
+                        continue
+
+                    if entry.scheduler is not None and entry.reserved_at is None:
+                        delay = entry.scheduler.reserve()
+                        if delay > 0:
+                            entry.reserved_at = entry.due_at = now + delay
+                            continue
+
+                    entry.reserved_at = None
+                    entry.running = True
+                    self._in_flight += 1
+                    pool.submit(self._step, entry)
+
+                # let in-flight steps finish before the pool shuts down
+                while self._in_flight:
+                    self._condition.wait()
+
+    def start(self):
+        """
+        Runs the agents in a background thread
+        """
+        if self._thread is not None and self._thread.is_alive():
+            raise RuntimeError("AgentRuntime is already running")
+        self._thread = threading.Thread(target=self.run, daemon=True)
+        self._thread.start()
+
+    def stop(self, wait: bool = True):
+        """
+        Stops dispatching new steps (in-flight steps still complete)
+        """
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        if wait and self._thread is not None:
+            self._thread.join()
+
+    def _active_entries(self) -> List[_Entry]:
+        return [e for e in self._entries.values() if not e.removed]
+
+    def _next_ready(self, now: float) -> Optional[_Entry]:
+        ready: List[_Entry] = [
+            e for e in self._active_entries() if not e.running and e.due_at <= now
+        ]
+        return min(ready, key=lambda e: e.virtual_time, default=None)
+
+    def _idle_timeout(self, now: float, deadline: Optional[float]) -> Optional[float]:
+        wake_times = [e.due_at for e in self._active_entries() if not e.running and e.due_at > now]
+        if deadline is not None:
+            wake_times.append(deadline)
+        return max(min(wake_times) - now, 0.0) if wake_times else None
+
+    def _step(self, entry: _Entry):
+        start = time.monotonic()
+        delay = 0.0
+        try:
+            action_response, _ = entry.agent.step()
+            if entry.scheduler is not None:
+                delay = entry.scheduler.next_delay(action_response)
+            succeeded, error = True, None
+        except Exception as e:
+            succeeded, error = False, e
+            delay = self.error_backoff
+
+        end = time.monotonic()
+        with self._condition:
+            stats = entry.stats
+            stats.busy_time += end - start
+            if succeeded:
+                stats.steps += 1
+            else:
+                stats.errors += 1
+                stats.last_error = f"{type(error).__name__}: {error}"
+            entry.virtual_time += 1.0 / entry.priority
+            entry.due_at = end if entry.wake_requested else end + delay
+            entry.wake_requested = False
+            entry.running = False
+            if entry.removed:
+                del self._entries[id(entry.agent)]
+            self._in_flight -= 1
+            self._condition.notify_all()
@@ -0,0 +1,210 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Optional, Set, Tuple
+
+from game_sdk.game.custom_types import ActionResponse, ActionType
+
+if TYPE_CHECKING:
+    import asyncio
+
+
+class StepScheduler(ABC):
+    """
+    Paces ``Agent.run``/``Agent.arun`` by deciding how long to wait between steps.
+
+    Subclasses implement ``next_delay``, and rate limits ``reserve``. Any wait can be
+    cut short by ``wake`` (e.g. from a webhook or message handler in another thread) so
+    the agent reacts to external events immediately instead of at its next scheduled step.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._wake_event = threading.Event()
+        self._async_waiters: Set[Tuple["asyncio.AbstractEventLoop", "asyncio.Event"]] = set()
+
+    @abstractmethod
+    def next_delay(self, action_response: ActionResponse) -> float:
+        """
+        Returns the number of seconds to wait after a step returned ``action_response``
+        """
+
+    def reserve(self) -> float:
+        """
+        Claims the next step and returns the number of seconds before it may start (0
+        without a rate limit). ``wait`` does this itself; callers pacing steps with
+        ``next_delay`` (like ``AgentRuntime``) call it before every step.
+        """
+        return 0.0
+
+    def wait(self, action_response: ActionResponse):
+        """
+        Blocks until the next step is due or ``wake`` is called
+        """
+        delay = self.next_delay(action_response)
+        if delay > 0:
+            self._wake_event.wait(delay)
+        self._wake_event.clear()
+
+    async def async_wait(self, action_response: ActionResponse):
+        """
+        asyncio counterpart of ``wait``
+        """
+        # imported here so synchronous programs do not load asyncio
+        import asyncio
+
+        delay = self.next_delay(action_response)
+        if delay > 0:
+            event = asyncio.Event()
+            loop = asyncio.get_running_loop()
+            with self._lock:
+                self._async_waiters.add((loop, event))
+            try:
+                # checked only once registered: an earlier wake set the flag, a later one sets the event
+                if not self._wake_event.is_set():
+                    await asyncio.wait_for(event.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                with self._lock:
+                    self._async_waiters.discard((loop, event))
+        self._wake_event.clear()
+
+    def wake(self):
+        """
+        Ends the current wait early (thread-safe). If nothing is waiting, the next
+        wait returns immediately so the event is not missed.
+        """
+        self._wake_event.set()
+        with self._lock:
+            waiters = list(self._async_waiters)
+        for loop, event in waiters:
+            loop.call_soon_threadsafe(event.set)
+
+
+class ContinuousScheduler(StepScheduler):
+    """
+    Runs steps back to back (the behaviour of ``Agent.run`` without a scheduler).
+    """
+    def next_delay(self, action_response: ActionResponse) -> float:
+        return 0.0
+
+
+class HeartbeatScheduler(StepScheduler):
+    """
+    Waits a fixed interval between steps, like the hosted agent's heartbeats.
+
+    Args:
+        interval (float): Seconds between steps.
+    """
+    def __init__(self, interval: float):
+        super().__init__()
+        self.interval = interval
+
+    def next_delay(self, action_response: ActionResponse) -> float:
+        return self.interval
+
+
+class AdaptiveBackoffScheduler(StepScheduler):
+    """
+    Steps continuously while the agent is busy and backs off exponentially while it is idle.
+
+    Every consecutive ``WAIT`` action multiplies the delay by ``multiplier`` (starting
+    at ``initial_backoff``, capped at ``max_backoff``); any other action resets it to
+    ``interval``.
+
+    Args:
+        interval (float): Seconds between steps while the agent is acting.
+        initial_backoff (float): Seconds to wait after the first WAIT.
+        max_backoff (float): Upper bound in seconds for the idle delay.
+        multiplier (float): Growth factor of the delay per consecutive WAIT.
+    """
+    def __init__(
+        self,
+        interval: float = 0.0,
+        initial_backoff: float = 5.0,
+        max_backoff: float = 300.0,
+        multiplier: float = 2.0,
+    ):
+        super().__init__()
+        self.interval = interval
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.multiplier = multiplier
+        self.consecutive_waits = 0
+
+    def next_delay(self, action_response: ActionResponse) -> float:
+        if action_response.action_type != ActionType.WAIT:
+            self.consecutive_waits = 0
+            return self.interval
+
+        self.consecutive_waits += 1
+        return min(
+            self.max_backoff,
+            self.initial_backoff * self.multiplier ** (self.consecutive_waits - 1),
+        )
+
+
+class TokenBucketScheduler(StepScheduler):
+    """
+    Caps the step rate of another scheduler with a token bucket.
+
+    The wrapped scheduler decides the pacing; on top of that a step only starts once a
+    token is available, so the agent never exceeds ``steps_per_minute`` on average and
+    ``burst`` steps in a row (``wait`` takes the tokens itself, ``AgentRuntime`` through
+    ``reserve``). ``wake`` shortens the wrapped scheduler's wait but never the rate limit.
+
+    Args:
+        steps_per_minute (float): Sustained maximum step rate.
+        burst (int): Maximum number of steps that may run back to back.
+        scheduler (Optional[StepScheduler]): Scheduler to cap (defaults to ``ContinuousScheduler``).
+    """
+    def __init__(
+        self,
+        steps_per_minute: float,
+        burst: int = 1,
+        scheduler: Optional[StepScheduler] = None,
+    ):
+        if steps_per_minute <= 0:
+            raise ValueError("steps_per_minute must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        super().__init__()
+        self.rate = steps_per_minute / 60.0
+        self.burst = burst
+        self.scheduler = scheduler or ContinuousScheduler()
+
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+
+    def next_delay(self, action_response: ActionResponse) -> float:
+        return self.scheduler.next_delay(action_response)
+
+    def reserve(self) -> float:
+        return max(self.scheduler.reserve(), self._acquire())
+
+    def wait(self, action_response: ActionResponse):
+        self.scheduler.wait(action_response)
+        time.sleep(self._acquire())
+
+    async def async_wait(self, action_response: ActionResponse):
+        import asyncio
+
+        await self.scheduler.async_wait(action_response)
+        await asyncio.sleep(self._acquire())
+
+    def wake(self):
+        self.scheduler.wake()
+
+    def _acquire(self) -> float:
+        """
+        Takes a token and returns how long to wait for it to be available
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
@@ -0,0 +1,65 @@
+from typing import List, Tuple
+
+EVENT_STREAM = "text/event-stream"
+
+# A streamed conversation turn is a sequence of events whose data is JSON:
+#   message_delta  {"delta": "..."}, the next piece of the agent's message
+#   function_call  {"id": ..., "fn_name": ..., "args": {...}}, sent once the call is complete
+#   done           the complete response (the same data as the non-streamed route)
+#   error          {"message": "..."}, the turn failed
+
+
+class SSEDecoder:
+    """
+    Incrementally splits a byte stream into ``(event, data)`` pairs.
+
+    Chunks may end anywhere (mid-line or mid-event); ``feed`` returns the events they
+    completed, and ``flush`` the last one if the stream ended without a blank line.
+    """
+    def __init__(self):
+        self._buffer = b""
+        self._event = "message"
+        self._data: List[bytes] = []
+
+    def feed(self, chunk: bytes) -> List[Tuple[str, bytes]]:
+        events = []
+        self._buffer += chunk
+        *lines, self._buffer = self._buffer.split(b"\n")
+        for line in lines:
+            event = self._feed_line(line.rstrip(b"\r"))
+            if event is not None:
+                events.append(event)
+        return events
+
+    def flush(self) -> List[Tuple[str, bytes]]:
+        events = self.feed(b"\n") if self._buffer else []
+        event = self._feed_line(b"")
+        return events + [event] if event is not None else events
+
+    def _feed_line(self, line: bytes):
+        if not line:
+            # a blank line dispatches the event
+            if not self._data:
+                self._event = "message"
+                return None
+            event = (self._event, b"\n".join(self._data))
+            self._event, self._data = "message", []
+            return event
+        if line.startswith(b":"):
+            return None  # comment, e.g. a keep-alive
+        field, _, value = line.partition(b":")
+        if value.startswith(b" "):
+            value = value[1:]
+        if field == b"event":
+            self._event = value.decode()
+        elif field == b"data":
+            self._data.append(value)
+        return None
+
+
+def encode_event(event: str, data: bytes) -> bytes:
+    """
+    Encodes one event of a ``text/event-stream`` body
+    """
+    lines = [b"event: " + event.encode()] + [b"data: " + line for line in data.split(b"\n")]
+    return b"\n".join(lines) + b"\n\n"
@@ -0,0 +1,146 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional, Union
+
+from game_sdk.game.custom_types import FunctionResult
+
+
+class StateProvider:
+    """
+    Drop-in ``get_state_fn``/``get_agent_state_fn`` that only recomputes the state when it
+    may have changed.
+
+    The agent calls its state functions after every step. Wrapped in a ``StateProvider``,
+    the underlying function only runs when
+
+    - there is no state yet, or ``invalidate()`` was called,
+    - a new ``FunctionResult`` arrives from a function listed in ``depends_on`` (any
+      function when ``depends_on`` is None),
+    - or the state is older than ``max_age`` seconds.
+
+    Otherwise the previously returned dict is handed back as-is (so treat it as read-only).
+    Steps without a new function result (WAIT, GO_TO) never trigger a recomputation.
+
+    Use one provider per agent/worker, as it keeps that state.
+
+    Args:
+        get_state_fn (Callable): ``(function_result, current_state) -> dict``, as for workers and agents.
+        depends_on (Optional[Union[Iterable[str], Callable[[FunctionResult], bool]]]): Names of the
+            functions whose results can change this state, or a predicate on the result.
+        max_age (Optional[float]): Seconds after which the state is recomputed regardless, for
+            state that also changes outside the agent.
+
+    Example:
+        ```python
+        def get_acp_state(function_result, current_state):
+            return {"jobs": acp_client.get_active_jobs()}  # network call
+
+        worker = WorkerConfig(
+            id="acp_worker",
+            ...,
+            get_state_fn=StateProvider(get_acp_state, depends_on=["pay_job", "deliver_job"], max_age=60),
+        )
+        ```
+    """
+    def __init__(
+        self,
+        get_state_fn: Callable[[Optional[FunctionResult], Optional[Dict[str, Any]]], Dict[str, Any]],
+        depends_on: Optional[Union[Iterable[str], Callable[[FunctionResult], bool]]] = None,
+        max_age: Optional[float] = None,
+    ):
+        self.get_state_fn = get_state_fn
+        if depends_on is None or callable(depends_on):
+            self._is_relevant = depends_on
+        else:
+            names = frozenset(depends_on)
+            self._is_relevant = lambda function_result: function_result.fn_name in names
+        self.max_age = max_age
+
+        self._lock = threading.Lock()
+        self._state: Optional[Dict[str, Any]] = None
+        self._computed_at = 0.0
+        self._last_result: Optional[FunctionResult] = None
+        self._dirty = True
+        self.computations = 0
+        self.reuses = 0
+
+    def __call__(
+        self,
+        function_result: Optional[FunctionResult],
+        current_state: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        with self._lock:
+            if self._needs_update(function_result):
+                self._state = self.get_state_fn(function_result, current_state)
+                self._computed_at = time.monotonic()
+                self._dirty = False
+                self.computations += 1
+            else:
+                self.reuses += 1
+            self._last_result = function_result
+            return self._state
+
+    def fork(self) -> "StateProvider":
+        """
+        Returns a provider with the same function and settings, starting from a snapshot of
+        this provider's state, for a copy of the agent/worker that evolves its state separately
+        """
+        with self._lock:
+            forked = StateProvider(self.get_state_fn, max_age=self.max_age)
+            forked._is_relevant = self._is_relevant
+            forked._state = self._state
+            forked._computed_at = self._computed_at
+            forked._last_result = self._last_result
+            forked._dirty = self._dirty
+        return forked
+
+    def invalidate(self):
+        """
+        Forces a recomputation on the next call (e.g. after an external event)
+        """
+        with self._lock:
+            self._dirty = True
+
+    def _needs_update(self, function_result: Optional[FunctionResult]) -> bool:
+        if self._dirty or self._state is None:
+            return True
+        if self.max_age is not None and time.monotonic() - self._computed_at > self.max_age:
+            return True
+        # the same result is passed again on steps that did not call a function
+        if function_result is None or function_result is self._last_result:
+            return False
+        # placeholder results (e.g. before the first action) come from no function
+        if function_result.fn_name is None:
+            return False
+        return self._is_relevant is None or self._is_relevant(function_result)
+
+
+def with_instructions(get_state_fn: Callable, get_instructions: Callable[[], Optional[str]]) -> Callable:
+    """
+    Wraps a state function to add the worker instructions to its state.
+
+    For a ``StateProvider`` the merged dict is reused for as long as neither the
+    provider's state nor the instructions change; plain functions are merged on every
+    call, as they may return the same dict mutated in place.
+    """
+    if not isinstance(get_state_fn, StateProvider):
+        return lambda function_result, current_state: {
+            "instructions": get_instructions(),  # instructions are set up in the state
+            # places the rest of the output of the get_state_fn in the state
+            **get_state_fn(function_result, current_state),
+        }
+
+    last = {"state": None, "instructions": None, "merged": None}
+
+    def get_state(function_result, current_state):
+        state = get_state_fn(function_result, current_state)
+        instructions = get_instructions()
+        if state is not last["state"] or instructions != last["instructions"] or last["merged"] is None:
+            last.update(
+                state=state,
+                instructions=instructions,
+                merged={"instructions": instructions, **state},
+            )
+        return last["merged"]
+
+    return get_state
@@ -0,0 +1,140 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set
+
+from game_sdk.game.custom_types import ActionType, FunctionResult
+from game_sdk.game.worker import Worker
+
+
+@dataclass
+class TaskResult:
+    """
+    Outcome of a task run by a ``WorkerTaskQueue``.
+
+    Attributes:
+        task (str): The task that was run.
+        submission_id (str): Id of the task's submission in GAME.
+        function_results (List[FunctionResult]): Results of the functions called for the task, in order.
+        state (Dict[str, Any]): Worker state after the last step of the task.
+    """
+    task: str
+    submission_id: str
+    function_results: List[FunctionResult] = field(default_factory=list)
+    state: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def last_result(self) -> Optional[FunctionResult]:
+        return self.function_results[-1] if self.function_results else None
+
+
+class WorkerTaskQueue:
+    """
+    Runs many tasks on one standalone ``Worker``, several at a time.
+
+    Every task keeps its own submission, last function result, state and state function:
+    a ``StateProvider`` is forked for each task from a snapshot of the worker's, so it only
+    sees that task's results. All tasks share the worker's remote agent (registered once),
+    clients, ``Function`` objects, tracer and event bus. Tasks beyond ``max_concurrent_tasks``
+    wait in submission order.
+
+    The worker's functions may run concurrently, so they must be thread-safe, as must a
+    plain ``get_state_fn`` (it is called by every task).
+
+    Args:
+        worker (Worker): The worker running the tasks. Its own ``run``/``step`` task is not affected.
+        max_concurrent_tasks (int): Maximum number of tasks in flight at the same time.
+        max_steps (Optional[int]): Steps after which a task that has not ended is failed with
+            a ``RuntimeError`` (None lets tasks run until GAME ends them).
+
+    Example:
+        ```python
+        with WorkerTaskQueue(worker, max_concurrent_tasks=8) as queue:
+            futures = [queue.submit(f"Reply to ticket {ticket_id}") for ticket_id in ticket_ids]
+            for future in futures:
+                print(future.result().last_result)
+        ```
+    """
+    def __init__(self, worker: Worker, max_concurrent_tasks: int = 4, max_steps: Optional[int] = None):
+        if max_concurrent_tasks <= 0:
+            raise ValueError("max_concurrent_tasks must be positive")
+
+        self.worker = worker
+        self.max_concurrent_tasks = max_concurrent_tasks
+        self.max_steps = max_steps
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrent_tasks, thread_name_prefix="game_sdk_worker_task"
+        )
+        self._lock = threading.Lock()
+        self._futures: Set[Future] = set()
+        self._closed = False
+
+    def __enter__(self) -> "WorkerTaskQueue":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+    def submit(self, task: str) -> "Future[TaskResult]":
+        """
+        Queues ``task`` and returns a future resolving to its ``TaskResult`` (or the error that ended it)
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Cannot submit tasks after shutdown")
+            future = self._executor.submit(self._run_task, task)
+            self._futures.add(future)
+        future.add_done_callback(self._discard)
+        return future
+
+    @property
+    def running(self) -> int:
+        """
+        Number of tasks in flight
+        """
+        with self._lock:
+            return sum(1 for future in self._futures if future.running())
+
+    @property
+    def queued(self) -> int:
+        """
+        Number of tasks waiting for a free slot
+        """
+        with self._lock:
+            return sum(1 for future in self._futures if not future.running() and not future.done())
+
+    def shutdown(self, wait: bool = True, cancel_pending: bool = False):
+        """
+        Stops accepting tasks, optionally cancelling the queued ones, and waits for the
+        tasks in flight to end if ``wait`` is set
+        """
+        with self._lock:
+            self._closed = True
+            pending = list(self._futures)
+        if cancel_pending:
+            for future in pending:
+                future.cancel()
+        self._executor.shutdown(wait=wait)
+
+    def _discard(self, future: Future):
+        with self._lock:
+            self._futures.discard(future)
+
+    def _run_task(self, task: str) -> TaskResult:
+        task_worker = self.worker._fork_task()
+        submission_id = task_worker.set_task(task)
+        function_results: List[FunctionResult] = []
+        steps = 0
+        while task_worker._submission_id:
+            if self.max_steps is not None and steps >= self.max_steps:
+                raise RuntimeError(f"Task did not end within {self.max_steps} steps (submission {submission_id})")
+            action_response, function_result = task_worker.step()
+            if action_response.action_type == ActionType.CALL_FUNCTION:
+                function_results.append(function_result)
+            steps += 1
+        return TaskResult(
+            task=task,
+            submission_id=submission_id,
+            function_results=function_results,
+            state=task_worker.state,
+        )
@@ -0,0 +1,363 @@
+import bisect
+import contextvars
+import itertools
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+# default histogram buckets in seconds, from a fast local function call to a slow LLM round trip
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_span_ids = itertools.count(1)
+_current_span: contextvars.ContextVar[Optional["_ActiveSpan"]] = contextvars.ContextVar(
+    "game_sdk_current_span", default=None
+)
+
+
+@dataclass(frozen=True)
+class Span:
+    """
+    A timed phase of an agent or worker step.
+
+    Attributes:
+        name (str): Phase name, e.g. ``"get_action"`` or ``"execute_function"``.
+        span_id (int): Id of the span, unique within the process.
+        parent_id (Optional[int]): Id of the enclosing span (the ``"step"`` span for phases).
+        start (float): Wall-clock start time (``time.time()``).
+        duration (float): Duration in seconds.
+        attributes (Dict[str, Any]): Agent/worker/function ids, payload sizes, etc.
+        error (Optional[str]): Exception raised inside the span, if any.
+    """
+    name: str
+    span_id: int
+    parent_id: Optional[int]
+    start: float
+    duration: float
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+
+class SpanExporter(ABC):
+    """
+    Receives every finished span of a ``Tracer``.
+    """
+    @abstractmethod
+    def export(self, span: Span):
+        """
+        Handles a finished span (called from the thread that ran it, so keep it cheap)
+        """
+
+    def close(self):
+        """
+        Releases any resources held by the exporter
+        """
+
+
+class _ActiveSpan:
+    __slots__ = ("_tracer", "name", "attributes", "span_id", "parent_id", "_start", "_start_time", "_token")
+    recording = True
+
+    def __init__(self, tracer: "Tracer", name: str, attributes: Dict[str, Any]):
+        self._tracer = tracer
+        self.name = name
+        self.attributes = attributes
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def __enter__(self):
+        parent = _current_span.get()
+        self.parent_id = parent.span_id if parent is not None else None
+        self.span_id = next(_span_ids)
+        self._token = _current_span.set(self)
+        self._start_time = time.time()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        duration = time.perf_counter() - self._start
+        _current_span.reset(self._token)
+        self._tracer._export(Span(
+            name=self.name,
+            span_id=self.span_id,
+            parent_id=self.parent_id,
+            start=self._start_time,
+            duration=duration,
+            attributes=self.attributes,
+            error=f"{exc_type.__name__}: {exc}" if exc_type is not None else None,
+        ))
+        return False
+
+
+class _NoopSpan:
+    """
+    Returned while no exporter is attached, so instrumented code costs next to nothing
+    """
+    __slots__ = ()
+    recording = False
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class Tracer:
+    """
+    Records a span per step phase and hands it to the attached exporters.
+
+    ``Agent`` and ``Worker`` time each step (``"step"``) and its phases: building the
+    payload (``"build_payload"``), the API call (``"get_action"``, annotated by the
+    transport with request/response sizes), response validation (``"validate_response"``),
+    function execution (``"execute_function"``), the state functions (``"worker_state"``,
+    ``"agent_state"``) and console output (``"render"``). Without exporters, spans are
+    not recorded at all.
+
+    Args:
+        exporters (Optional[List[SpanExporter]]): Exporters receiving finished spans.
+
+    Example:
+        ```python
+        histogram = HistogramExporter()
+        agent = Agent(..., tracer=Tracer([histogram, JSONLinesExporter("spans.jsonl")]))
+        agent.compile()
+        for _ in range(10):
+            agent.step()
+        print(histogram.summary())
+        ```
+    """
+    def __init__(self, exporters: Optional[List[SpanExporter]] = None):
+        self._exporters: Tuple[SpanExporter, ...] = tuple(exporters or ())
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._exporters)
+
+    def add_exporter(self, exporter: SpanExporter):
+        with self._lock:
+            self._exporters = self._exporters + (exporter,)
+
+    def remove_exporter(self, exporter: SpanExporter):
+        with self._lock:
+            self._exporters = tuple(e for e in self._exporters if e is not exporter)
+
+    def span(self, name: str, **attributes: Any):
+        """
+        Context manager timing the enclosed block as a span named ``name``
+        """
+        if not self._exporters:
+            return _NOOP_SPAN
+        return _ActiveSpan(self, name, attributes)
+
+    def close(self):
+        """
+        Closes all exporters
+        """
+        for exporter in self._exporters:
+            exporter.close()
+
+    def _export(self, span: Span):
+        for exporter in self._exporters:
+            exporter.export(span)
+
+
+def current_span():
+    """
+    Returns the innermost span being recorded in this context (or a no-op span)
+    """
+    return _current_span.get() or _NOOP_SPAN
+
+
+class _Histogram:
+    __slots__ = ("bucket_counts", "count", "total", "samples")
+
+    def __init__(self, n_buckets: int):
+        self.bucket_counts = [0] * (n_buckets + 1)  # last one is +Inf
+        self.count = 0
+        self.total = 0.0
+        self.samples: List[float] = []
+
+
+class HistogramExporter(SpanExporter):
+    """
+    Aggregates span durations in memory, per phase.
+
+    Besides the bucket counts, the most recent ``max_samples`` durations of each phase
+    are kept to compute percentiles.
+
+    Args:
+        buckets (Sequence[float]): Upper bounds of the histogram buckets in seconds.
+        max_samples (int): Durations kept per phase for percentiles.
+    """
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS, max_samples: int = 10000):
+        self.buckets = tuple(sorted(buckets))
+        self.max_samples = max_samples
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, _Histogram] = {}
+
+    def export(self, span: Span):
+        with self._lock:
+            histogram = self._histograms.get(span.name)
+            if histogram is None:
+                histogram = self._histograms[span.name] = _Histogram(len(self.buckets))
+            histogram.bucket_counts[bisect.bisect_left(self.buckets, span.duration)] += 1
+            histogram.count += 1
+            histogram.total += span.duration
+            if self.max_samples:
+                histogram.samples.append(span.duration)
+                if len(histogram.samples) > self.max_samples:
+                    del histogram.samples[: len(histogram.samples) - self.max_samples]
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Returns count, total, mean, p50, p90 and p99 (in seconds) per phase
+        """
+        with self._lock:
+            result = {}
+            for name, histogram in self._histograms.items():
+                samples = sorted(histogram.samples)
+                result[name] = {
+                    "count": histogram.count,
+                    "total": histogram.total,
+                    "mean": histogram.total / histogram.count,
+                    "p50": _percentile(samples, 0.5),
+                    "p90": _percentile(samples, 0.9),
+                    "p99": _percentile(samples, 0.99),
+                }
+            return result
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+
+
+def _percentile(samples: List[float], q: float) -> float:
+    if not samples:
+        return 0.0
+    return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+
+class JSONLinesExporter(SpanExporter):
+    """
+    Appends every span as one JSON object per line to a file.
+
+    Args:
+        path (str): File to append to.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8")
+
+    def export(self, span: Span):
+        line = json.dumps(asdict(span), default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+class PrometheusExporter(HistogramExporter):
+    """
+    Exposes the span durations as a Prometheus histogram (``game_sdk_step_phase_seconds``,
+    labelled by phase) in the text exposition format.
+
+    ``render()`` returns the metrics page; ``serve(port)`` additionally serves it on
+    ``/metrics`` from a background thread.
+
+    Args:
+        buckets (Sequence[float]): Upper bounds of the histogram buckets in seconds.
+        metric_name (str): Name of the exported histogram.
+    """
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS, metric_name: str = "game_sdk_step_phase_seconds"):
+        super().__init__(buckets, max_samples=0)
+        self.metric_name = metric_name
+        self._server: Optional["ThreadingHTTPServer"] = None
+
+    def render(self) -> str:
+        name = self.metric_name
+        lines = [
+            f"# HELP {name} Duration of GAME SDK step phases in seconds.",
+            f"# TYPE {name} histogram",
+        ]
+        with self._lock:
+            for phase, histogram in sorted(self._histograms.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets + (float("inf"),), histogram.bucket_counts):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(f'{name}_bucket{{phase="{phase}",le="{le}"}} {cumulative}')
+                lines.append(f'{name}_sum{{phase="{phase}"}} {histogram.total}')
+                lines.append(f'{name}_count{{phase="{phase}"}} {histogram.count}')
+        return "\n".join(lines) + "\n"
+
+    def serve(self, port: int, host: str = "127.0.0.1") -> int:
+        """
+        Serves the metrics on ``http://<host>:<port>/metrics`` and returns the bound port.
+        Only local scrapers can reach it by default; pass ``host="0.0.0.0"`` to listen on
+        every interface (e.g. for a Prometheus server on another machine).
+        """
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = exporter.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self._server.server_address[1]
+
+    def close(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+_default_tracer = Tracer()
+
+
+def get_default_tracer() -> Tracer:
+    """
+    Returns the process-wide tracer used by agents and workers created without one
+    """
+    return _default_tracer
+
+
+def set_default_tracer(tracer: Optional[Tracer]):
+    """
+    Replaces the process-wide tracer (``None`` resets it to one without exporters)
+    """
+    global _default_tracer
+    _default_tracer = tracer or Tracer()
@@ -0,0 +1,201 @@
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+from urllib3.util.request import ACCEPT_ENCODING
+
+from game_sdk.game.codec import JSONCodec, get_default_codec
+from game_sdk.game.compression import check_encoding, encode_json_body
+from game_sdk.game.resilience import ResiliencePolicy
+from game_sdk.game.tracing import current_span
+
+
+class HTTPTransport:
+    """
+    Keep-alive HTTP transport shared by the GAME API clients.
+
+    Wraps a single ``requests.Session`` whose connection pools are reused across
+    requests, so consecutive agent steps, chat turns and function reports go over
+    warm connections instead of opening a new TCP+TLS connection each time.
+
+    Args:
+        pool_connections (int): Number of per-host connection pools to keep.
+        pool_maxsize (int): Maximum number of connections kept alive per host.
+        pool_block (bool): Whether to block when a host pool has no free connection
+            instead of opening a throwaway extra one.
+        host_pool_maxsize (Optional[Dict[str, int]]): Per-host overrides of
+            ``pool_maxsize``, keyed by URL prefix (e.g. ``"https://sdk.game.virtuals.io"``).
+        timeout (Optional[float]): Default timeout in seconds applied to every request.
+        resilience (Optional[ResiliencePolicy]): Retry/backoff/circuit breaker policy
+            (defaults to ``ResiliencePolicy()``; pass ``ResiliencePolicy(max_retries=0)``
+            to fail fast).
+        compression (Optional[str]): Opt-in request body compression, ``"gzip"`` or ``"zstd"``
+            (requires ``zstandard``). Compressed responses are negotiated via ``Accept-Encoding``
+            and decoded transparently either way.
+        compression_threshold (int): Minimum JSON body size in bytes that gets compressed.
+        codec (Optional[JSONCodec]): Codec for ``json=`` request bodies and ``decode_json``
+            (defaults to ``get_default_codec()``, i.e. orjson when it is installed).
+
+    Example:
+        ```python
+        transport = HTTPTransport(pool_maxsize=50)
+        client = GAMEClientV2(api_key, transport=transport)
+        ```
+    """
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        host_pool_maxsize: Optional[Dict[str, int]] = None,
+        timeout: Optional[float] = None,
+        resilience: Optional[ResiliencePolicy] = None,
+        compression: Optional[str] = None,
+        compression_threshold: int = 1024,
+        codec: Optional[JSONCodec] = None,
+    ):
+        check_encoding(compression)
+
+        self.timeout = timeout
+        self.resilience = resilience or ResiliencePolicy()
+        self.compression = compression
+        self.compression_threshold = compression_threshold
+        self.codec = codec
+        self.session = requests.Session()
+        # advertise every response encoding urllib3 can decode here (br/zstd when installed)
+        self.session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # longer prefixes take precedence over the scheme-wide adapter
+        for prefix, maxsize in (host_pool_maxsize or {}).items():
+            self.session.mount(
+                prefix,
+                HTTPAdapter(pool_connections=1, pool_maxsize=maxsize, pool_block=pool_block),
+            )
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        operation: Optional[str] = None,
+        idempotent: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """
+        Sends a request over the pooled session, retrying it according to the resilience policy.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Request URL.
+            operation (Optional[str]): Name of the API operation, used with the URL's host to pick
+                its circuit breaker.
+            idempotent (Optional[bool]): Whether the request is safe to repeat after it may have
+                been processed (defaults to True for GET, False otherwise).
+
+        Returns:
+            requests.Response: The last response received (which may still be an error status).
+        """
+        if self.timeout is not None:
+            kwargs.setdefault("timeout", self.timeout)
+        if idempotent is None:
+            idempotent = method.upper() == "GET"
+        if kwargs.get("json") is not None:
+            # encoded once here, so retries resend the same bytes
+            body, body_headers = encode_json_body(
+                kwargs.pop("json"), self.compression, self.compression_threshold, self.codec
+            )
+            kwargs["data"] = body
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), **body_headers}
+
+        policy = self.resilience
+        breaker = policy.breaker_key(url, operation)
+        attempt = 0
+        while True:
+            policy.before_attempt(breaker)
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except requests.RequestException as e:
+                policy.record_error(breaker)
+                if not policy.should_retry_error(attempt, _is_request_sent(e), idempotent):
+                    raise
+                time.sleep(policy.get_delay(attempt))
+                attempt += 1
+                continue
+
+            policy.record_status(breaker, response.status_code)
+            if not policy.should_retry_status(attempt, response.status_code, idempotent):
+                span = current_span()
+                if span.recording:
+                    body = response.request.body
+                    span.set_attribute("request_bytes", len(body) if isinstance(body, (bytes, str)) else 0)
+                    if not kwargs.get("stream"):  # reading a streamed body here would buffer all of it
+                        span.set_attribute("response_bytes", len(response.content))
+                    span.set_attribute("attempts", attempt + 1)
+                return response
+            response.close()
+            time.sleep(policy.get_delay(attempt, response.headers.get("Retry-After")))
+            attempt += 1
+
+    def decode_json(self, response: requests.Response) -> Any:
+        """
+        Decodes the JSON body of a response with the transport's codec
+        """
+        return (self.codec or get_default_codec()).loads(response.content)
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def close(self):
+        """
+        Closes all pooled connections
+        """
+        self.session.close()
+
+
+def _is_request_sent(error: requests.RequestException) -> bool:
+    """
+    Whether the request may have reached the server before the error occurred
+    """
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return False
+    if isinstance(error, requests.exceptions.ConnectionError):
+        reason = getattr(error.args[0], "reason", None) if error.args else None
+        return not isinstance(reason, NewConnectionError)
+    return True
+
+
+_default_transport: Optional[HTTPTransport] = None
+_default_transport_lock = threading.Lock()
+
+
+def get_default_transport() -> HTTPTransport:
+    """
+    Returns the process-wide transport used by clients created without one
+    """
+    global _default_transport
+    with _default_transport_lock:
+        if _default_transport is None:
+            _default_transport = HTTPTransport()
+        return _default_transport
+
+
+def set_default_transport(transport: Optional[HTTPTransport]):
+    """
+    Replaces the process-wide transport (``None`` resets it to a fresh default on next use)
+    """
+    global _default_transport
+    with _default_transport_lock:
+        _default_transport = transport
@@ -1,7 +1,18 @@
-from typing import Any, Callable, Dict, Optional, List
+import copy
+from typing import TYPE_CHECKING, Callable, Dict, Optional, List, Union
 from game_sdk.game.custom_types import Function, FunctionResult, FunctionResultStatus, ActionResponse, ActionType
 from game_sdk.game.api import GAMEClient
 from game_sdk.game.api_v2 import GAMEClientV2
+from game_sdk.game.async_clients import AsyncClientProvider
+from game_sdk.game.checkpoint import Checkpointer, dump_function_result, load_function_result
+from game_sdk.game.events import EventBus, get_default_event_bus
+from game_sdk.game.payload import ActionSpace, FunctionCatalog
+from game_sdk.game.registry import RegistrationCache
+from game_sdk.game.state import StateProvider, with_instructions
+from game_sdk.game.tracing import Tracer, get_default_tracer
+
+if TYPE_CHECKING:
+    from game_sdk.game.api_v2_async import AsyncGAMEClientV2
 
 class Worker:
     """
@@ -17,6 +28,21 @@ class Worker:
         get_state_fn (Callable): Function to retrieve and manage worker state.
         action_space (List[Function]): List of functions available to the worker.
         instruction (Optional[str]): Additional specific instructions for the worker.
+        model_name (str): Name of the model used by GAME to select actions.
+        client (Optional[Union[GAMEClient, GAMEClientV2]]): Preconfigured API client to use
+            instead of one created from the API key.
+        registry (Optional[RegistrationCache]): On-disk registry used to reuse the remote
+            agent id of an unchanged worker across restarts.
+        tracer (Optional[Tracer]): Records the duration of each step phase (defaults to the
+            process-wide tracer).
+        events (Optional[EventBus]): Receives the step events (defaults to the process-wide
+            bus, which prints them to the console). Pass ``EventBus()`` to run headless.
+        checkpointer (Optional[Checkpointer]): Saves the active task, state and remote id every
+            few steps, and resumes from them when a worker with the same description is created again.
+        agent_id (Optional[str]): Remote agent id of an already registered worker with the same
+            description, used instead of registering a new one.
+        async_client (Optional[AsyncGAMEClientV2]): Client used by ``astep``/``arun`` (defaults to
+            one per event loop, with the settings of ``client``).
 
     Attributes:
         description (str): Worker's role description used in interactions.
@@ -50,9 +76,18 @@ class Worker:
         # specific additional instruction for the worker (PROMPT)
         instruction: Optional[str] = "",
         model_name: str = "Llama-3.3-70B-Instruct",
+        client: Optional[Union[GAMEClient, GAMEClientV2]] = None,
+        registry: Optional[RegistrationCache] = None,
+        tracer: Optional[Tracer] = None,
+        events: Optional[EventBus] = None,
+        checkpointer: Optional[Checkpointer] = None,
+        agent_id: Optional[str] = None,
+        async_client: Optional["AsyncGAMEClientV2"] = None,
     ):
 
-        if api_key.startswith("apt-"):
+        if client is not None:
+            self.client = client
+        elif api_key.startswith("apt-"):
             self.client = GAMEClientV2(api_key)
         else:
             self.client = GAMEClient(api_key)
@@ -69,11 +104,8 @@ class Worker:
         self.instruction: Optional[str] = instruction
 
         # setup get state function and initial state
-        self.get_state_fn = lambda function_result, current_state: {
-            "instructions": self.instruction,  # instructions are set up in the state
-            # places the rest of the output of the get_state_fn in the state
-            **get_state_fn(function_result, current_state),
-        }
+        self._get_state_fn = get_state_fn
+        self.get_state_fn = with_instructions(get_state_fn, lambda: self.instruction)
         dummy_function_result = FunctionResult(
             action_id="",
             action_status=FunctionResultStatus.DONE,
@@ -86,21 +118,83 @@ class Worker:
         # # setup action space (functions/tools available to the worker)
         # check action space type - if not a dict
         if not isinstance(action_space, dict):
-            self.action_space: Dict[str, Function] = {
-                f.get_function_def()["fn_name"]: f for f in action_space}
+            self.action_space: Dict[str, Function] = ActionSpace(
+                (f.get_function_def()["fn_name"], f) for f in action_space)
         else:
             self.action_space: Dict[str, Function] = action_space
 
-        # initialize an agent instance for the worker
-        self._agent_id: str = self.client.create_agent(
-            "StandaloneWorker", self.description, "N/A"
-        )
+        # resume from a checkpoint of a worker with the same description
+        self._checkpointer = checkpointer
+        checkpoint = None
+        if self._checkpointer is not None:
+            self._agent_key = RegistrationCache.agent_key(self.client, "StandaloneWorker", self.description, "N/A")
+            checkpoint = self._checkpointer.load()
+            if checkpoint is not None and checkpoint.get("agent_key") != self._agent_key:
+                checkpoint = None
+
+        # initialize an agent instance for the worker (or reuse its registration from a previous run)
+        if checkpoint is not None:
+            self._agent_id: str = checkpoint["agent_id"]
+        elif agent_id is not None:
+            self._agent_id: str = agent_id
+        elif registry is not None:
+            self._agent_id: str = registry.get_or_create_agent(
+                self.client, "StandaloneWorker", self.description, "N/A"
+            )
+        else:
+            self._agent_id: str = self.client.create_agent(
+                "StandaloneWorker", self.description, "N/A"
+            )
 
         # persistent variables that is maintained through the worker running
         # task ID for everytime you provide/update the task (i.e. ask the agent to do something)
         self._submission_id: Optional[str] = None
         # current response from the Agent
         self._function_result: Optional[FunctionResult] = None
+        # async clients (one per event loop) are created on first use of astep/arun
+        self._async_clients = (
+            AsyncClientProvider(self.client, async_client) if isinstance(self.client, GAMEClientV2) else None
+        )
+        # serialized function definitions, reused across steps
+        self._function_catalog = FunctionCatalog()
+        self._tracer = tracer or get_default_tracer()
+        self._events = events or get_default_event_bus()
+
+        if checkpoint is not None:
+            self._submission_id = checkpoint["submission_id"]
+            self._function_result = load_function_result(checkpoint["function_result"])
+            self.state = checkpoint["state"]
+
+    def _get_checkpoint_state(self) -> Dict:
+        return {
+            "agent_key": self._agent_key,
+            "agent_id": self._agent_id,
+            "submission_id": self._submission_id,
+            "function_result": dump_function_result(self._function_result),
+            "state": self.state,
+        }
+
+    def _fork_task(self) -> "Worker":
+        """
+        Returns a copy of this worker for running one more task concurrently.
+
+        The copy has its own submission, last function result, state, state function (a
+        ``StateProvider`` is forked from a snapshot of its current state) and action space
+        dict. It shares the remote registration, the sync client, the async client provider
+        (one client per event loop, closed by this worker's ``aclose``), the ``Function``
+        objects, the function catalog, the tracer and the event bus, all of which are thread-safe
+        """
+        task_worker = copy.copy(self)
+        task_worker._submission_id = None
+        task_worker._function_result = None
+        task_worker.state = self.state
+        task_worker.action_space = copy.copy(self.action_space)
+        if isinstance(self._get_state_fn, StateProvider):
+            task_worker._get_state_fn = self._get_state_fn.fork()
+        task_worker.get_state_fn = with_instructions(task_worker._get_state_fn, lambda: task_worker.instruction)
+        # a checkpoint holds a single task
+        task_worker._checkpointer = None
+        return task_worker
 
     def set_task(self, task: str):
         """
@@ -117,13 +211,29 @@ class Worker:
 
         return self._submission_id
 
-    def _get_action(
+    async def aset_task(self, task: str):
+        """
+        Sets the task for the agent without blocking the event loop
+        """
+        if not isinstance(self.client, GAMEClientV2):
+            import asyncio
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self.set_task, task)
+
+        set_task_response = await self._async_clients.get().set_worker_task(self._agent_id, task)
+
+        # task ID
+        self._submission_id = set_task_response["submission_id"]
+
+        return self._submission_id
+
+    def _build_action_payload(
         self,
         # results of the previous action (if any)
         function_result: Optional[FunctionResult] = None
-    ) -> ActionResponse:
+    ) -> Dict:
         """
-        Gets the agent action from the GAME API
+        Builds the data payload sent to the GAME API for the next action
         """
         # dummy function result if None is provided - for get_state_fn to take the same input all the time
         if function_result is None:
@@ -145,9 +255,7 @@ class Worker:
         # set up data payload
         data = {
             "environment": self.state,  # state (updated state)
-            "functions": [
-                f.get_function_def() for f in self.action_space.values()  # functions available
-            ],
+            "functions": self._function_catalog.get(None, self.action_space),  # functions available
             "action_result": (
                 function_result.model_dump(
                     exclude={'info'}) if function_result else None
@@ -155,59 +263,187 @@ class Worker:
             "observations": observations
         }
 
+        return data
+
+    def _get_action(
+        self,
+        # results of the previous action (if any)
+        function_result: Optional[FunctionResult] = None
+    ) -> ActionResponse:
+        """
+        Gets the agent action from the GAME API
+        """
+        with self._tracer.span("build_payload", agent_id=self._agent_id):
+            data = self._build_action_payload(function_result)
+
         # make API call
-        response = self.client.get_worker_action(
-            self._agent_id, 
-            self._submission_id, 
-            data,
-            model_name=self._model_name
-        )
+        with self._tracer.span("get_action", agent_id=self._agent_id):
+            response = self.client.get_worker_action(
+                self._agent_id, 
+                self._submission_id, 
+                data,
+                model_name=self._model_name
+            )
 
-        return ActionResponse.model_validate(response)
+        return self._validate_action(response)
 
-    def step(self):
+    async def _aget_action(
+        self,
+        # results of the previous action (if any)
+        function_result: Optional[FunctionResult] = None
+    ) -> ActionResponse:
         """
-        Execute the next step in the task - requires a task ID (i.e. task ID)
+        Gets the agent action from the GAME API without blocking the event loop
         """
-        if not self._submission_id:
-            raise ValueError("No task set")
+        # v1 keys have no async client - run the blocking call in the default executor
+        if not isinstance(self.client, GAMEClientV2):
+            import asyncio
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self._get_action, function_result)
+
+        with self._tracer.span("build_payload", agent_id=self._agent_id):
+            data = self._build_action_payload(function_result)
+
+        with self._tracer.span("get_action", agent_id=self._agent_id):
+            response = await self._async_clients.get().get_worker_action(
+                self._agent_id,
+                self._submission_id,
+                data,
+                model_name=self._model_name
+            )
 
-        # get action from GAME API (Agent)
-        action_response = self._get_action(self._function_result)
+        return self._validate_action(response)
+
+    def _validate_action(self, response: Dict) -> ActionResponse:
+        with self._tracer.span("validate_response", agent_id=self._agent_id):
+            # agent_state is only validated if something reads it (e.g. an event sink)
+            return ActionResponse.from_response(response)
+
+    def _start_step(self, action_response: ActionResponse) -> Optional[Function]:
+        """
+        Reports the action received from GAME and returns the function to execute (if any)
+        """
         action_type = action_response.action_type
 
-        print(f"Action response: {action_response}")
-        print(f"Action type: {action_type}")
+        with self._tracer.span("render", agent_id=self._agent_id):
+            self._events.emit("worker_step", self._agent_id, action_response=action_response)
 
-        # execute action
         if action_type == ActionType.CALL_FUNCTION:
             if not action_response.action_args:
                 raise ValueError("No function information provided by GAME")
 
-            self._function_result = self.action_space[
-                action_response.action_args["fn_name"]
-            ].execute(**action_response.action_args)
+            return self.action_space[action_response.action_args["fn_name"]]
 
-            print(f"Function result: {self._function_result}")
+        return None
+
+    def _finish_step(
+        self,
+        action_response: ActionResponse,
+        function_result: Optional[FunctionResult] = None,
+    ):
+        """
+        Applies the outcome of an action to the worker state
+        """
+        # execute action
+        if action_response.action_type == ActionType.CALL_FUNCTION:
+            self._function_result = function_result
+
+            with self._tracer.span("render", agent_id=self._agent_id):
+                self._events.emit("worker_function_result", self._agent_id, function_result=self._function_result)
 
             # update state
-            self.state = self.get_state_fn(self._function_result, self.state)
+            with self._tracer.span("worker_state", agent_id=self._agent_id):
+                self.state = self.get_state_fn(self._function_result, self.state)
 
         elif action_response.action_type == ActionType.WAIT:
-            print("Task completed or ended (not possible)")
+            with self._tracer.span("render", agent_id=self._agent_id):
+                self._events.emit("worker_task_ended", self._agent_id)
             self._submission_id = None
 
         else:
             raise ValueError(
                 f"Unexpected action type: {action_response.action_type}")
 
-        return action_response, self._function_result.model_copy()
+        # the task may end before any function was called
+        function_result = self._function_result.model_copy() if self._function_result is not None else None
+        return action_response, function_result
 
-    def run(self, task: str):
+    def step(self):
         """
-        Gets the agent to complete the task on its own autonomously
+        Execute the next step in the task - requires a task ID (i.e. task ID)
         """
+        if not self._submission_id:
+            raise ValueError("No task set")
 
-        self.set_task(task)
+        # events.emit() calls (e.g. in Function.execute) go to this worker's bus
+        with self._events.activate(), self._tracer.span("step", agent_id=self._agent_id) as span:
+            # get action from GAME API (Agent)
+            action_response = self._get_action(self._function_result)
+            span.set_attribute("action_type", action_response.action_type.value)
+
+            # execute action
+            function = self._start_step(action_response)
+            function_result = None
+            if function is not None:
+                with self._tracer.span("execute_function", agent_id=self._agent_id, fn_name=function.fn_name):
+                    function_result = function.execute(**action_response.action_args)
+
+            result = self._finish_step(action_response, function_result)
+            if self._checkpointer is not None:
+                self._checkpointer.step_completed(self)
+            return result
+
+    async def astep(self):
+        """
+        asyncio counterpart of ``step`` - the function runs via ``Function.aexecute``
+        """
+        if not self._submission_id:
+            raise ValueError("No task set")
+
+        with self._events.activate(), self._tracer.span("step", agent_id=self._agent_id) as span:
+            # get action from GAME API (Agent)
+            action_response = await self._aget_action(self._function_result)
+            span.set_attribute("action_type", action_response.action_type.value)
+
+            # execute action
+            function = self._start_step(action_response)
+            function_result = None
+            if function is not None:
+                with self._tracer.span("execute_function", agent_id=self._agent_id, fn_name=function.fn_name):
+                    function_result = await function.aexecute(**action_response.action_args)
+
+            result = self._finish_step(action_response, function_result)
+            if self._checkpointer is not None:
+                self._checkpointer.step_completed(self)
+            return result
+
+    def run(self, task: Optional[str] = None):
+        """
+        Gets the agent to complete the task on its own autonomously
+
+        Without a task, continues the task restored from a checkpoint.
+        """
+        if task is not None:
+            self.set_task(task)
+        elif not self._submission_id:
+            raise ValueError("No task set")
         while self._submission_id:
             self.step()
+
+    async def arun(self, task: Optional[str] = None):
+        """
+        asyncio counterpart of ``run``
+        """
+        if task is not None:
+            await self.aset_task(task)
+        elif not self._submission_id:
+            raise ValueError("No task set")
+        while self._submission_id:
+            await self.astep()
+
+    async def aclose(self):
+        """
+        Closes the async client ``astep`` created for the running event loop
+        """
+        if self._async_clients is not None:
+            await self._async_clients.aclose()
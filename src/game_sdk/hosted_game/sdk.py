@@ -1,26 +1,28 @@
-import requests
+from typing import Optional
+from game_sdk.game.transport import HTTPTransport, get_default_transport
 
 
 class GameSDK:
     api_url: str = "https://game-api.virtuals.io/api"
     api_key: str
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, transport: Optional[HTTPTransport] = None):
         self.api_key = api_key
+        self._transport = transport or get_default_transport()
 
     def functions(self):
         """
         Get all default functions
         """
-        response = requests.get(
-            f"{self.api_url}/functions", headers={"x-api-key": self.api_key})
+        response = self._transport.get(
+            f"{self.api_url}/functions", operation="functions", headers={"x-api-key": self.api_key})
 
         if (response.status_code != 200):
             raise Exception(response.json())
 
         functions = {}
 
-        for x in response.json()["data"]:
+        for x in self._transport.decode_json(response)["data"]:
             functions[x["fn_name"]] = x["fn_description"]
 
         return functions
@@ -29,8 +31,9 @@ class GameSDK:
         """
         Simulate the agent configuration
         """
-        response = requests.post(
+        response = self._transport.post(
             f"{self.api_url}/simulate",
+            operation="simulate",
             json={
                 "data": {
                     "sessionId": session_id,
@@ -47,7 +50,7 @@ class GameSDK:
         if (response.status_code != 200):
             raise Exception(response.json())
 
-        return response.json()["data"]
+        return self._transport.decode_json(response)["data"]
 
     def react(self, session_id: str, platform: str, goal: str,
               description: str, functions: list, custom_functions: list,
@@ -77,8 +80,9 @@ class GameSDK:
             
         print(payload)
 
-        response = requests.post(
+        response = self._transport.post(
             url,
+            operation="react",
             json={
                 "data": payload
             },
@@ -88,7 +92,7 @@ class GameSDK:
         if (response.status_code != 200):
             raise Exception(response.json())
 
-        return response.json()["data"]
+        return self._transport.decode_json(response)["data"]
 
     def deploy(self, goal: str, description: str, functions: list, custom_functions: list, main_heartbeat: int, reaction_heartbeat: int, tweet_usernames: list = None, templates: list = None, game_engine_model: str = "llama_3_1_405b"):
         """
@@ -114,8 +118,9 @@ class GameSDK:
         if templates:
             payload["templates"] = [template.to_dict() for template in templates]   
             
-        response = requests.post(
+        response = self._transport.post(
             f"{self.api_url}/deploy",
+            operation="deploy",
             json={
                 "data": payload
             },
@@ -125,11 +130,11 @@ class GameSDK:
         if (response.status_code != 200):
             raise Exception(response.json())
 
-        return response.json()["data"]
+        return self._transport.decode_json(response)["data"]
     
     def reset_memory(self):
-        response = requests.get(
-            f"{self.api_url}/reset-session", headers={"x-api-key": self.api_key})
+        response = self._transport.get(
+            f"{self.api_url}/reset-session", operation="reset_memory", headers={"x-api-key": self.api_key})
 
         if (response.status_code != 200):
             raise Exception("Failed to reset memory.")
@@ -0,0 +1,32 @@
+import os
+import sys
+
+import pytest
+
+# the stub server and benchmark budgets live next to the benchmarks, not in the package
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+from stub_server import GameStubServer  # noqa: E402
+
+from game_sdk.game.api_v2 import GAMEClientV2  # noqa: E402
+from game_sdk.game.resilience import ResiliencePolicy  # noqa: E402
+from game_sdk.game.transport import HTTPTransport  # noqa: E402
+
+
+@pytest.fixture
+def stub_server():
+    with GameStubServer() as server:
+        yield server
+
+
+@pytest.fixture
+def transport():
+    # retries without backoff, so failure tests stay fast
+    transport = HTTPTransport(timeout=5, resilience=ResiliencePolicy(backoff_base=0, jitter=False))
+    yield transport
+    transport.session.close()
+
+
+@pytest.fixture
+def client(stub_server, transport):
+    return GAMEClientV2("apt-test", transport=transport, base_url=stub_server.base_url)
@@ -0,0 +1,85 @@
+import base64
+import json
+import threading
+import time
+
+from game_sdk.game.api import AccessTokenManager
+
+
+def make_jwt(expires_in: float) -> str:
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": time.time() + expires_in}).encode()).rstrip(b"=")
+    return f"header.{payload.decode()}.signature"
+
+
+class TokenSource:
+    def __init__(self, expires_in: float, delay: float = 0.0):
+        self.expires_in = expires_in
+        self.delay = delay
+        self.fetches = 0
+        self._lock = threading.Lock()
+
+    def __call__(self) -> str:
+        time.sleep(self.delay)
+        with self._lock:
+            self.fetches += 1
+        return make_jwt(self.expires_in)
+
+
+def test_token_is_cached_until_refresh_window():
+    source = TokenSource(expires_in=3600)
+    manager = AccessTokenManager(source, refresh_margin=60)
+    assert manager.get_token() == manager.get_token()
+    assert source.fetches == 1
+
+
+def test_concurrent_callers_share_one_fetch():
+    source = TokenSource(expires_in=3600, delay=0.1)
+    manager = AccessTokenManager(source)
+    tokens = []
+    threads = [threading.Thread(target=lambda: tokens.append(manager.get_token())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert source.fetches == 1
+    assert len(set(tokens)) == 1
+
+
+def test_token_in_refresh_window_is_served_while_refreshing_in_background():
+    source = TokenSource(expires_in=30, delay=0.1)
+    manager = AccessTokenManager(source, refresh_margin=60)
+    first = manager.get_token()
+
+    # still valid, so it is returned right away while the next one is fetched
+    assert manager.get_token() == first
+    deadline = time.monotonic() + 2
+    while source.fetches < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert source.fetches == 2
+
+
+def test_token_without_exp_uses_default_ttl():
+    fetches = []
+
+    def fetch():
+        fetches.append(1)
+        return f"opaque-{len(fetches)}"
+
+    manager = AccessTokenManager(fetch, default_ttl=0.05, refresh_margin=0)
+    assert manager.get_token() == "opaque-1"
+    time.sleep(0.06)
+    assert manager.get_token() == "opaque-2"
+
+
+def test_invalidate_only_drops_the_rejected_token():
+    source = TokenSource(expires_in=3600)
+    manager = AccessTokenManager(source)
+    token = manager.get_token()
+
+    manager.invalidate("some-older-token")
+    assert manager.get_token() == token
+
+    manager.invalidate(token)
+    manager.get_token()
+    assert source.fetches == 2
@@ -0,0 +1,82 @@
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from stub_server import make_agent_state
+
+from game_sdk.game.custom_types import ActionResponse, ActionType, AgentStateResponse
+
+
+def make_data(**overrides):
+    data = {
+        "action_type": "call_function",
+        "agent_state": make_agent_state(log_size=2, reasoning_size=2),
+        "action_args": {"fn_id": "1", "fn_name": "noop", "args": {}},
+        "reaction_info": None,
+        "agents": None,
+    }
+    data.update(overrides)
+    return data
+
+
+def test_lazy_and_eager_responses_are_equal():
+    data = make_data()
+    eager = ActionResponse.model_validate(data)
+
+    lazy = ActionResponse.from_response(data)
+    assert lazy == eager
+    assert eager == ActionResponse.from_json(json.dumps(data))
+    assert lazy != ActionResponse.from_response(make_data(action_type="wait"))
+    assert lazy != ActionResponse.from_response(make_data(agent_state={"hlp": None}))
+
+
+def test_agent_state_is_validated_on_first_access():
+    lazy = ActionResponse.from_response(make_data())
+
+    assert "agent_state" not in lazy.__dict__
+    assert lazy.action_type == ActionType.CALL_FUNCTION
+    assert lazy.action_args["fn_name"] == "noop"
+
+    agent_state = lazy.agent_state
+    assert isinstance(agent_state, AgentStateResponse)
+    assert lazy.agent_state is agent_state
+    assert len(agent_state.recent_reasoning) == 2
+
+
+def test_dumps_match_the_eager_model():
+    data = make_data()
+    eager = ActionResponse.model_validate(data)
+
+    assert ActionResponse.from_response(data).model_dump() == eager.model_dump()
+    assert ActionResponse.from_response(data).model_dump_json() == eager.model_dump_json()
+    assert str(ActionResponse.from_response(data)) == str(eager)
+
+
+@pytest.mark.parametrize("overrides", [{"action_type": "fly"}, {"action_args": "not a dict"}, {"agents": "x"}])
+def test_control_fields_are_validated_right_away(overrides):
+    with pytest.raises(ValidationError):
+        ActionResponse.from_response(make_data(**overrides))
+    with pytest.raises(ValidationError):
+        ActionResponse.from_json(json.dumps(make_data(**overrides)))
+
+
+def test_agent_state_is_required():
+    data = make_data()
+    del data["agent_state"]
+
+    with pytest.raises(ValidationError):
+        ActionResponse.from_response(data)
+    with pytest.raises(ValidationError):
+        ActionResponse.from_response(make_data(agent_state=None))
+
+
+def test_invalid_agent_state_fails_on_access():
+    state = make_agent_state()
+    state["hlp"]["plan_id"] = {"not": "a string"}
+    lazy = ActionResponse.from_response(make_data(agent_state=state))
+
+    with pytest.raises(ValidationError):
+        lazy.agent_state
+    with pytest.raises(ValidationError):
+        ActionResponse.model_validate(make_data(agent_state=state))
@@ -0,0 +1,71 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("httpx")
+
+from game_sdk.game.api_v2_async import AsyncGAMEClientV2  # noqa: E402
+from game_sdk.game.async_clients import AsyncClientProvider  # noqa: E402
+from game_sdk.game.chat_agent import ChatAgent  # noqa: E402
+from game_sdk.game.custom_types import Function  # noqa: E402
+from game_sdk.game.events import EventBus  # noqa: E402
+from game_sdk.game.worker import Worker  # noqa: E402
+
+
+def make_worker(client):
+    noop = Function(fn_name="noop", fn_description="Does nothing", args=[])
+    return Worker("apt-test", "description", lambda result, state: {}, [noop], client=client, events=EventBus())
+
+
+def test_worker_runs_under_successive_event_loops(client, stub_server):
+    worker = make_worker(client)
+
+    async def run_task(task):
+        await worker.aset_task(task)
+        await worker.astep()
+        return worker._async_clients.get()
+
+    first = asyncio.run(run_task("first"))
+    second = asyncio.run(run_task("second"))
+
+    assert first is not second
+    assert stub_server.requests["get_worker_action"] == 2
+
+
+def test_async_clients_mirror_the_sync_client_settings(client, transport):
+    provider = AsyncClientProvider(client)
+
+    async def main():
+        async_client = provider.get()
+        assert provider.get() is async_client
+        await provider.aclose()
+        return async_client
+
+    async_client = asyncio.run(main())
+    assert async_client.base_url == client.base_url
+    assert async_client.resilience is transport.resilience
+
+
+def test_clients_of_closed_loops_are_dropped(client):
+    provider = AsyncClientProvider(client)
+    for _ in range(3):
+        asyncio.run(_get(provider))
+    assert len(provider._clients) == 1
+
+
+def test_injected_client_is_used_and_left_open(client, stub_server):
+    async def main():
+        async with AsyncGAMEClientV2("apt-test", base_url=stub_server.base_url) as async_client:
+            chat_agent = ChatAgent("apt-test", "prompt", client=client, async_client=async_client)
+            chat = await chat_agent.acreate_chat("alice", "Alice")
+            await chat.anext("hi")
+            await chat_agent.aclose()
+            # still usable after the chat agent is closed, as its owner closes it
+            await chat.anext("hi again")
+
+    asyncio.run(main())
+    assert stub_server.requests["update_chat"] == 2
+
+
+async def _get(provider):
+    return provider.get()
@@ -0,0 +1,89 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("httpx")
+
+from game_sdk.game.chat_agent import ChatAgent  # noqa: E402
+from game_sdk.game.chat_multiplexer import ChatMultiplexer  # noqa: E402
+
+
+def run(mux, make_coroutine):
+    async def main():
+        try:
+            return await make_coroutine()
+        finally:
+            await mux.chat_agent.aclose()
+
+    return asyncio.run(main())
+
+
+def test_messages_of_a_conversation_are_answered_in_order(client, stub_server):
+    mux = ChatMultiplexer(ChatAgent("apt-test", "prompt", client=client))
+    replies = run(mux, lambda: asyncio.gather(*(mux.send("alice", f"message {i}") for i in range(5))))
+
+    assert [r.message.split("to: ")[1] for r in replies] == [f"message {i}" for i in range(5)]
+    assert stub_server.requests["create_chat"] == 1
+    assert mux.metrics().turns == 5
+
+
+def test_turns_are_bounded_per_partner_and_overall(client, stub_server):
+    in_flight, peak, lock = {}, {}, threading.Lock()
+    script = stub_server.chat_script
+
+    def slow_script(data, turn):
+        partner = data["message"].split(":")[0]
+        with lock:
+            in_flight[partner] = in_flight.get(partner, 0) + 1
+            in_flight["all"] = in_flight.get("all", 0) + 1
+            for key in (partner, "all"):
+                peak[key] = max(peak.get(key, 0), in_flight[key])
+        time.sleep(0.02)
+        with lock:
+            in_flight[partner] -= 1
+            in_flight["all"] -= 1
+        return script(data, turn)
+
+    stub_server.chat_script = slow_script
+    mux = ChatMultiplexer(
+        ChatAgent("apt-test", "prompt", client=client), max_concurrent_turns=3, max_turns_per_partner=1
+    )
+    partners = [f"partner{p}" for p in range(6)]
+    # two conversations per partner, so the per-partner limit spans conversations
+    run(mux, lambda: asyncio.gather(*(
+        mux.send(partner, f"{partner}: hi", conversation_key=f"{partner}/{group}")
+        for partner in partners for group in range(2)
+    )))
+
+    assert peak["all"] == 3
+    assert max(peak[partner] for partner in partners) == 1
+
+
+def test_failed_turn_is_reported_to_its_sender_only(client, stub_server):
+    mux = ChatMultiplexer(ChatAgent("apt-test", "prompt", client=client))
+
+    async def main():
+        await mux.send("alice", "hello")
+        stub_server.fail("update_chat", 400)
+        return await asyncio.gather(mux.send("alice", "fails"), mux.send("alice", "works"), return_exceptions=True)
+
+    failed, reply = run(mux, main)
+    assert isinstance(failed, ValueError)
+    assert reply.message.endswith("works")
+    assert mux.metrics().errors == 1
+
+
+def test_ended_conversation_is_recreated(client, stub_server):
+    mux = ChatMultiplexer(ChatAgent("apt-test", "prompt", client=client))
+
+    async def main():
+        await mux.send("alice", "hello")
+        await mux.end("alice")
+        await mux.send("alice", "hello again")
+
+    run(mux, main)
+    assert stub_server.requests["end_chat"] == 1
+    assert stub_server.requests["create_chat"] == 2
+    assert mux.metrics().conversations == 1
@@ -0,0 +1,167 @@
+import asyncio
+import time
+
+import pytest
+import requests
+
+from stub_server import GameStubServer
+
+from game_sdk.game.api_v2 import GAMEClientV2
+from game_sdk.game.chat_agent import ChatAgent
+from game_sdk.game.custom_types import ChatStreamEventType, Function, FunctionResultStatus
+
+MESSAGE = "The price of ETH is up three percent today."
+
+
+def reply(data, turn):
+    return {"message": MESSAGE, "is_finished": False}
+
+
+def call_price(data, turn):
+    return {
+        "message": "Let me check.",
+        "is_finished": False,
+        "function_call": {"fn_name": "get_price", "args": {"symbol": {"value": "ETH"}}, "id": "call-1"},
+    }
+
+
+def get_price(symbol):
+    return FunctionResultStatus.DONE, f"{symbol} is at 3000", {}
+
+
+class DroppingStubServer(GameStubServer):
+    """
+    Closes the connection after the first ``events_before_drop`` events of a streamed turn
+    """
+    events_before_drop = 3
+
+    def stream_events(self, data):
+        for index, event in enumerate(super().stream_events(data)):
+            if index == self.events_before_drop:
+                raise ConnectionAbortedError("connection dropped")
+            yield event
+
+
+def make_server(server_class=GameStubServer, **kwargs):
+    server = server_class(**kwargs)
+    # the dropped connections are intended - keep their tracebacks off stderr
+    server._httpd.handle_error = lambda request, client_address: None
+    return server
+
+
+def make_chat(server, fn=None):
+    client = GAMEClientV2("apt-test", base_url=server.base_url)
+    action_space = [
+        Function(fn_name="get_price", fn_description="Looks up a price", args=[], executable=fn or get_price)
+    ]
+    return ChatAgent("apt-test", "prompt", client=client).create_chat("alice", "Alice", action_space=action_space)
+
+
+def test_deltas_arrive_as_they_are_generated():
+    with make_server(chat_script=reply, stream_chunk_chars=8, stream_delay=0.05) as server:
+        chat = make_chat(server)
+        start = time.monotonic()
+        received = [(time.monotonic() - start, event) for event in chat.stream("price?")]
+
+    deltas = [(at, event) for at, event in received if event.type == ChatStreamEventType.MESSAGE_DELTA]
+    done_at, done = received[-1]
+    assert done.type == ChatStreamEventType.DONE
+    assert len(deltas) == 6
+    # the first piece is there long before the rest of the turn is generated
+    assert deltas[0][0] < done_at - 0.15
+    assert "".join(event.delta for _, event in deltas) == MESSAGE
+    assert done.response.message == MESSAGE
+    assert done.response.function_call is None
+
+
+def test_function_calls_are_run_and_reported():
+    with make_server(chat_script=call_price) as server:
+        chat = make_chat(server)
+        events = list(chat.stream("price?"))
+        expected = make_chat(server).next("price?")
+
+    types = [event.type for event in events]
+    assert types.index(ChatStreamEventType.FUNCTION_CALL) < types.index(ChatStreamEventType.FUNCTION_RESULT)
+    assert types[-1] == ChatStreamEventType.DONE
+    assert events[types.index(ChatStreamEventType.FUNCTION_RESULT)].result.feedback_message == "ETH is at 3000"
+
+    response = events[-1].response
+    assert response.message == "Function call-1 reported: done: ETH is at 3000"
+    assert response.message == expected.message
+    assert response.function_call.fn_name == "get_price"
+    assert server.last_requests["report_function"]["fn_id"] == "call-1"
+
+
+def test_async_stream_matches_the_sync_one():
+    with make_server(chat_script=call_price, stream_chunk_chars=4) as server:
+        chat = make_chat(server)
+        sync_events = list(chat.stream("price?"))
+
+        async def main():
+            events = [event async for event in chat.astream("price?")]
+            await chat.aclose()
+            return events
+
+        async_events = asyncio.run(main())
+
+    assert [event.type for event in async_events] == [event.type for event in sync_events]
+    assert async_events[-1].response == sync_events[-1].response
+
+
+def test_connection_drop_mid_stream_raises():
+    with make_server(DroppingStubServer, chat_script=reply) as server:
+        chat = make_chat(server)
+        events = []
+        with pytest.raises(requests.RequestException):
+            for event in chat.stream("price?"):
+                events.append(event)
+
+    # what arrived before the drop was delivered, but no DONE with a truncated response
+    assert [event.type for event in events] == [ChatStreamEventType.MESSAGE_DELTA] * 3
+
+
+def test_connection_drop_mid_stream_cancels_the_running_function():
+    httpx = pytest.importorskip("httpx")
+    started, cancelled = asyncio.Event(), []
+
+    async def slow_price(symbol):
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(symbol)
+            raise
+        return FunctionResultStatus.DONE, "late", {}
+
+    # "Let me check." in two deltas, the function call, then the drop before "done"
+    with make_server(DroppingStubServer, chat_script=call_price) as server:
+        chat = make_chat(server, fn=slow_price)
+
+        async def main():
+            events = []
+            with pytest.raises(httpx.TransportError):
+                async for event in chat.astream("price?"):
+                    events.append(event)
+            await asyncio.sleep(0)
+            await chat.aclose()
+            return events
+
+        events = asyncio.run(main())
+
+    assert events[-1].type == ChatStreamEventType.FUNCTION_CALL
+    assert started.is_set()
+    assert cancelled == ["ETH"]
+
+
+def test_stream_ending_without_done_raises():
+    class TruncatingStubServer(GameStubServer):
+        def stream_events(self, data):
+            for event in super().stream_events(data):
+                if event[0] == "done":
+                    return
+                yield event
+
+    with make_server(TruncatingStubServer, chat_script=reply) as server:
+        chat = make_chat(server)
+        with pytest.raises(Exception, match="stream ended before the turn was complete"):
+            list(chat.stream("price?"))
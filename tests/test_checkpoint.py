@@ -0,0 +1,127 @@
+import os
+import signal
+
+import pytest
+
+from game_sdk.game.agent import Agent, WorkerConfig
+from game_sdk.game.checkpoint import Checkpointer
+from game_sdk.game.custom_types import Function
+from game_sdk.game.events import EventBus, EventSink
+from game_sdk.game.worker import Worker
+
+
+def make_agent(client, checkpointer, goal="goal"):
+    noop = Function(fn_name="noop", fn_description="Does nothing", args=[])
+    worker = WorkerConfig("worker", "Does the work", lambda result, state: {"count": 0}, [noop])
+    agent = Agent(
+        "apt-test", "agent", goal, "description", lambda result, state: {"steps": (state or {}).get("steps", -1) + 1},
+        workers=[worker], client=client, events=EventBus(), checkpointer=checkpointer,
+    )
+    agent.compile()
+    return agent
+
+
+def test_agent_resumes_from_checkpoint(client, stub_server, tmp_path):
+    checkpointer = Checkpointer(str(tmp_path / "agent.json"), every_n_steps=2)
+    agent = make_agent(client, checkpointer)
+    for _ in range(2):
+        agent.step()
+    registrations = dict(stub_server.requests)
+
+    resumed = make_agent(client, Checkpointer(str(tmp_path / "agent.json")))
+    assert resumed.agent_id == agent.agent_id
+    assert resumed._map_id == agent._map_id
+    assert resumed._session.id == agent._session.id
+    assert resumed.agent_state == agent.agent_state
+    assert stub_server.requests["create_agent"] == registrations["create_agent"]
+    assert stub_server.requests["create_workers"] == registrations["create_workers"]
+
+
+def test_checkpoint_of_another_definition_is_ignored(client, stub_server, tmp_path):
+    agent = make_agent(client, Checkpointer(str(tmp_path / "agent.json"), every_n_steps=1))
+    agent.step()
+
+    changed = make_agent(client, Checkpointer(str(tmp_path / "agent.json")), goal="another goal")
+    assert changed.agent_id != agent.agent_id
+    assert changed._session.id != agent._session.id
+
+
+def test_saves_every_n_steps(client, tmp_path):
+    path = tmp_path / "agent.json"
+    agent = make_agent(client, Checkpointer(str(path), every_n_steps=3))
+    for _ in range(2):
+        agent.step()
+    assert not path.exists()
+    agent.step()
+    assert path.exists()
+
+
+def test_worker_resumes_its_task(client, tmp_path):
+    noop = Function(fn_name="noop", fn_description="Does nothing", args=[])
+
+    def make_worker():
+        return Worker(
+            "apt-test", "description", lambda result, state: {}, [noop], client=client, events=EventBus(),
+            checkpointer=Checkpointer(str(tmp_path / "worker.json"), every_n_steps=1),
+        )
+
+    worker = make_worker()
+    worker.set_task("task")
+    worker.step()
+
+    resumed = make_worker()
+    assert resumed._agent_id == worker._agent_id
+    assert resumed._submission_id == worker._submission_id
+    assert resumed._function_result.action_id == worker._function_result.action_id
+
+
+def test_saves_last_completed_step_on_signal(client, tmp_path):
+    path = tmp_path / "agent.json"
+    checkpointer = Checkpointer(str(path), every_n_steps=0)
+    agent = make_agent(client, checkpointer)
+    agent.step()
+
+    received = []
+    previous = signal.signal(signal.SIGUSR1, lambda signum, frame: received.append(signum))
+    try:
+        checkpointer.save_on_signal(agent, signals=[signal.SIGUSR1])
+        os.kill(os.getpid(), signal.SIGUSR1)
+    finally:
+        signal.signal(signal.SIGUSR1, previous)
+
+    assert received == [signal.SIGUSR1]
+    assert checkpointer.load()["session_id"] == agent._session.id
+
+    checkpointer.clear()
+    assert not path.exists()
+
+
+class ListSink(EventSink):
+    def __init__(self):
+        self.events = []
+
+    def emit(self, event):
+        self.events.append(event)
+
+
+def test_unserializable_state_is_reported_instead_of_raised(client, tmp_path):
+    path = tmp_path / "agent.json"
+    checkpointer = Checkpointer(str(path), every_n_steps=1)
+    agent = make_agent(client, checkpointer)
+    agent.step()
+    saved = path.read_bytes()
+
+    sink = ListSink()
+    agent._events.add_sink(sink)
+    # the state functions run after the action, so the unserializable state is what gets saved
+    agent.get_agent_state_fn = lambda result, state: {"opened_at": object()}
+    agent.step()
+
+    errors = [event for event in sink.events if event.kind == "checkpoint_error"]
+    assert len(errors) == 1
+    assert "not JSON serializable" in errors[0].message
+    assert path.read_bytes() == saved
+    assert [name for name in os.listdir(tmp_path) if name.endswith(".tmp")] == []
+
+    with pytest.raises(TypeError):
+        checkpointer.save(agent)
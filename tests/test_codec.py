@@ -0,0 +1,79 @@
+import importlib.util
+import json
+
+import pytest
+
+from game_sdk.game import codec as codec_module
+from game_sdk.game.api_v2 import GAMEClientV2
+from game_sdk.game.codec import OrjsonCodec, StdlibCodec, get_default_codec, set_default_codec
+from game_sdk.game.transport import HTTPTransport
+
+needs_orjson = pytest.mark.skipif(importlib.util.find_spec("orjson") is None, reason="orjson is not installed")
+
+CODECS = [StdlibCodec, pytest.param(OrjsonCodec, marks=needs_orjson)]
+
+
+@pytest.fixture
+def default_codec():
+    """
+    Restores the process-wide codec after the test
+    """
+    yield
+    set_default_codec(None)
+
+
+@pytest.mark.parametrize("codec_class", CODECS)
+def test_round_trip(codec_class):
+    codec = codec_class()
+    payload = {"data": {"name": "agent", "price": 1.5, "tags": ["a", "é"], "nested": {"ok": True, "none": None}}}
+
+    encoded = codec.dumps(payload)
+
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == payload
+    assert codec.loads(encoded) == payload
+    assert codec.loads(encoded.decode()) == payload
+
+
+@needs_orjson
+def test_orjson_falls_back_for_values_it_cannot_encode():
+    codec = OrjsonCodec()
+    payload = {"amount": 2 ** 70, 1: "non-string key"}
+
+    assert json.loads(codec.dumps(payload)) == json.loads(StdlibCodec().dumps(payload))
+
+
+def test_stdlib_codec_rejects_nan():
+    with pytest.raises(ValueError):
+        StdlibCodec().dumps({"price": float("nan")})
+
+
+def test_default_codec_falls_back_without_orjson(monkeypatch, default_codec):
+    monkeypatch.setattr(codec_module, "_import_orjson", lambda: None)
+    set_default_codec(None)
+
+    assert isinstance(get_default_codec(), StdlibCodec)
+    with pytest.raises(ImportError):
+        OrjsonCodec()
+
+
+@needs_orjson
+def test_default_codec_prefers_orjson(default_codec):
+    set_default_codec(None)
+    assert get_default_codec().name == "orjson"
+
+    custom = StdlibCodec()
+    set_default_codec(custom)
+    assert get_default_codec() is custom
+
+
+@pytest.mark.parametrize("codec_class", CODECS)
+def test_clients_round_trip_with_either_codec(stub_server, codec_class):
+    transport = HTTPTransport(timeout=5, codec=codec_class())
+    client = GAMEClientV2("apt-test", transport=transport, base_url=stub_server.base_url)
+    data = {"state": {"balance": 2 ** 70, "log": ["entry"] * 3}}
+
+    action = client.get_agent_action("agent-1", data, "model")
+
+    assert stub_server.last_requests["get_agent_action"] == data
+    assert action["action_type"] == "wait"
@@ -0,0 +1,161 @@
+import asyncio
+import importlib.util
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from stub_server import GameStubServer
+
+from game_sdk.game.api_v2 import GAMEClientV2
+from game_sdk.game.compression import check_encoding, compress, decompress, encode_json_body
+from game_sdk.game.transport import HTTPTransport
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HAS_ZSTANDARD = importlib.util.find_spec("zstandard") is not None
+needs_zstandard = pytest.mark.skipif(not HAS_ZSTANDARD, reason="zstandard is not installed")
+
+# large enough to clear the default 1024 byte threshold
+BIG_DATA = {"state": {"log": [f"entry {i}: moved north and found nothing" for i in range(200)]}}
+
+
+def make_client(server, **transport_kwargs):
+    return GAMEClientV2("apt-test", transport=HTTPTransport(timeout=5, **transport_kwargs), base_url=server.base_url)
+
+
+@pytest.mark.parametrize("encoding", ["gzip", pytest.param("zstd", marks=needs_zstandard)])
+def test_sync_request_bodies_round_trip(stub_server, encoding):
+    client = make_client(stub_server, compression=encoding)
+
+    client.get_agent_action("agent-1", BIG_DATA, "model")
+
+    assert stub_server.request_encodings == {encoding: 1}
+    assert stub_server.last_requests["get_agent_action"] == BIG_DATA
+    assert stub_server.received_bytes["get_agent_action"] < len(encode_json_body({"data": BIG_DATA}, None, 0)[0])
+
+
+@pytest.mark.parametrize("encoding", ["gzip", pytest.param("zstd", marks=needs_zstandard)])
+def test_async_request_bodies_round_trip(stub_server, encoding):
+    pytest.importorskip("httpx")
+    from game_sdk.game.api_v2_async import AsyncGAMEClientV2
+
+    async def main():
+        async with AsyncGAMEClientV2("apt-test", base_url=stub_server.base_url, compression=encoding) as client:
+            await client.get_agent_action("agent-1", BIG_DATA, "model")
+
+    asyncio.run(main())
+
+    assert stub_server.request_encodings == {encoding: 1}
+    assert stub_server.last_requests["get_agent_action"] == BIG_DATA
+
+
+def test_small_bodies_are_sent_uncompressed(stub_server):
+    client = make_client(stub_server, compression="gzip")
+
+    client.set_worker_task("agent-1", "explore")
+
+    assert stub_server.request_encodings == {"identity": 1}
+    assert stub_server.last_requests["set_worker_task"] == {"task": "explore"}
+
+
+def test_sync_responses_are_decoded():
+    with GameStubServer(response_compression_threshold=0) as server:
+        client = make_client(server)
+        response = client._transport.post(
+            f"{server.base_url}/agents/agent-1/actions", json={"data": {}}, headers=client.headers
+        )
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.json()["data"]["action_type"]
+
+
+def test_async_responses_are_decoded():
+    pytest.importorskip("httpx")
+    from game_sdk.game.api_v2_async import AsyncGAMEClientV2
+
+    # httpx accepts zstd responses whenever zstandard is installed, and the stub prefers it
+    expected = "zstd" if HAS_ZSTANDARD else "gzip"
+
+    async def main(server):
+        async with AsyncGAMEClientV2("apt-test", base_url=server.base_url) as client:
+            response = await client._post(
+                f"{server.base_url}/agents/agent-1/actions", "get_agent_action", headers=client.headers, json={"data": {}}
+            )
+            return response.headers["Content-Encoding"], client._get_response_body(response)
+
+    with GameStubServer(response_compression_threshold=0) as server:
+        encoding, data = asyncio.run(main(server))
+
+    assert encoding == expected
+    assert data["action_type"]
+
+
+@pytest.mark.parametrize("encoding", ["gzip", pytest.param("zstd", marks=needs_zstandard)])
+def test_compress_round_trip(encoding):
+    body = encode_json_body(BIG_DATA, None, 0)[0]
+    assert decompress(compress(body, encoding), encoding) == body
+
+
+def test_unknown_encoding_is_rejected():
+    with pytest.raises(ValueError):
+        check_encoding("brotli")
+    with pytest.raises(ValueError):
+        HTTPTransport(compression="br")
+
+
+def test_fallback_without_zstandard():
+    # a fresh interpreter, so urllib3/httpx also see zstandard as missing
+    script = textwrap.dedent(
+        """
+        import asyncio
+        import sys
+
+        sys.modules["zstandard"] = None
+        sys.path.insert(0, "benchmarks")
+
+        from stub_server import GameStubServer
+        from game_sdk.game.api_v2 import GAMEClientV2
+        from game_sdk.game.compression import check_encoding, decompress
+        from game_sdk.game.transport import HTTPTransport
+
+        for attempt in (lambda: check_encoding("zstd"), lambda: HTTPTransport(compression="zstd"),
+                        lambda: decompress(b"", "zstd")):
+            try:
+                attempt()
+            except ImportError:
+                pass
+            else:
+                sys.exit("zstd accepted without zstandard")
+
+        data = {"log": ["x" * 40] * 100}
+        with GameStubServer(response_compression_threshold=0) as server:
+            transport = HTTPTransport(timeout=5, compression="gzip")
+            assert "zstd" not in transport.session.headers["Accept-Encoding"]
+            client = GAMEClientV2("apt-test", transport=transport, base_url=server.base_url)
+            client.get_agent_action("agent-1", data, "model")
+
+            try:
+                from game_sdk.game.api_v2_async import AsyncGAMEClientV2
+            except ImportError:
+                AsyncGAMEClientV2 = None
+            if AsyncGAMEClientV2 is not None:
+                async def main():
+                    async with AsyncGAMEClientV2("apt-test", base_url=server.base_url, compression="gzip") as client:
+                        response = await client._post(
+                            f"{server.base_url}/agents/agent-1/actions", "get_agent_action",
+                            headers=client.headers, json={"data": data},
+                        )
+                        assert response.headers["Content-Encoding"] == "gzip"
+                        client._get_response_body(response)
+                asyncio.run(main())
+
+            assert set(server.request_encodings) == {"gzip"}
+            assert server.last_requests["get_agent_action"] == data
+        """
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([os.path.join(ROOT, "src"), os.environ.get("PYTHONPATH", "")]))
+    result = subprocess.run([sys.executable, "-c", script], cwd=ROOT, env=env, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
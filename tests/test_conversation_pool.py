@@ -0,0 +1,89 @@
+import threading
+import time
+
+import pytest
+
+from game_sdk.game.chat_agent import ChatAgent
+from game_sdk.game.conversation_pool import ConversationPool
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.005)
+
+
+def test_prewarmed_conversation_is_handed_over(client, stub_server):
+    agent = ChatAgent("apt-test", "prompt", client=client, conversation_pool_size=4)
+    assert agent.prewarm_chat("alice", "Alice")
+    chat = agent.create_chat("alice", "Alice")
+
+    assert chat.next("hi").message
+    assert stub_server.requests["create_chat"] == 1
+    stats = agent.conversation_pool.stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 0, 0)
+    agent.conversation_pool.close()
+
+
+def test_conversation_for_another_name_is_not_reused(client, stub_server):
+    agent = ChatAgent("apt-test", "prompt", client=client, conversation_pool_size=4)
+    agent.prewarm_chat("alice", "Alice")
+    wait_for(lambda: stub_server.requests.get("create_chat") == 1)
+    agent.create_chat("alice", "Alicia")
+
+    assert stub_server.requests["create_chat"] == 2
+    assert stub_server.last_requests["create_chat"]["partner_name"] == "Alicia"
+    assert agent.conversation_pool.stats().misses == 1
+    agent.conversation_pool.close()
+
+
+def test_failed_prewarm_falls_back_to_on_demand_creation(client, stub_server):
+    agent = ChatAgent("apt-test", "prompt", client=client, conversation_pool_size=4)
+    stub_server.fail("create_chat", 400)
+    agent.prewarm_chat("alice", "Alice")
+    chat = agent.create_chat("alice", "Alice")
+
+    assert chat.chat_id
+    assert stub_server.requests["create_chat"] == 2
+    assert agent.conversation_pool.stats().failures == 1
+    agent.conversation_pool.close()
+
+
+def test_acquire_waits_for_a_conversation_being_created():
+    release = threading.Event()
+
+    def create(chat_data):
+        release.wait()
+        return "conversation-1"
+
+    pool = ConversationPool(create)
+    pool.prewarm("alice", {"partner_id": "alice"})
+    future = pool.acquire("alice", {"partner_id": "alice"})
+    assert not future.done()
+    release.set()
+    assert future.result(timeout=1) == "conversation-1"
+    pool.close()
+
+
+def test_expired_and_excess_conversations_are_not_handed_out():
+    pool = ConversationPool(lambda chat_data: chat_data["partner_id"], max_size=1, ttl=0.05)
+    assert pool.prewarm("alice", {"partner_id": "alice"})
+    assert not pool.prewarm("bob", {"partner_id": "bob"})
+
+    time.sleep(0.1)
+    assert pool.acquire("alice", {"partner_id": "alice"}) is None
+    stats = pool.stats()
+    assert (stats.expired, stats.rejected, stats.misses) == (1, 1, 1)
+    pool.close()
+
+
+def test_closed_pool_rejects_prewarming():
+    pool = ConversationPool(lambda chat_data: "conversation-1")
+    pool.close()
+    assert not pool.prewarm("alice", {"partner_id": "alice"})
+
+
+def test_pool_size_must_be_positive():
+    with pytest.raises(ValueError):
+        ConversationPool(lambda chat_data: "conversation-1", max_size=0)
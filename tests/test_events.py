@@ -0,0 +1,116 @@
+import logging
+
+import pytest
+
+from game_sdk.game import events
+from game_sdk.game.agent import Agent, WorkerConfig
+from game_sdk.game.custom_types import Function, FunctionResultStatus
+from game_sdk.game.events import ConsoleSink, EventBus, EventSink, LoggingSink
+
+
+class ListSink(EventSink):
+    def __init__(self):
+        self.events = []
+
+    def emit(self, event):
+        self.events.append(event)
+
+
+@pytest.fixture
+def format_calls(monkeypatch):
+    """
+    Counts formatter calls per event kind
+    """
+    calls = {}
+    formatters = dict(events.FORMATTERS)
+
+    def counting(kind, formatter):
+        def format(data):
+            calls[kind] = calls.get(kind, 0) + 1
+            return formatter(data)
+        return format
+
+    monkeypatch.setattr(events, "FORMATTERS", {kind: counting(kind, f) for kind, f in formatters.items()})
+    return calls
+
+
+def make_agent(client, bus):
+    noop = Function(
+        fn_name="noop", fn_description="Does nothing", args=[],
+        executable=lambda: (FunctionResultStatus.DONE, "done", {}),
+    )
+    worker = WorkerConfig("worker", "Does the work", lambda result, state: {}, [noop])
+    agent = Agent(
+        "apt-test", "agent", "goal", "description", lambda result, state: {},
+        workers=[worker], client=client, events=bus,
+    )
+    agent.compile()
+    return agent
+
+
+def test_events_are_formatted_only_when_read(client, format_calls):
+    sink = ListSink()
+    agent = make_agent(client, EventBus([sink]))
+
+    agent.step()
+
+    kinds = [event.kind for event in sink.events]
+    assert "agent_step" in kinds and "agent_action" in kinds
+    assert format_calls == {}
+
+    action = next(event for event in sink.events if event.kind == "agent_action")
+    assert action.title == "Action Type: call_function"
+    assert "Function Name: noop" in action.message
+    assert "Function Name: noop" in str(action)
+    assert format_calls == {"agent_action": 1}
+
+
+def test_headless_steps_never_format(client, capsys, monkeypatch):
+    def fail(*args):
+        raise AssertionError("event created without sinks")
+
+    monkeypatch.setattr(events, "Event", fail)
+    agent = make_agent(client, EventBus())
+
+    agent.step()
+
+    assert capsys.readouterr().out == ""
+
+
+def test_logging_sink_skips_disabled_levels(client, format_calls, caplog):
+    logger = logging.getLogger("game_sdk.test_events")
+    agent = make_agent(client, EventBus([LoggingSink(logger, level=logging.DEBUG)]))
+
+    with caplog.at_level(logging.INFO, logger=logger.name):
+        agent.step()
+    assert format_calls == {}
+    assert caplog.records == []
+
+    with caplog.at_level(logging.DEBUG, logger=logger.name):
+        agent.step()
+    assert format_calls.get("agent_action") == 1
+    record = next(r for r in caplog.records if r.event_kind == "agent_action")
+    assert "Function Name: noop" in record.getMessage()
+
+
+def test_console_sink_prints_panels_and_plain_lines(capsys):
+    bus = EventBus([ConsoleSink()])
+
+    bus.emit("task_generated", "agent-1", current_task="explore the map")
+    bus.emit("worker_task_ended", "worker-1")
+
+    out = capsys.readouterr().out
+    assert "New Task Generated" in out and "explore the map" in out
+    assert "Task completed or ended (not possible)" in out
+
+
+def test_emit_uses_the_activated_bus():
+    sink = ListSink()
+    bus = EventBus([sink])
+
+    with bus.activate():
+        events.emit("custom", "fn-1", value=1)
+    assert events.current_event_bus() is not bus
+
+    assert len(sink.events) == 1
+    assert str(sink.events[0]) == "custom: {'value': 1}"
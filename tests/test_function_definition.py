@@ -0,0 +1,55 @@
+import json
+
+from game_sdk.game.custom_types import Argument, Function
+
+
+def make_function():
+    return Function(
+        fn_name="search", fn_description="Searches", args=[Argument(name="query", description="Query")],
+    )
+
+
+def test_definition_is_built_once():
+    fn = make_function()
+    assert fn.get_function_def() is fn.get_function_def()
+    assert fn.get_function_def_json() is fn.get_function_def_json()
+    assert json.loads(fn.get_function_def_json()) == fn.get_function_def()
+    assert "executable" not in fn.get_function_def()
+
+
+def test_assigning_a_definition_field_rebuilds_it():
+    fn = make_function()
+    before, before_json = fn.get_function_def(), fn.get_function_def_json()
+    fn.hint = "Use short queries"
+
+    assert fn.get_function_def() is not before
+    assert fn.get_function_def()["hint"] == "Use short queries"
+    assert json.loads(fn.get_function_def_json())["hint"] == "Use short queries"
+    assert before_json != fn.get_function_def_json()
+
+
+def test_assigning_local_fields_keeps_it():
+    fn = make_function()
+    before = fn.get_function_def()
+    fn.timeout = 5
+    fn.executable = lambda query: None
+    assert fn.get_function_def() is before
+
+
+def test_copy_with_update_gets_its_own_definition():
+    fn = make_function()
+    fn.get_function_def()
+    renamed = fn.model_copy(update={"fn_name": "lookup"})
+
+    assert renamed.get_function_def()["fn_name"] == "lookup"
+    assert fn.get_function_def()["fn_name"] == "search"
+
+
+def test_in_place_changes_need_an_explicit_invalidation():
+    fn = make_function()
+    fn.get_function_def()
+    fn.args.append(Argument(name="limit", description="Maximum results"))
+    assert len(fn.get_function_def()["args"]) == 1
+
+    fn.invalidate_function_def()
+    assert [a["name"] for a in fn.get_function_def()["args"]] == ["query", "limit"]
@@ -0,0 +1,127 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from game_sdk.game.custom_types import Function, FunctionResultStatus
+
+
+def make_function(executable, **kwargs):
+    return Function(fn_name="slow", fn_description="Takes its time", args=[], executable=executable, **kwargs)
+
+
+def sleeper(seconds, release=None):
+    def executable():
+        if release is not None:
+            release.wait(seconds)
+        else:
+            time.sleep(seconds)
+        return FunctionResultStatus.DONE, "slept", {}
+    return executable
+
+
+def test_slow_executable_times_out():
+    release = threading.Event()
+    fn = make_function(sleeper(10, release), timeout=0.05)
+
+    start = time.monotonic()
+    result = fn.execute(fn_id="1", args={})
+    release.set()
+
+    assert time.monotonic() - start < 5
+    assert result.action_status == FunctionResultStatus.FAILED
+    assert result.feedback_message == "Error executing function: 'slow' timed out after 0.05 seconds"
+    assert result.action_id == "1"
+
+
+def test_fast_executable_finishes_within_the_timeout():
+    fn = make_function(sleeper(0), timeout=5)
+
+    result = fn.execute(fn_id="1", args={})
+
+    assert result.action_status == FunctionResultStatus.DONE
+    assert result.feedback_message == "slept"
+
+
+def test_timeout_error_of_the_executable_is_not_a_timeout():
+    def executable():
+        raise TimeoutError("upstream API timed out")
+
+    for fn in (make_function(executable, timeout=5), make_function(executable)):
+        result = fn.execute(fn_id="1", args={})
+        assert result.action_status == FunctionResultStatus.FAILED
+        assert result.feedback_message == "Error executing function: upstream API timed out"
+
+
+def test_executable_runs_on_the_given_executor():
+    threads = []
+
+    def executable():
+        threads.append(threading.current_thread().name)
+        return FunctionResultStatus.DONE, "ok", {}
+
+    with ThreadPoolExecutor(thread_name_prefix="functions") as executor:
+        make_function(executable, executor=executor).execute(fn_id="1", args={})
+
+    assert threads[0].startswith("functions")
+
+
+def test_coroutine_executable_is_cancelled_on_timeout():
+    cancelled = []
+
+    async def executable():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+        return FunctionResultStatus.DONE, "slept", {}
+
+    fn = make_function(executable, timeout=0.05)
+
+    sync_result = fn.execute(fn_id="1", args={})
+    async_result = asyncio.run(fn.aexecute(fn_id="2", args={}))
+
+    assert cancelled == [True, True]
+    for result in (sync_result, async_result):
+        assert result.action_status == FunctionResultStatus.FAILED
+        assert "timed out after 0.05 seconds" in result.feedback_message
+
+
+def test_aexecute_does_not_block_the_loop():
+    release = threading.Event()
+    fn = make_function(sleeper(10, release), timeout=0.2)
+
+    async def main():
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker = asyncio.ensure_future(tick())
+        result = await fn.aexecute(fn_id="1", args={})
+        ticker.cancel()
+        return result, ticks
+
+    result, ticks = asyncio.run(main())
+    release.set()
+
+    assert result.action_status == FunctionResultStatus.FAILED
+    assert ticks >= 5
+
+
+def test_coroutine_executable_runs_from_inside_a_loop():
+    async def executable():
+        await asyncio.sleep(0)
+        return FunctionResultStatus.DONE, "awaited", {}
+
+    fn = make_function(executable, timeout=5)
+
+    async def main():
+        # a synchronous execute() call made by code that is itself running on a loop
+        return fn.execute(fn_id="1", args={})
+
+    assert asyncio.run(main()).feedback_message == "awaited"
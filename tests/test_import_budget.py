@@ -0,0 +1,51 @@
+import os
+import subprocess
+import sys
+from typing import Dict
+
+import pytest
+
+from bench_import import IMPORT_BUDGETS
+
+# import times measured in CI vary with the machine; scale the budgets there if needed
+BUDGET_SCALE = float(os.environ.get("GAME_SDK_IMPORT_BUDGET_SCALE", "1"))
+
+
+def import_times(module: str) -> Dict[str, int]:
+    """
+    Imports ``module`` in a fresh interpreter with ``-X importtime`` and returns the
+    cumulative import time in microseconds of every module it loaded
+    """
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stderr
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize("module", sorted(IMPORT_BUDGETS))
+def test_optional_modules_are_not_imported_eagerly(module):
+    _, forbidden = IMPORT_BUDGETS[module]
+    loaded = import_times(module)
+    assert [name for name in forbidden if name in loaded] == []
+
+
+@pytest.mark.parametrize("module", ["game_sdk.game.agent", "game_sdk.game.chat_agent"])
+def test_rich_httpx_and_asyncio_are_not_imported_eagerly(module):
+    loaded = import_times(module)
+    assert {"rich", "httpx", "asyncio"}.isdisjoint(loaded)
+
+
+@pytest.mark.parametrize("module", sorted(IMPORT_BUDGETS))
+def test_import_time_within_budget(module):
+    budget_ms, _ = IMPORT_BUDGETS[module]
+    cumulative_ms = import_times(module)[module] / 1000
+    assert cumulative_ms <= budget_ms * BUDGET_SCALE
@@ -0,0 +1,83 @@
+import copy
+
+import pytest
+
+from game_sdk.game.custom_types import Argument, Function
+from game_sdk.game.payload import ActionSpace, FunctionCatalog
+
+
+def make_function(name):
+    return Function(fn_name=name, fn_description=f"Runs {name}", args=[Argument(name="x", description="Input")])
+
+
+@pytest.fixture
+def action_space():
+    return ActionSpace((name, make_function(name)) for name in ("a", "b"))
+
+
+def test_unchanged_action_space_reuses_the_list_without_visiting_functions(action_space, monkeypatch):
+    catalog = FunctionCatalog()
+    first = catalog.get("worker", action_space)
+
+    def fail(self):
+        raise AssertionError("definition rebuilt")
+
+    monkeypatch.setattr(Function, "get_function_def", fail)
+    assert catalog.get("worker", action_space) is first
+
+
+@pytest.mark.parametrize("change", [
+    lambda space: space.__setitem__("c", make_function("c")),
+    lambda space: space.pop("a"),
+    lambda space: space.update(a=make_function("a")),
+    lambda space: space.__delitem__("b"),
+    lambda space: space.clear(),
+])
+def test_changed_action_space_is_collected_again(action_space, change):
+    catalog = FunctionCatalog()
+    first = catalog.get("worker", action_space)
+    change(action_space)
+    second = catalog.get("worker", action_space)
+
+    assert second is not first
+    assert [d["fn_name"] for d in second] == list(action_space)
+
+
+def test_changed_function_definition_is_collected_again(action_space):
+    catalog = FunctionCatalog()
+    catalog.get("worker", action_space)
+    action_space["a"].fn_description = "Runs a differently"
+    assert catalog.get("worker", action_space)[0]["fn_description"] == "Runs a differently"
+
+
+def test_local_only_changes_keep_the_list(action_space):
+    catalog = FunctionCatalog()
+    first = catalog.get("worker", action_space)
+    action_space["a"].timeout = 5
+    assert catalog.get("worker", action_space) is first
+
+
+def test_another_action_space_under_the_same_key_is_collected(action_space):
+    catalog = FunctionCatalog()
+    catalog.get("worker", action_space)
+    other = copy.copy(action_space)
+    other.pop("b")
+    assert [d["fn_name"] for d in catalog.get("worker", other)] == ["a"]
+    assert [d["fn_name"] for d in catalog.get("worker", action_space)] == ["a", "b"]
+
+
+def test_plain_dicts_are_compared_function_by_function():
+    catalog = FunctionCatalog()
+    functions = {"a": make_function("a")}
+    first = catalog.get("worker", functions)
+    assert catalog.get("worker", functions) is first
+
+    functions["b"] = make_function("b")
+    assert [d["fn_name"] for d in catalog.get("worker", functions)] == ["a", "b"]
+
+
+def test_invalidate_drops_the_cached_list(action_space):
+    catalog = FunctionCatalog()
+    first = catalog.get("worker", action_space)
+    catalog.invalidate("worker")
+    assert catalog.get("worker", action_space) is not first
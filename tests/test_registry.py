@@ -0,0 +1,108 @@
+import multiprocessing
+import threading
+import time
+import uuid
+
+from game_sdk.game.registry import RegistrationCache
+
+
+class CountingClient:
+    """
+    Stands in for a GAME client: registrations are slow and appended to a log file
+    """
+    api_key = "apt-test"
+    base_url = "http://stub"
+
+    def __init__(self, log_path: str):
+        self.log_path = log_path
+
+    def create_agent(self, name, description, goal):
+        time.sleep(0.05)
+        with open(self.log_path, "a") as f:
+            f.write(f"{name}\n")
+        return f"agent-{uuid.uuid4()}"
+
+    def registrations(self):
+        try:
+            with open(self.log_path) as f:
+                return f.read().split()
+        except FileNotFoundError:
+            return []
+
+
+def register(path, log_path, results):
+    results.put(RegistrationCache(path).get_or_create_agent(CountingClient(log_path), "agent", "description", "goal"))
+
+
+def test_registration_is_reused_after_restart(tmp_path):
+    client = CountingClient(str(tmp_path / "log"))
+    path = str(tmp_path / "registry.json")
+    agent_id = RegistrationCache(path).get_or_create_agent(client, "agent", "description", "goal")
+
+    assert RegistrationCache(path).get_or_create_agent(client, "agent", "description", "goal") == agent_id
+    assert RegistrationCache(path).get_or_create_agent(client, "agent", "description", "new goal") != agent_id
+    assert client.registrations() == ["agent", "agent"]
+
+
+def test_concurrent_threads_register_once(tmp_path):
+    client = CountingClient(str(tmp_path / "log"))
+    registry = RegistrationCache(str(tmp_path / "registry.json"))
+    agent_ids = []
+    threads = [
+        threading.Thread(target=lambda: agent_ids.append(
+            registry.get_or_create_agent(client, "agent", "description", "goal")
+        ))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert client.registrations() == ["agent"]
+    assert len(set(agent_ids)) == 1
+
+
+def test_concurrent_processes_register_once(tmp_path):
+    path, log_path = str(tmp_path / "registry.json"), str(tmp_path / "log")
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    processes = [context.Process(target=register, args=(path, log_path, results)) for _ in range(4)]
+    for process in processes:
+        process.start()
+    agent_ids = {results.get(timeout=30) for _ in processes}
+    for process in processes:
+        process.join()
+
+    assert CountingClient(log_path).registrations() == ["agent"]
+    assert len(agent_ids) == 1
+
+
+def test_updates_from_other_instances_are_merged(tmp_path):
+    path = str(tmp_path / "registry.json")
+    first, second = RegistrationCache(path), RegistrationCache(path)
+    first.set("a", "agent-a")
+    second.set("b", "agent-b")
+
+    assert RegistrationCache(path).get("a") == "agent-a"
+    assert RegistrationCache(path).get("b") == "agent-b"
+
+
+def test_invalidated_registration_is_created_again(tmp_path):
+    client = CountingClient(str(tmp_path / "log"))
+    path = str(tmp_path / "registry.json")
+    registry = RegistrationCache(path)
+    registry.get_or_create_agent(client, "agent", "description", "goal")
+
+    registry.invalidate(RegistrationCache.agent_key(client, "agent", "description", "goal"))
+    assert RegistrationCache(path).get(RegistrationCache.agent_key(client, "agent", "description", "goal")) is None
+    registry.get_or_create_agent(client, "agent", "description", "goal")
+    assert client.registrations() == ["agent", "agent"]
+
+
+def test_clear_drops_every_registration(tmp_path):
+    path = str(tmp_path / "registry.json")
+    registry = RegistrationCache(path)
+    registry.set("a", "agent-a")
+    registry.clear()
+    assert RegistrationCache(path).get("a") is None
@@ -0,0 +1,136 @@
+import asyncio
+import time
+
+import pytest
+
+from game_sdk.game.api_v2 import GAMEClientV2
+from game_sdk.game.resilience import CircuitBreaker, CircuitOpenError, ResiliencePolicy
+
+
+def test_breaker_opens_after_consecutive_failures():
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+
+
+def test_half_open_breaker_lets_one_trial_call_through():
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    time.sleep(0.06)
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_non_idempotent_calls_only_retry_rejections():
+    policy = ResiliencePolicy(max_retries=3)
+    assert policy.should_retry_status(0, 503, idempotent=False)
+    assert not policy.should_retry_status(0, 500, idempotent=False)
+    assert policy.should_retry_status(0, 500, idempotent=True)
+    assert not policy.should_retry_status(3, 503, idempotent=True)
+    assert not policy.should_retry_error(0, request_sent=True, idempotent=False)
+    assert policy.should_retry_error(0, request_sent=False, idempotent=False)
+
+
+def test_delay_honours_retry_after():
+    policy = ResiliencePolicy(backoff_base=1, jitter=False, max_retry_after=10)
+    assert policy.get_delay(2) == 4
+    assert policy.get_delay(0, retry_after="3") == 3
+    assert policy.get_delay(0, retry_after="120") == 10
+
+
+def test_idempotent_request_is_retried(transport, stub_server):
+    stub_server.fail("get_agent_action", 500, 502)
+    response = transport.post(
+        f"{stub_server.base_url}/agents/agent-1/actions", operation="get_agent_action", idempotent=True, json={}
+    )
+    assert response.status_code == 200
+    assert stub_server.requests["get_agent_action"] == 3
+
+
+def test_action_fetch_is_only_retried_when_rejected(client, stub_server):
+    # the request submits the last function result, so a server error may have advanced the agent
+    stub_server.fail("get_agent_action", 500)
+    with pytest.raises(ValueError):
+        client.get_agent_action("agent-1", {}, "model")
+    assert stub_server.requests["get_agent_action"] == 1
+
+    stub_server.fail("get_agent_action", 503)
+    assert client.get_agent_action("agent-1", {}, "model")["action_type"] == "wait"
+    assert stub_server.requests["get_agent_action"] == 3
+
+
+def test_async_action_fetch_is_only_retried_when_rejected(stub_server, transport):
+    pytest.importorskip("httpx")
+    from game_sdk.game.api_v2_async import AsyncGAMEClientV2
+
+    async def main():
+        async with AsyncGAMEClientV2(
+            "apt-test", base_url=stub_server.base_url, resilience=transport.resilience
+        ) as async_client:
+            stub_server.fail("get_worker_action", 502)
+            with pytest.raises(ValueError):
+                await async_client.get_worker_action("agent-1", "submission-1", {}, "model")
+            stub_server.fail("get_worker_action", 429)
+            return await async_client.get_worker_action("agent-1", "submission-1", {}, "model")
+
+    assert asyncio.run(main())["action_type"] == "wait"
+    assert stub_server.requests["get_worker_action"] == 3
+
+
+def test_non_idempotent_request_is_only_retried_when_rejected(client, stub_server):
+    stub_server.fail("set_worker_task", 503)
+    assert client.set_worker_task("agent-1", "task")["submission_id"]
+    assert stub_server.requests["set_worker_task"] == 2
+
+    stub_server.fail("set_worker_task", 500)
+    with pytest.raises(ValueError):
+        client.set_worker_task("agent-1", "task")
+    assert stub_server.requests["set_worker_task"] == 3
+
+
+def test_open_breaker_rejects_calls_locally(stub_server, transport, client):
+    transport.resilience = ResiliencePolicy(max_retries=0, failure_threshold=2, recovery_timeout=60)
+    stub_server.fail("get_agent_action", 500, 500)
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            client.get_agent_action("agent-1", {}, "model")
+
+    with pytest.raises(CircuitOpenError):
+        client.get_agent_action("agent-1", {}, "model")
+    assert stub_server.requests["get_agent_action"] == 2
+
+
+def test_breakers_are_per_host(stub_server, transport, client):
+    transport.resilience = ResiliencePolicy(max_retries=0, failure_threshold=1, recovery_timeout=60)
+    other_host = GAMEClientV2(
+        "apt-test", transport=transport, base_url=stub_server.base_url.replace("127.0.0.1", "localhost")
+    )
+    stub_server.fail("create_agent", 500)
+    with pytest.raises(ValueError):
+        client.create_agent("name", "description", "goal")
+    with pytest.raises(CircuitOpenError):
+        client.create_agent("name", "description", "goal")
+
+    # the same operation on another host has a breaker of its own
+    assert other_host.create_agent("name", "description", "goal")
+
+
+def test_breaker_key_includes_the_host():
+    assert ResiliencePolicy.breaker_key("https://api.example.com/v2/agents", "create_agent") == (
+        "api.example.com/create_agent"
+    )
+    assert ResiliencePolicy.breaker_key("https://api.example.com/v2/agents", None) is None
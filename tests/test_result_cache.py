@@ -0,0 +1,102 @@
+import asyncio
+
+from game_sdk.game.custom_types import Function, FunctionResultStatus
+from game_sdk.game.events import EventBus, EventSink
+from game_sdk.game.result_cache import ResultCache
+
+
+class ListSink(EventSink):
+    def __init__(self):
+        self.events = []
+
+    def emit(self, event):
+        self.events.append(event)
+
+
+def make_function(executable, cache):
+    return Function(fn_name="lookup", fn_description="Looks a value up", args=[], executable=executable, cache=cache)
+
+
+def test_caches_results_without_info():
+    calls = []
+
+    def lookup():
+        calls.append(1)
+        return FunctionResultStatus.DONE, "found", None
+
+    fn = make_function(lookup, ResultCache())
+    first, second = fn.execute(fn_id="1", args={}), fn.execute(fn_id="2", args={})
+
+    assert len(calls) == 1
+    assert first.info is None and second.info is None
+    assert second.action_id == "2"
+    assert fn.cache.stats().hits == 1
+
+
+def test_aexecute_caches_results_without_info():
+    calls = []
+
+    async def lookup():
+        calls.append(1)
+        return FunctionResultStatus.DONE, "found", None
+
+    fn = make_function(lookup, ResultCache())
+
+    async def main():
+        return [await fn.aexecute(fn_id=str(i), args={}) for i in range(2)]
+
+    results = asyncio.run(main())
+    assert len(calls) == 1
+    assert [r.action_status for r in results] == [FunctionResultStatus.DONE] * 2
+
+
+def test_failed_results_are_not_cached():
+    calls = []
+
+    def lookup():
+        calls.append(1)
+        return FunctionResultStatus.FAILED, "unavailable", {}
+
+    fn = make_function(lookup, ResultCache())
+    fn.execute(fn_id="1", args={})
+    fn.execute(fn_id="2", args={})
+    assert len(calls) == 2
+
+
+def test_cached_info_is_copied():
+    cache = ResultCache()
+    cache.put({"q": 1}, (FunctionResultStatus.DONE, "ok", {"price": 1}))
+    cache.get({"q": 1})[2]["price"] = 2
+    assert cache.get({"q": 1})[2] == {"price": 1}
+
+
+def test_evicts_least_recently_used():
+    cache = ResultCache(max_entries=2)
+    for q in (1, 2):
+        cache.put({"q": q}, (FunctionResultStatus.DONE, "ok", {}))
+    cache.get({"q": 1})
+    cache.put({"q": 3}, (FunctionResultStatus.DONE, "ok", {}))
+
+    assert cache.get({"q": 2}) is None
+    assert cache.get({"q": 1}) is not None
+    assert cache.stats().evictions == 1
+
+
+class BrokenCache(ResultCache):
+    def put(self, args, result):
+        raise RuntimeError("cache backend unavailable")
+
+
+def test_cache_failures_do_not_fail_the_call():
+    sink = ListSink()
+    fn = make_function(lambda: (FunctionResultStatus.DONE, "found", {}), BrokenCache())
+
+    with EventBus([sink]).activate():
+        result = fn.execute(fn_id="1", args={})
+        async_result = asyncio.run(fn.aexecute(fn_id="2", args={}))
+
+    assert result.action_status == FunctionResultStatus.DONE
+    assert async_result.action_status == FunctionResultStatus.DONE
+    errors = [event for event in sink.events if event.kind == "function_cache_error"]
+    assert [event.data["fn_id"] for event in errors] == ["1", "2"]
+    assert errors[0].message == "Could not cache the result of 'lookup': cache backend unavailable"
@@ -0,0 +1,192 @@
+import threading
+import time
+
+import pytest
+
+from game_sdk.game.agent import Agent, WorkerConfig
+from game_sdk.game.events import EventBus
+from game_sdk.game.runtime import AgentRuntime
+from game_sdk.game.scheduler import TokenBucketScheduler
+
+
+def make_agent(client, name):
+    worker = WorkerConfig("worker", "Does the work", lambda result, state: {}, [])
+    agent = Agent(
+        "apt-test", name, "goal", "description", lambda result, state: {},
+        workers=[worker], client=client, events=EventBus(),
+    )
+    agent.compile()
+    return agent
+
+
+def test_priority_sets_the_share_of_steps(client):
+    low, high = make_agent(client, "low"), make_agent(client, "high")
+    runtime = AgentRuntime(max_concurrent_steps=1)
+    runtime.add_agent(low, priority=1)
+    runtime.add_agent(high, priority=2)
+    runtime.run(duration=0.5)
+
+    stats = runtime.stats()
+    assert stats[low].steps > 0
+    assert stats[high].steps / stats[low].steps == pytest.approx(2, rel=0.1)
+
+
+def test_agents_added_later_do_not_get_a_burst(client):
+    first, late = make_agent(client, "first"), make_agent(client, "late")
+    runtime = AgentRuntime(max_concurrent_steps=1)
+    runtime.add_agent(first)
+    runtime.run(duration=0.2)
+    runtime.add_agent(late)
+    before = runtime.stats()[first].steps
+    runtime.run(duration=0.3)
+
+    stats = runtime.stats()
+    assert abs((stats[first].steps - before) - stats[late].steps) <= 1
+
+
+def test_api_calls_are_capped_across_agents(client, stub_server):
+    in_flight, peak, lock = [0], [0], threading.Lock()
+    script = stub_server.action_script
+
+    def counting_script(data, step, agent_state):
+        with lock:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+        threading.Event().wait(0.01)
+        with lock:
+            in_flight[0] -= 1
+        return script(data, step, agent_state)
+
+    stub_server.action_script = counting_script
+    runtime = AgentRuntime(max_concurrent_steps=8, max_api_calls=2)
+    for i in range(6):
+        runtime.add_agent(make_agent(client, f"agent-{i}"))
+    runtime.run(duration=0.3)
+
+    assert peak[0] == 2
+
+
+def test_remove_agent_restores_its_own_slots(client):
+    agent = make_agent(client, "agent")
+    own_slots = (agent._api_slot, agent._function_slot)
+    runtime = AgentRuntime(max_api_calls=2, max_function_calls=2)
+    runtime.add_agent(agent)
+    # adding it again (e.g. to change its priority) keeps the slots it had before joining
+    runtime.add_agent(agent, priority=2)
+    assert agent._api_slot is not own_slots[0]
+
+    runtime.remove_agent(agent)
+    assert (agent._api_slot, agent._function_slot) == own_slots
+
+
+def test_failing_steps_are_counted_and_backed_off(client, stub_server):
+    agent = make_agent(client, "agent")
+    stub_server.fail("get_agent_action", *[400] * 10)
+    runtime = AgentRuntime(error_backoff=60)
+    runtime.add_agent(agent)
+    runtime.run(duration=0.2)
+
+    stats = runtime.stats()[agent]
+    assert (stats.steps, stats.errors) == (0, 1)
+    assert "400" in stats.last_error
+
+
+def test_rate_limit_of_the_scheduler_is_honoured(client):
+    agent = make_agent(client, "agent")
+    runtime = AgentRuntime()
+    runtime.add_agent(agent, scheduler=TokenBucketScheduler(steps_per_minute=600, burst=2))
+    runtime.run(duration=0.5)
+
+    # 2 burst tokens plus 10 per second (unlimited, the stub allows hundreds of steps)
+    steps = runtime.stats()[agent].steps
+    assert 3 <= steps <= 2 + 5 + 1
+
+
+def test_wake_does_not_bypass_the_rate_limit(client):
+    agent = make_agent(client, "agent")
+    runtime = AgentRuntime()
+    runtime.add_agent(agent, scheduler=TokenBucketScheduler(steps_per_minute=60))
+    runtime.start()
+    for _ in range(10):
+        runtime.wake(agent)
+        time.sleep(0.03)
+    runtime.stop()
+
+    assert runtime.stats()[agent].steps == 1
+
+
+def slow_steps(stub_server, duration=0.05):
+    """
+    Makes every agent step take ``duration`` seconds and returns the peak number of
+    concurrent action requests
+    """
+    in_flight, peak, lock = [0], [0], threading.Lock()
+    script = stub_server.action_script
+
+    def slow_script(data, step, agent_state):
+        with lock:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+        time.sleep(duration)
+        with lock:
+            in_flight[0] -= 1
+        return script(data, step, agent_state)
+
+    stub_server.action_script = slow_script
+    return peak
+
+
+def wait_for_step(stub_server, count):
+    deadline = time.monotonic() + 5
+    while stub_server.requests.get("get_agent_action", 0) < count and time.monotonic() < deadline:
+        time.sleep(0.005)
+
+
+def test_re_adding_a_stepping_agent_keeps_it_to_one_step(client, stub_server):
+    peak = slow_steps(stub_server)
+    agent = make_agent(client, "agent")
+    runtime = AgentRuntime(max_concurrent_steps=4)
+    runtime.add_agent(agent)
+    runtime.start()
+
+    wait_for_step(stub_server, 1)
+    runtime.add_agent(agent, priority=2)
+    wait_for_step(stub_server, 2)
+    runtime.remove_agent(agent)
+    runtime.add_agent(agent)
+    wait_for_step(stub_server, 4)
+    runtime.stop()
+
+    assert peak[0] == 1
+    assert runtime.stats()[agent].steps == stub_server.requests["get_agent_action"]
+
+
+def test_removed_agent_is_dropped_once_its_step_ends(client, stub_server):
+    slow_steps(stub_server)
+    agent = make_agent(client, "agent")
+    runtime = AgentRuntime()
+    runtime.add_agent(agent)
+    runtime.start()
+
+    wait_for_step(stub_server, 1)
+    runtime.remove_agent(agent)
+    assert agent not in runtime.stats()
+    runtime.stop()
+
+    assert runtime._entries == {}
+    assert stub_server.requests["get_agent_action"] == 1
+
+
+def test_stats_are_snapshots(client):
+    agent = make_agent(client, "agent")
+    runtime = AgentRuntime()
+    runtime.add_agent(agent)
+    runtime.run(duration=0.1)
+
+    snapshot = runtime.stats()[agent]
+    steps = snapshot.steps
+    snapshot.steps = -1
+    runtime.run(duration=0.1)
+
+    assert snapshot.steps == -1
+    assert runtime.stats()[agent].steps > steps
@@ -0,0 +1,115 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from game_sdk.game.custom_types import ActionResponse, ActionType
+from game_sdk.game.scheduler import (
+    AdaptiveBackoffScheduler,
+    HeartbeatScheduler,
+    TokenBucketScheduler,
+)
+
+WAIT = ActionResponse(action_type=ActionType.WAIT, agent_state={}, action_args={})
+CALL = ActionResponse(action_type=ActionType.CALL_FUNCTION, agent_state={}, action_args={})
+
+
+def wake_later(scheduler, delay=0.1):
+    timer = threading.Timer(delay, scheduler.wake)
+    timer.start()
+    return timer
+
+
+def test_wake_ends_a_sync_wait():
+    scheduler = HeartbeatScheduler(interval=30)
+    wake_later(scheduler)
+
+    start = time.monotonic()
+    scheduler.wait(WAIT)
+
+    assert time.monotonic() - start < 5
+
+
+def test_wake_ends_an_async_wait():
+    scheduler = HeartbeatScheduler(interval=30)
+
+    async def main():
+        wake_later(scheduler)
+        start = time.monotonic()
+        await scheduler.async_wait(WAIT)
+        return time.monotonic() - start
+
+    assert asyncio.run(main()) < 5
+
+
+def test_wake_before_wait_is_not_missed():
+    scheduler = HeartbeatScheduler(interval=30)
+
+    scheduler.wake()
+    start = time.monotonic()
+    scheduler.wait(WAIT)
+    scheduler.wake()
+    asyncio.run(scheduler.async_wait(WAIT))
+
+    assert time.monotonic() - start < 5
+
+
+class WakeDuringRegistration:
+    """
+    Lock calling ``wake`` from another thread right before the first acquisition, i.e.
+    after ``async_wait`` decided to wait but before its waiter is registered
+    """
+    def __init__(self, scheduler):
+        self.scheduler = scheduler
+        self.lock = threading.Lock()
+        self.fired = False
+
+    def __enter__(self):
+        if not self.fired:
+            self.fired = True
+            thread = threading.Thread(target=self.scheduler.wake)
+            thread.start()
+            thread.join()
+        self.lock.acquire()
+
+    def __exit__(self, *exc_info):
+        self.lock.release()
+
+
+def test_wake_racing_the_async_waiter_registration_is_not_lost():
+    scheduler = HeartbeatScheduler(interval=30)
+    scheduler._lock = WakeDuringRegistration(scheduler)
+
+    start = time.monotonic()
+    asyncio.run(scheduler.async_wait(WAIT))
+
+    assert scheduler._lock.fired
+    assert time.monotonic() - start < 5
+
+
+def test_adaptive_backoff_grows_while_idle_and_resets():
+    scheduler = AdaptiveBackoffScheduler(interval=1, initial_backoff=2, max_backoff=5, multiplier=2)
+
+    assert [scheduler.next_delay(WAIT) for _ in range(4)] == [2, 4, 5, 5]
+    assert scheduler.next_delay(CALL) == 1
+    assert scheduler.next_delay(WAIT) == 2
+
+
+def test_wake_does_not_bypass_the_token_bucket():
+    scheduler = TokenBucketScheduler(steps_per_minute=60, burst=1, scheduler=HeartbeatScheduler(interval=30))
+    scheduler.wake()
+
+    start = time.monotonic()
+    scheduler.wait(CALL)  # the burst token
+    scheduler.wake()
+    scheduler.wait(CALL)  # woken, but has to wait ~1s for the next token
+
+    assert 0.5 < time.monotonic() - start < 5
+
+
+def test_token_bucket_rejects_invalid_limits():
+    with pytest.raises(ValueError):
+        TokenBucketScheduler(steps_per_minute=0)
+    with pytest.raises(ValueError):
+        TokenBucketScheduler(steps_per_minute=60, burst=0)
@@ -0,0 +1,124 @@
+import time
+
+import pytest
+
+from game_sdk.game.agent import Agent, WorkerConfig
+from game_sdk.game.custom_types import Function, FunctionResult, FunctionResultStatus
+from game_sdk.game.events import EventBus
+from game_sdk.game.state import StateProvider, with_instructions
+
+
+def make_function(name):
+    return Function(
+        fn_name=name, fn_description=f"Runs {name}", args=[],
+        executable=lambda: (FunctionResultStatus.DONE, "done", {}),
+    )
+
+
+def result_of(name):
+    return make_function(name).execute(fn_id=name, args={})
+
+
+class CountingState:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, function_result, current_state):
+        self.calls += 1
+        return {"version": self.calls}
+
+
+def test_recomputes_only_for_relevant_results():
+    get_state = CountingState()
+    provider = StateProvider(get_state, depends_on=["pay_job"])
+
+    first = provider(None, None)
+    paid = result_of("pay_job")
+    searched = result_of("search")
+
+    assert provider(None, first) is first
+    assert provider(searched, first) is first
+    assert provider(paid, first) == {"version": 2}
+    # the same result again (a WAIT or GO_TO step) is not new
+    assert provider(paid, first) == {"version": 2}
+    assert (provider.computations, provider.reuses) == (2, 3)
+
+
+def test_any_function_is_relevant_without_depends_on():
+    provider = StateProvider(CountingState())
+    provider(None, None)
+
+    provider(result_of("search"), None)
+    # placeholder results, e.g. before the first action, come from no function
+    provider(FunctionResult(action_id="", action_status=FunctionResultStatus.DONE, feedback_message="", info={}), None)
+
+    assert provider.computations == 2
+
+
+def test_predicate_depends_on():
+    provider = StateProvider(CountingState(), depends_on=lambda result: result.fn_name.startswith("job_"))
+    provider(None, None)
+
+    provider(result_of("search"), None)
+    provider(result_of("job_deliver"), None)
+
+    assert provider.computations == 2
+
+
+def test_max_age_and_invalidate():
+    provider = StateProvider(CountingState(), depends_on=[], max_age=0.05)
+    provider(None, None)
+    provider(None, None)
+    assert provider.computations == 1
+
+    time.sleep(0.06)
+    provider(None, None)
+    assert provider.computations == 2
+
+    provider.invalidate()
+    provider(None, None)
+    assert provider.computations == 3
+
+
+def test_fork_evolves_separately():
+    provider = StateProvider(CountingState(), depends_on=["pay_job"])
+    state = provider(None, None)
+
+    forked = provider.fork()
+    assert forked(None, None) is state
+    forked.invalidate()
+    forked(None, None)
+
+    assert provider(None, None) is state
+    assert forked.computations == 1 and provider.computations == 1
+
+
+def test_instructions_are_merged_once_per_state():
+    instructions = ["be brief"]
+    provider = StateProvider(CountingState(), depends_on=["pay_job"])
+    get_state = with_instructions(provider, lambda: instructions[0])
+
+    first = get_state(None, None)
+    assert first == {"instructions": "be brief", "version": 1}
+    assert get_state(None, first) is first
+
+    instructions[0] = "be thorough"
+    assert get_state(None, first) == {"instructions": "be thorough", "version": 1}
+
+
+@pytest.mark.parametrize("depends_on, recomputes", [(["noop"], True), (["pay_job"], False)])
+def test_agent_steps_recompute_worker_state_only_when_relevant(client, depends_on, recomputes):
+    get_state = CountingState()
+    provider = StateProvider(get_state, depends_on=depends_on)
+    worker = WorkerConfig("worker", "Does the work", provider, [make_function("noop")])
+    agent = Agent(
+        "apt-test", "agent", "goal", "description", lambda result, state: {},
+        workers=[worker], client=client, events=EventBus(),
+    )
+    agent.compile()
+    before = get_state.calls
+
+    for _ in range(3):
+        agent.step()
+
+    assert get_state.calls - before == (3 if recomputes else 0)
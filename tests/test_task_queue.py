@@ -0,0 +1,94 @@
+import threading
+
+import pytest
+
+from stub_server import call_first_function
+
+from game_sdk.game.custom_types import Argument, Function, FunctionResultStatus
+from game_sdk.game.events import EventBus
+from game_sdk.game.state import StateProvider
+from game_sdk.game.task_queue import WorkerTaskQueue
+from game_sdk.game.worker import Worker
+
+
+def call_once(data, step, agent_state):
+    # one function call per task, then the task ends
+    if (data.get("action_result") or {}).get("action_id"):
+        return {"action_type": "wait", "agent_state": agent_state}
+    return call_first_function(data, step, agent_state)
+
+
+def record(value):
+    return FunctionResultStatus.DONE, "recorded", {"value": value}
+
+
+def get_state(function_result, current_state):
+    seen = list((current_state or {}).get("seen", []))
+    if function_result.info:
+        seen.append(function_result.info["value"])
+    return {"seen": seen}
+
+
+@pytest.fixture
+def worker(client, stub_server):
+    stub_server.action_script = call_once
+    record_fn = Function(
+        fn_name="record", fn_description="Records a value",
+        args=[Argument(name="value", description="Value to record")], executable=record,
+    )
+    return Worker(
+        "apt-test", "description", StateProvider(get_state), [record_fn],
+        instruction="be brief", client=client, events=EventBus(),
+    )
+
+
+def test_tasks_keep_their_own_state(worker, stub_server):
+    with WorkerTaskQueue(worker, max_concurrent_tasks=4) as queue:
+        results = [future.result() for future in [queue.submit(f"task {i}") for i in range(8)]]
+
+    assert stub_server.requests["create_agent"] == 1
+    assert len({r.submission_id for r in results}) == 8
+    for result in results:
+        assert result.state["seen"] == [result.last_result.info["value"]]
+        assert result.state["instructions"] == "be brief"
+    # forks start from a snapshot of the worker's provider, which is left untouched
+    assert worker.state == {"instructions": "be brief", "seen": []}
+    assert worker._get_state_fn.computations == 1
+
+
+def test_forks_use_their_own_instructions(worker):
+    task_worker = worker._fork_task()
+    task_worker.instruction = "be verbose"
+    task_worker.set_task("task")
+    task_worker.step()
+
+    assert task_worker.state["instructions"] == "be verbose"
+    assert worker.get_state_fn(None, worker.state)["instructions"] == "be brief"
+
+
+def test_tasks_run_concurrently_up_to_the_limit(worker):
+    in_flight, peak, lock = [0], [0], threading.Lock()
+    release = threading.Event()
+
+    def slow_record(value):
+        with lock:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+        release.wait(0.05)
+        with lock:
+            in_flight[0] -= 1
+        return record(value)
+
+    worker.action_space["record"].executable = slow_record
+    with WorkerTaskQueue(worker, max_concurrent_tasks=3) as queue:
+        futures = [queue.submit(f"task {i}") for i in range(9)]
+    assert all(future.result().last_result.action_status == FunctionResultStatus.DONE for future in futures)
+    assert peak[0] == 3
+
+
+def test_task_exceeding_max_steps_fails(worker, stub_server):
+    stub_server.action_script = call_first_function
+    with WorkerTaskQueue(worker, max_steps=2) as queue:
+        future = queue.submit("task")
+    with pytest.raises(RuntimeError):
+        future.result()
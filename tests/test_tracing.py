@@ -0,0 +1,144 @@
+import json
+import urllib.request
+
+import pytest
+
+from game_sdk.game.agent import Agent, WorkerConfig
+from game_sdk.game.custom_types import Function, FunctionResultStatus
+from game_sdk.game.events import EventBus
+from game_sdk.game.tracing import (
+    HistogramExporter,
+    JSONLinesExporter,
+    PrometheusExporter,
+    SpanExporter,
+    Tracer,
+    current_span,
+)
+
+
+class ListExporter(SpanExporter):
+    def __init__(self):
+        self.spans = []
+
+    def export(self, span):
+        self.spans.append(span)
+
+
+def make_agent(client, tracer):
+    noop = Function(
+        fn_name="noop", fn_description="Does nothing", args=[],
+        executable=lambda: (FunctionResultStatus.DONE, "done", {}),
+    )
+    worker = WorkerConfig("worker", "Does the work", lambda result, state: {}, [noop])
+    agent = Agent(
+        "apt-test", "agent", "goal", "description", lambda result, state: {},
+        workers=[worker], client=client, events=EventBus(), tracer=tracer,
+    )
+    agent.compile()
+    return agent
+
+
+def test_step_phases_are_exported_under_the_step_span(client):
+    exporter = ListExporter()
+    agent = make_agent(client, Tracer([exporter]))
+
+    agent.step()
+
+    spans = {span.name: span for span in exporter.spans}
+    step = spans["step"]
+    assert step.parent_id is None
+    assert step.attributes["action_type"] == "call_function"
+    for phase in ("build_payload", "get_action", "validate_response", "execute_function", "agent_state"):
+        assert spans[phase].parent_id == step.span_id
+        assert spans[phase].duration <= step.duration
+    assert spans["execute_function"].attributes["fn_name"] == "noop"
+
+    get_action = spans["get_action"]
+    assert get_action.attributes["request_bytes"] > 0
+    assert get_action.attributes["response_bytes"] > 0
+    assert get_action.attributes["attempts"] == 1
+
+
+def test_retries_are_counted_on_the_span(client, stub_server):
+    exporter = ListExporter()
+    agent = make_agent(client, Tracer([exporter]))
+    stub_server.fail("get_agent_action", 503)
+
+    agent.step()
+
+    get_action = next(span for span in exporter.spans if span.name == "get_action")
+    assert get_action.attributes["attempts"] == 2
+
+
+def test_errors_are_recorded():
+    exporter = ListExporter()
+    tracer = Tracer([exporter])
+
+    with pytest.raises(KeyError):
+        with tracer.span("execute_function"):
+            raise KeyError("missing")
+
+    assert exporter.spans[0].error == "KeyError: 'missing'"
+
+
+def test_nothing_is_recorded_without_exporters():
+    tracer = Tracer()
+
+    with tracer.span("step") as span:
+        assert not span.recording
+        assert current_span() is span
+        span.set_attribute("ignored", True)
+
+    exporter = ListExporter()
+    tracer.add_exporter(exporter)
+    with tracer.span("step"):
+        assert current_span().recording
+    tracer.remove_exporter(exporter)
+    with tracer.span("step"):
+        pass
+
+    assert [span.name for span in exporter.spans] == ["step"]
+
+
+def test_histogram_summary():
+    histogram = HistogramExporter(max_samples=3)
+    tracer = Tracer([histogram])
+    for _ in range(5):
+        with tracer.span("render"):
+            pass
+
+    summary = histogram.summary()["render"]
+    assert summary["count"] == 5
+    assert summary["p50"] <= summary["p99"]
+    assert len(histogram._histograms["render"].samples) == 3
+
+
+def test_json_lines_export(tmp_path):
+    path = tmp_path / "spans.jsonl"
+    tracer = Tracer([JSONLinesExporter(str(path))])
+    with tracer.span("step", agent_id="agent-1"):
+        with tracer.span("get_action"):
+            pass
+    tracer.close()
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [line["name"] for line in lines] == ["get_action", "step"]
+    assert lines[0]["parent_id"] == lines[1]["span_id"]
+    assert lines[1]["attributes"] == {"agent_id": "agent-1"}
+
+
+def test_prometheus_metrics_are_served():
+    exporter = PrometheusExporter(buckets=(0.5, 1.0))
+    tracer = Tracer([exporter])
+    with tracer.span("get_action"):
+        pass
+
+    port = exporter.serve(0)
+    try:
+        body = urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5).read().decode()
+    finally:
+        tracer.close()
+
+    assert 'game_sdk_step_phase_seconds_bucket{phase="get_action",le="0.5"} 1' in body
+    assert 'game_sdk_step_phase_seconds_bucket{phase="get_action",le="+Inf"} 1' in body
+    assert 'game_sdk_step_phase_seconds_count{phase="get_action"} 1' in body
@@ -0,0 +1,45 @@
+import threading
+
+from game_sdk.game.api import GAMEClient
+from game_sdk.game.api_v2 import GAMEClientV2
+from game_sdk.game.transport import HTTPTransport, get_default_transport, set_default_transport
+
+
+def test_consecutive_requests_reuse_one_connection(client, stub_server):
+    for _ in range(10):
+        client.get_agent_action("agent-1", {}, "model")
+    assert stub_server.requests["get_agent_action"] == 10
+    assert stub_server.connections == 1
+
+
+def test_clients_sharing_a_transport_share_its_connections(stub_server, transport):
+    clients = [GAMEClientV2("apt-test", transport=transport, base_url=stub_server.base_url) for _ in range(3)]
+    for client in clients:
+        client.create_agent("name", "description", "goal")
+    assert stub_server.connections == 1
+
+
+def test_concurrent_requests_stay_within_the_pool(stub_server):
+    transport = HTTPTransport(pool_maxsize=2, pool_block=True)
+    client = GAMEClientV2("apt-test", transport=transport, base_url=stub_server.base_url)
+    threads = [
+        threading.Thread(target=lambda: [client.get_agent_action("agent-1", {}, "model") for _ in range(5)])
+        for _ in range(6)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    transport.session.close()
+
+    assert stub_server.requests["get_agent_action"] == 30
+    assert stub_server.connections <= 2
+
+
+def test_clients_without_a_transport_share_the_default_one():
+    set_default_transport(None)
+    try:
+        v1, v2 = GAMEClient("api-key"), GAMEClientV2("apt-key")
+        assert v1._transport is v2._transport is get_default_transport()
+    finally:
+        set_default_transport(None)
@@ -0,0 +1,96 @@
+from game_sdk.game.agent import Agent, WorkerConfig
+from game_sdk.game.custom_types import Function
+from game_sdk.game.events import EventBus
+
+
+class CountingState:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, function_result, current_state):
+        self.calls += 1
+        return {}
+
+
+def make_config(get_state=None, instruction=""):
+    noop = Function(fn_name="noop", fn_description="Does nothing", args=[])
+    return WorkerConfig("worker", "Does the work", get_state or CountingState(), [noop], instruction=instruction)
+
+
+def make_agent(client, worker_pool_size, config=None, description="description"):
+    return Agent(
+        "apt-test", "agent", "goal", description, lambda result, state: {},
+        workers=[config or make_config()], client=client, events=EventBus(), worker_pool_size=worker_pool_size,
+    )
+
+
+def registrations(stub_server):
+    return stub_server.requests.get("create_agent", 0)
+
+
+def test_without_a_pool_every_call_returns_a_new_worker(client, stub_server):
+    agent = make_agent(client, worker_pool_size=0)
+    before = registrations(stub_server)
+
+    first, second = agent.get_worker("worker"), agent.get_worker("worker")
+
+    assert first is not second
+    assert first._agent_id == second._agent_id
+    assert registrations(stub_server) - before == 1
+
+
+def test_pooled_worker_is_reused_while_its_config_is_unchanged(client, stub_server):
+    get_state = CountingState()
+    agent = make_agent(client, worker_pool_size=2, config=make_config(get_state))
+
+    worker = agent.get_worker("worker")
+    calls = get_state.calls
+
+    assert agent.get_worker("worker") is worker
+    assert get_state.calls == calls
+    assert agent.get_worker("worker", reuse=False) is not worker
+
+
+def test_config_changes_create_a_new_worker(client, stub_server):
+    agent = make_agent(client, worker_pool_size=4)
+    worker = agent.get_worker("worker")
+    before = registrations(stub_server)
+
+    # an equal but new config object
+    agent.add_worker(make_config())
+    replaced = agent.get_worker("worker")
+    assert replaced is not worker
+
+    agent.get_worker_config("worker").instruction = "be brief"
+    reinstructed = agent.get_worker("worker")
+    assert reinstructed is not replaced
+    assert reinstructed.instruction == "be brief"
+
+    agent.agent_description = "another character"
+    assert agent.get_worker("worker") is not reinstructed
+
+    # the registration is shared per description
+    assert registrations(stub_server) - before == 1
+
+
+def test_least_recently_used_worker_is_evicted(client):
+    first_config, second_config = make_config(), make_config()
+    agent = make_agent(client, worker_pool_size=1, config=first_config)
+
+    first = agent.get_worker("worker")
+    agent.add_worker(second_config)
+    agent.get_worker("worker")
+    agent.add_worker(first_config)
+
+    assert agent.get_worker("worker") is not first
+
+
+def test_evict_worker(client):
+    agent = make_agent(client, worker_pool_size=2)
+    worker = agent.get_worker("worker")
+
+    agent.evict_worker("other")
+    assert agent.get_worker("worker") is worker
+
+    agent.evict_worker("worker")
+    assert agent.get_worker("worker") is not worker